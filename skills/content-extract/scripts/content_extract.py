@@ -30,7 +30,7 @@ def main() -> int:
     parser = argparse.ArgumentParser(description="Codex content-extract wrapper")
     parser.add_argument("--url", required=True)
     parser.add_argument("--force-mineru", action="store_true")
-    parser.add_argument("--strategy", choices=["auto", "tavily_first", "mineru_first", "tavily_only", "mineru_only"], default="auto")
+    parser.add_argument("--strategy", choices=["auto", "tavily_first", "mineru_first", "tavily_only", "mineru_only", "race"], default="auto")
     parser.add_argument("--max-chars", type=int, default=20000)
     args = parser.parse_args()
 
@@ -81,6 +81,7 @@ def main() -> int:
     parser.add_argument("--book-max", type=int, default=5)
     parser.add_argument("--no-book-download", action="store_true")
     parser.add_argument("--no-artifacts", action="store_true")
+    parser.add_argument("--incremental", action="store_true")
 
     args = parser.parse_args()
     err, normalized = validate_explore_protocol(
@@ -113,6 +114,7 @@ def main() -> int:
         extract_top=max(0, int(normalized.get("extract_top", args.extract_top))),
         with_extract=not args.no_extract,
         confidence_profile=(args.confidence_profile or settings.confidence_profile).strip().lower(),
+        incremental=args.incremental,
     )
 
     if result.get("ok"):
@@ -137,6 +139,7 @@ def main() -> int:
             markdown_text += "\n\n**📁 输出目录**\n\n"
             markdown_text += "- %s\n" % artifacts.get("out_dir", "")
             markdown_text += "- book_downloaded=%s\n" % artifacts.get("book_downloaded", 0)
+            markdown_text += "- book_download_reused=%s\n" % artifacts.get("book_download_reused", 0)
             markdown_text += "- book_download_failed=%s\n" % artifacts.get("book_download_failed", 0)
         if violations:
             markdown_text += "\n\n**⚠️ 协议校验告警**\n\n"
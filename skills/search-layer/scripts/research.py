@@ -10,7 +10,8 @@ if str(SRC_DIR) not in sys.path:
     sys.path.insert(0, str(SRC_DIR))
 
 from codex_search_stack.config import load_settings
-from codex_search_stack.research import run_research_loop
+from codex_search_stack.research import iter_research_events, run_research_loop
+from codex_search_stack.research.session import is_valid_session_id
 from codex_search_stack.validators import split_domain_boost, validate_search_protocol
 
 
@@ -32,9 +33,15 @@ def main() -> int:
     parser.add_argument("--extract-max-chars", type=int, default=1600)
     parser.add_argument(
         "--extract-strategy",
-        choices=["auto", "tavily_first", "mineru_first", "tavily_only", "mineru_only"],
+        choices=["auto", "tavily_first", "mineru_first", "tavily_only", "mineru_only", "race"],
         default="auto",
     )
+    parser.add_argument("--extract-concurrency", type=int, default=None)
+    parser.add_argument("--extract-round-timeout", type=float, default=None)
+    parser.add_argument("--followup-branches", type=int, default=None)
+    parser.add_argument("--session-id", default="")
+    parser.add_argument("--deadline-ms", type=int, default=None)
+    parser.add_argument("--stream", action="store_true")
 
     args = parser.parse_args()
     domains = split_domain_boost(args.domain_boost)
@@ -54,9 +61,11 @@ def main() -> int:
         if err == "intent status/news requires freshness":
             parser.error("--intent status/news requires --freshness (pd|pw|pm|py)")
         parser.error(err)
+    if args.session_id and not is_valid_session_id(args.session_id):
+        parser.error("invalid --session-id (use letters, digits, '.', '_' or '-')")
 
     settings = load_settings()
-    payload = run_research_loop(
+    research_kwargs = dict(
         query=args.query,
         settings=settings,
         mode=args.mode,
@@ -69,7 +78,17 @@ def main() -> int:
         extract_per_round=max(0, int(args.extract_per_round)),
         extract_max_chars=max(200, int(args.extract_max_chars)),
         extract_strategy=args.extract_strategy,
+        extract_concurrency=args.extract_concurrency,
+        extract_round_timeout_seconds=args.extract_round_timeout,
+        followup_branches=args.followup_branches,
+        session_id=args.session_id,
+        deadline_ms=args.deadline_ms,
     )
+    if args.stream:
+        for event in iter_research_events(**research_kwargs):
+            print(json.dumps(event, ensure_ascii=False), flush=True)
+        return 0
+    payload = run_research_loop(**research_kwargs)
     print(json.dumps(payload, ensure_ascii=False, indent=2))
     return 0
 
@@ -1,12 +1,17 @@
 import argparse
 import json
+import sys
+from pathlib import Path
 from typing import List
 
 from .config import load_settings
+from .extract.content_store import ContentStore
+from .extract.mineru_cache import MineruCacheIndex
 from .extract.pipeline import run_extract_pipeline
-from .github_explorer import render_markdown, run_github_explorer
+from .github_explorer import render_markdown, run_github_explorer, run_github_explorer_batch
 from .observability import aggregate_decision_trace_jsonl
-from .research import run_research_loop
+from .research import iter_research_events, run_research_loop
+from .research.session import is_valid_session_id
 from .search.orchestrator import run_multi_source_search
 
 
@@ -45,9 +50,10 @@ def main() -> int:
     extract.add_argument("url")
     extract.add_argument("--force-mineru", action="store_true")
     extract.add_argument("--max-chars", type=int, default=20000)
+    extract.add_argument("--no-markdown", action="store_true", help="Only return projection + content handle")
     extract.add_argument(
         "--strategy",
-        choices=["auto", "tavily_first", "mineru_first", "tavily_only", "mineru_only"],
+        choices=["auto", "tavily_first", "mineru_first", "tavily_only", "mineru_only", "race"],
         default="auto",
     )
 
@@ -59,8 +65,27 @@ def main() -> int:
     explore.add_argument("--extract-top", type=int, default=2)
     explore.add_argument("--no-extract", action="store_true")
     explore.add_argument("--confidence-profile", choices=["deep", "quick"])
+    explore.add_argument(
+        "--incremental", action="store_true", help="Only fetch changes since the latest saved report and merge them"
+    )
     explore.add_argument("--format", choices=["markdown", "json"], default="markdown")
 
+    explore_batch = sub.add_parser("explore-batch", help="Run GitHub explorer over many repositories")
+    explore_batch.add_argument("targets", nargs="*", help="GitHub URLs or owner/repo")
+    explore_batch.add_argument("--file", default="", help="Read targets from a file, one per line ('#' comments)")
+    explore_batch.add_argument("--concurrency", type=int, default=4)
+    explore_batch.add_argument("--out-dir", default="", help="Report directory (default derived from the target list)")
+    explore_batch.add_argument("--no-resume", action="store_true", help="Re-run targets that already have a report")
+    explore_batch.add_argument(
+        "--incremental", action="store_true", help="Refresh existing reports with changes since they were written"
+    )
+    explore_batch.add_argument("--issues", type=int, default=5)
+    explore_batch.add_argument("--commits", type=int, default=5)
+    explore_batch.add_argument("--external-num", type=int, default=8)
+    explore_batch.add_argument("--extract-top", type=int, default=2)
+    explore_batch.add_argument("--no-extract", action="store_true")
+    explore_batch.add_argument("--confidence-profile", choices=["deep", "quick"])
+
     research = sub.add_parser("research", help="Run multi-round research loop")
     research.add_argument("query")
     research.add_argument("--mode", choices=["fast", "deep", "answer"], default="deep")
@@ -77,15 +102,39 @@ def main() -> int:
     research.add_argument("--extract-max-chars", type=int, default=1600)
     research.add_argument(
         "--extract-strategy",
-        choices=["auto", "tavily_first", "mineru_first", "tavily_only", "mineru_only"],
+        choices=["auto", "tavily_first", "mineru_first", "tavily_only", "mineru_only", "race"],
         default="auto",
     )
+    research.add_argument(
+        "--extract-concurrency", type=int, default=None, help="Parallel extractions per round (default from config)"
+    )
+    research.add_argument(
+        "--extract-round-timeout", type=float, default=None, help="Per-round extraction deadline in seconds"
+    )
+    research.add_argument(
+        "--followup-branches", type=int, default=None, help="Max gap follow-up queries searched per round"
+    )
+    research.add_argument("--session-id", default="", help="Checkpoint each round and resume this session")
+    research.add_argument("--deadline-ms", type=int, default=None, help="Wall-clock deadline for the whole research call")
+    research.add_argument("--stream", action="store_true", help="Emit per-round progress events as JSONL")
 
     trace_stats = sub.add_parser("trace-stats", help="Aggregate persisted DecisionTrace JSONL")
     trace_stats.add_argument("--path", default="", help="DecisionTrace JSONL path (default from config)")
     trace_stats.add_argument("--limit", type=int, default=5000, help="Scan latest N lines")
     trace_stats.add_argument("--format", choices=["json"], default="json")
 
+    cache = sub.add_parser("cache", help="Manage MinerU and extracted-content caches")
+    cache_sub = cache.add_subparsers(dest="cache_command", required=True)
+    cache_prune = cache_sub.add_parser("prune", help="Evict expired / least-recently-used cache entries")
+    cache_prune.add_argument("--max-mb", type=int, default=None, help="Size cap in MB (default from config)")
+    cache_prune.add_argument("--max-age-days", type=int, default=None, help="Evict entries idle longer than N days")
+    cache_prune.add_argument("--dry-run", action="store_true")
+    cache_sub.add_parser("stats", help="Show cache index size and entry count")
+    cache_content = cache_sub.add_parser("content", help="Read full extracted text by content handle")
+    cache_content.add_argument("handle")
+    cache_content.add_argument("--chunk", type=int, default=None, help="Only print chunk N of the projection")
+    cache_content.add_argument("--chunk-tokens", type=int, default=512)
+
     args = parser.parse_args()
     settings = load_settings()
 
@@ -116,6 +165,7 @@ def main() -> int:
             force_mineru=args.force_mineru,
             max_chars=args.max_chars,
             strategy=args.strategy,
+            include_markdown=not args.no_markdown,
         )
         print(json.dumps(result.to_dict(), ensure_ascii=False, indent=2))
         return 0
@@ -130,6 +180,7 @@ def main() -> int:
             extract_top=max(args.extract_top, 0),
             with_extract=not args.no_extract,
             confidence_profile=(args.confidence_profile or settings.confidence_profile),
+            incremental=args.incremental,
         )
         if args.format == "json":
             print(json.dumps(result, ensure_ascii=False, indent=2))
@@ -137,8 +188,39 @@ def main() -> int:
             print(render_markdown(result))
         return 0
 
+    if args.command == "explore-batch":
+        targets = list(args.targets)
+        if args.file:
+            targets.extend(Path(args.file).expanduser().read_text(encoding="utf-8").splitlines())
+        if not targets:
+            parser.error("explore-batch needs targets or --file")
+
+        def _progress(row: dict) -> None:
+            # 每个仓库结束即输出一行进度（stderr），stdout 只留最终汇总 JSON。
+            print(json.dumps(row, ensure_ascii=False), file=sys.stderr, flush=True)
+
+        result = run_github_explorer_batch(
+            targets=targets,
+            settings=settings,
+            concurrency=max(args.concurrency, 1),
+            out_dir=args.out_dir,
+            resume=not args.no_resume,
+            incremental=args.incremental,
+            on_result=_progress,
+            issues_limit=max(args.issues, 1),
+            commits_limit=max(args.commits, 1),
+            external_limit=max(args.external_num, 1),
+            extract_top=max(args.extract_top, 0),
+            with_extract=not args.no_extract,
+            confidence_profile=(args.confidence_profile or settings.confidence_profile),
+        )
+        print(json.dumps(result, ensure_ascii=False, indent=2))
+        return 0 if result.get("ok") else 1
+
     if args.command == "research":
-        result = run_research_loop(
+        if args.session_id and not is_valid_session_id(args.session_id):
+            parser.error("invalid --session-id (use letters, digits, '.', '_' or '-')")
+        research_kwargs = dict(
             query=args.query,
             settings=settings,
             mode=args.mode,
@@ -151,7 +233,67 @@ def main() -> int:
             extract_per_round=max(0, int(args.extract_per_round)),
             extract_max_chars=max(200, int(args.extract_max_chars)),
             extract_strategy=args.extract_strategy,
+            extract_concurrency=args.extract_concurrency,
+            extract_round_timeout_seconds=args.extract_round_timeout,
+            followup_branches=args.followup_branches,
+            session_id=args.session_id,
+            deadline_ms=args.deadline_ms,
         )
+        if args.stream:
+            # JSONL：每轮的进度事件即时输出，最后一行为 {"event": "result", "payload": ...}。
+            for event in iter_research_events(**research_kwargs):
+                print(json.dumps(event, ensure_ascii=False), flush=True)
+            return 0
+        result = run_research_loop(**research_kwargs)
+        print(json.dumps(result, ensure_ascii=False, indent=2))
+        return 0
+
+    if args.command == "cache" and args.cache_command == "content":
+        store = ContentStore.for_workspace(settings.mineru_workspace)
+        try:
+            text = None
+            if store is not None and args.chunk is None:
+                text = store.get(args.handle)
+            elif store is not None:
+                for chunk, chunk_text in store.iter_chunks(args.handle, max_tokens=args.chunk_tokens):
+                    if chunk.index == args.chunk:
+                        text = chunk_text
+                        break
+        except ValueError as exc:
+            print(json.dumps({"ok": False, "error": str(exc)}, ensure_ascii=False, indent=2))
+            return 1
+        if text is None:
+            print(json.dumps({"ok": False, "error": "content not found"}, ensure_ascii=False, indent=2))
+            return 1
+        print(text)
+        return 0
+
+    if args.command == "cache":
+        index = MineruCacheIndex.for_workspace(settings.mineru_workspace)
+        if index is None:
+            print(json.dumps({"ok": False, "error": "mineru workspace not configured"}, ensure_ascii=False, indent=2))
+            return 1
+        store = ContentStore.for_workspace(settings.mineru_workspace)
+        if args.cache_command == "stats":
+            index.sync()
+            result = index.stats()
+            if store is not None:
+                result["content_cache"] = store.stats()
+        else:
+            max_mb = settings.mineru_cache_max_mb if args.max_mb is None else args.max_mb
+            max_age_days = settings.mineru_cache_max_age_days if args.max_age_days is None else args.max_age_days
+            result = index.prune(
+                max_bytes=max(0, int(max_mb)) * 1024 * 1024,
+                max_age_seconds=max(0, int(max_age_days)) * 86400,
+                dry_run=args.dry_run,
+            )
+            if store is not None:
+                # 内容缓存有自己的上限（extract.content_cache.*），与 MinerU 缓存一起清理。
+                result["content_cache"] = store.prune(
+                    max_bytes=max(0, int(settings.content_cache_max_mb)) * 1024 * 1024,
+                    max_age_seconds=max(0, int(settings.content_cache_max_age_days)) * 86400,
+                    dry_run=args.dry_run,
+                )
         print(json.dumps(result, ensure_ascii=False, indent=2))
         return 0
 
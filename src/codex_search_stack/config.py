@@ -47,6 +47,13 @@ class Settings:
     decision_trace_enabled: bool = True
     decision_trace_persist: bool = True
     decision_trace_jsonl_path: str = "./.runtime/decision-trace/decision_trace.jsonl"
+    mineru_cache_max_mb: int = 2048
+    mineru_cache_max_age_days: int = 30
+    content_cache_max_mb: int = 512
+    content_cache_max_age_days: int = 30
+    research_session_dir: str = "./.runtime/research-sessions"
+    github_cache_dir: str = "./.runtime/github-cache"
+    explore_cache_dir: str = "./.runtime/explore-cache"
 
 
 def resolve_config_path(project_root: Optional[Path] = None) -> Path:
@@ -138,6 +145,9 @@ def load_settings() -> Settings:
     default_mineru_token_file = str((project_root.parent / "mineru_key.txt").resolve())
     default_mineru_workspace = str((project_root / ".runtime" / "codex-workspace").resolve())
     default_key_pool_file = str((project_root.parent.parent / "key-pool" / "pool.csv").resolve())
+    default_research_session_dir = str((project_root / ".runtime" / "research-sessions").resolve())
+    default_github_cache_dir = str((project_root / ".runtime" / "github-cache").resolve())
+    default_explore_cache_dir = str((project_root / ".runtime" / "explore-cache").resolve())
     default_decision_trace_path = str((project_root / ".runtime" / "decision-trace" / "decision_trace.jsonl").resolve())
 
     mineru_token_file = _pick(
@@ -223,4 +233,35 @@ def load_settings() -> Settings:
             env("DECISION_TRACE_PATH"),
             default_decision_trace_path,
         ),
+        mineru_cache_max_mb=_to_int(
+            _pick(_cfg_get(config, "extract", "mineru", "cache", "max_mb"), env("MINERU_CACHE_MAX_MB")),
+            2048,
+        ),
+        mineru_cache_max_age_days=_to_int(
+            _pick(_cfg_get(config, "extract", "mineru", "cache", "max_age_days"), env("MINERU_CACHE_MAX_AGE_DAYS")),
+            30,
+        ),
+        content_cache_max_mb=_to_int(
+            _pick(_cfg_get(config, "extract", "content_cache", "max_mb"), env("CONTENT_CACHE_MAX_MB")),
+            512,
+        ),
+        content_cache_max_age_days=_to_int(
+            _pick(_cfg_get(config, "extract", "content_cache", "max_age_days"), env("CONTENT_CACHE_MAX_AGE_DAYS")),
+            30,
+        ),
+        research_session_dir=_pick(
+            _cfg_get(config, "runtime", "research_session_dir"),
+            env("RESEARCH_SESSION_DIR"),
+            default_research_session_dir,
+        ),
+        github_cache_dir=_pick(
+            _cfg_get(config, "explore", "github_cache_dir"),
+            env("GITHUB_CACHE_DIR"),
+            default_github_cache_dir,
+        ),
+        explore_cache_dir=_pick(
+            _cfg_get(config, "explore", "cache_dir"),
+            env("EXPLORE_CACHE_DIR"),
+            default_explore_cache_dir,
+        ),
     )
@@ -68,6 +68,26 @@ class ExtractionArtifacts:
     zip_path: Optional[str] = None
     task_id: Optional[str] = None
     cache_key: Optional[str] = None
+    content_handle: Optional[str] = None
+
+
+@dataclass
+class ExtractionChunk:
+    index: int
+    start: int
+    end: int
+    tokens: int
+    heading: str = ""
+
+
+@dataclass
+class ExtractionProjection:
+    head: str = ""
+    summary: str = ""
+    total_chars: int = 0
+    total_tokens: int = 0
+    chunks: List[ExtractionChunk] = field(default_factory=list)
+    chunks_truncated: bool = False
 
 
 @dataclass
@@ -80,6 +100,7 @@ class ExtractionResponse:
     sources: List[str] = field(default_factory=list)
     notes: List[str] = field(default_factory=list)
     decision_trace: Optional["DecisionTrace"] = None
+    projection: Optional[ExtractionProjection] = None
 
     def to_dict(self) -> Dict:
         data = asdict(self)
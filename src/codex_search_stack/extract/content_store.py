@@ -0,0 +1,186 @@
+import hashlib
+import json
+import os
+import re
+import threading
+import time
+from pathlib import Path
+from typing import Any, Dict, Iterator, List, Optional, Tuple
+
+from ..contracts import ExtractionChunk
+from ..search.scoring import normalize_url
+from .projection import DEFAULT_CHUNK_TOKENS, iter_markdown_chunks
+
+_HANDLE_RE = re.compile(r"^[0-9a-f]{24}$")
+# 写入后的自动淘汰需要扫描整个目录，同一进程内对同一 root 最多每隔这么久做一次。
+_ENFORCE_INTERVAL_SECONDS = 60.0
+_ENFORCE_LOCK = threading.Lock()
+_LAST_ENFORCED: Dict[str, float] = {}
+
+
+def content_cache_root(workspace: Optional[str]) -> Optional[Path]:
+    if not workspace:
+        return None
+    return Path(workspace).expanduser() / "content-cache"
+
+
+def content_handle(url: str) -> str:
+    return hashlib.sha256(normalize_url(url).encode("utf-8")).hexdigest()[:24]
+
+
+class ContentStore:
+    """按 canonical URL 存放完整提取正文；调用方只持有 handle，需要时再按块流式读取。
+
+    正文文件的 mtime 作为最近访问时间（读取时刷新），prune 按闲置时间与体积上限做 LRU 淘汰。
+    """
+
+    def __init__(self, root: Path) -> None:
+        self.root = Path(root)
+
+    @classmethod
+    def for_workspace(cls, workspace: Optional[str]) -> Optional["ContentStore"]:
+        root = content_cache_root(workspace)
+        if root is None:
+            return None
+        return cls(root)
+
+    def _paths(self, handle: str) -> Tuple[Path, Path]:
+        if not _HANDLE_RE.match(handle or ""):
+            raise ValueError("invalid content handle: %r" % handle)
+        base = self.root / handle[:2]
+        return base / ("%s.md" % handle), base / ("%s.json" % handle)
+
+    def put(self, url: str, text: str, engine: str = "") -> str:
+        handle = content_handle(url)
+        text_path, meta_path = self._paths(handle)
+        text_path.parent.mkdir(parents=True, exist_ok=True)
+        # 抽取在线程池里并发，同一 URL 可能被两个线程同时写，临时名带上线程 id 避免互相覆盖。
+        suffix = ".%s.%s.tmp" % (os.getpid(), threading.get_ident())
+        meta = {
+            "url": url,
+            "engine": engine,
+            "chars": len(text),
+            "stored_at": int(time.time()),
+        }
+        for path, payload in ((text_path, text), (meta_path, json.dumps(meta, ensure_ascii=False))):
+            tmp = path.with_name(path.name + suffix)
+            with tmp.open("w", encoding="utf-8", newline="") as fp:
+                fp.write(payload)
+            os.replace(str(tmp), str(path))
+        return handle
+
+    def has(self, url: str) -> bool:
+        text_path, _ = self._paths(content_handle(url))
+        return text_path.exists()
+
+    def meta(self, handle: str) -> Optional[Dict[str, Any]]:
+        _, meta_path = self._paths(handle)
+        try:
+            return json.loads(meta_path.read_text(encoding="utf-8"))
+        except Exception:
+            return None
+
+    def _touch(self, path: Path) -> None:
+        try:
+            os.utime(str(path), None)
+        except OSError:
+            pass
+
+    def get(self, handle: str, max_chars: int = 0) -> Optional[str]:
+        text_path, _ = self._paths(handle)
+        if not text_path.exists():
+            return None
+        self._touch(text_path)
+        with text_path.open("r", encoding="utf-8", errors="replace") as fp:
+            return fp.read(max_chars) if max_chars > 0 else fp.read()
+
+    def iter_chunks(self, handle: str, max_tokens: int = DEFAULT_CHUNK_TOKENS) -> Iterator[Tuple[ExtractionChunk, str]]:
+        text_path, _ = self._paths(handle)
+        if not text_path.exists():
+            return
+        self._touch(text_path)
+        # newline="" 保留原始换行，chunk 偏移与 put 进来的文本一致。
+        with text_path.open("r", encoding="utf-8", errors="replace", newline="") as fp:
+            for item in iter_markdown_chunks(fp, max_tokens=max_tokens):
+                yield item
+
+    def _entries(self) -> List[Dict[str, Any]]:
+        entries: List[Dict[str, Any]] = []
+        try:
+            text_paths = list(self.root.glob("*/*.md"))
+        except OSError:
+            return entries
+        for text_path in text_paths:
+            if not _HANDLE_RE.match(text_path.stem):
+                continue
+            meta_path = text_path.with_suffix(".json")
+            try:
+                stat = text_path.stat()
+            except OSError:
+                continue
+            size = stat.st_size
+            try:
+                size += meta_path.stat().st_size
+            except OSError:
+                pass
+            entries.append({"handle": text_path.stem, "size_bytes": size, "last_access": stat.st_mtime})
+        entries.sort(key=lambda item: item["last_access"])
+        return entries
+
+    def stats(self) -> Dict[str, Any]:
+        entries = self._entries()
+        return {
+            "root": str(self.root),
+            "entries": len(entries),
+            "total_bytes": sum(item["size_bytes"] for item in entries),
+            "oldest_access": int(entries[0]["last_access"]) if entries else 0,
+            "newest_access": int(entries[-1]["last_access"]) if entries else 0,
+        }
+
+    def prune(self, max_bytes: int = 0, max_age_seconds: int = 0, dry_run: bool = False) -> Dict[str, Any]:
+        """先淘汰闲置超过 max_age_seconds 的条目，再按最近访问时间从旧到新删到总量不超过 max_bytes。"""
+        entries = self._entries()
+        evicted: List[Dict[str, Any]] = []
+        if max_age_seconds > 0:
+            cutoff = time.time() - max_age_seconds
+            evicted = [item for item in entries if item["last_access"] < cutoff]
+            entries = [item for item in entries if item["last_access"] >= cutoff]
+        total = sum(item["size_bytes"] for item in entries)
+        if max_bytes > 0:
+            for item in list(entries):
+                if total <= max_bytes:
+                    break
+                evicted.append(item)
+                entries.remove(item)
+                total -= item["size_bytes"]
+        if not dry_run:
+            for item in evicted:
+                text_path, meta_path = self._paths(item["handle"])
+                for path in (text_path, meta_path):
+                    try:
+                        path.unlink()
+                    except OSError:
+                        pass
+        return {
+            "root": str(self.root),
+            "entries": len(entries),
+            "total_bytes": total,
+            "evicted": len(evicted),
+            "freed_bytes": sum(item["size_bytes"] for item in evicted),
+            "dry_run": dry_run,
+            "max_bytes": max_bytes,
+            "max_age_seconds": max_age_seconds,
+        }
+
+    def enforce(self, max_bytes: int, max_age_seconds: int) -> Optional[Dict[str, Any]]:
+        """写入后调用：节流后执行一次 prune；未到间隔或未设上限时返回 None。"""
+        if max_bytes <= 0 and max_age_seconds <= 0:
+            return None
+        key = str(self.root)
+        now = time.monotonic()
+        with _ENFORCE_LOCK:
+            last = _LAST_ENFORCED.get(key)
+            if last is not None and now - last < _ENFORCE_INTERVAL_SECONDS:
+                return None
+            _LAST_ENFORCED[key] = now
+        return self.prune(max_bytes=max_bytes, max_age_seconds=max_age_seconds)
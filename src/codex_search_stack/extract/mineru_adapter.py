@@ -3,15 +3,70 @@ import os
 import subprocess
 import sys
 from pathlib import Path
-from typing import Optional
+from typing import Dict, Optional
 
 from ..contracts import ExtractionArtifacts, ExtractionResponse
+from .mineru_cache import MineruCacheIndex, cache_options
 
 
 def _default_mineru_wrapper(project_root: Path) -> Path:
     return project_root / "skills" / "mineru-extract" / "scripts" / "mineru_parse_documents.py"
 
 
+def _truncate_markdown(text: str, max_chars: int) -> str:
+    # 与 wrapper 的 --max-chars 截断格式保持一致。
+    if max_chars and len(text) > max_chars:
+        return text[:max_chars] + "\n\n[TRUNCATED]"
+    return text
+
+
+def _response_from_cache(url: str, entry: Dict, max_chars: int) -> Optional[ExtractionResponse]:
+    markdown_path = entry.get("markdown_path") or ""
+    try:
+        text = Path(markdown_path).read_text(encoding="utf-8", errors="replace")
+    except Exception:
+        return None
+    return ExtractionResponse(
+        ok=True,
+        source_url=url,
+        engine="mineru",
+        markdown=_truncate_markdown(text, max_chars),
+        artifacts=ExtractionArtifacts(
+            out_dir=entry.get("out_dir") or None,
+            markdown_path=markdown_path,
+            zip_path=entry.get("zip_path") or None,
+            task_id=entry.get("task_id") or None,
+            cache_key=entry.get("cache_key") or None,
+        ),
+        sources=[url, markdown_path],
+        notes=["fallback:mineru_parse_documents", "mineru_cache_index_hit:%s" % entry.get("cache_key", "")],
+    )
+
+
+def _record_and_enforce(
+    index: MineruCacheIndex,
+    url: str,
+    options: str,
+    item: Dict,
+    max_bytes: int,
+    max_age_seconds: int,
+) -> None:
+    try:
+        recorded = index.record(
+            url=url,
+            options=options,
+            cache_key=str(item.get("cache_key") or ""),
+            out_dir=str(item.get("out_dir") or ""),
+            markdown_path=str(item.get("markdown_path") or ""),
+            task_id=str(item.get("task_id") or ""),
+            zip_path=str(item.get("zip_path") or ""),
+        )
+        if recorded and max_bytes > 0 and index.stats().get("total_bytes", 0) > max_bytes:
+            index.prune(max_bytes=max_bytes, max_age_seconds=max_age_seconds, sync=False)
+    except Exception:  # pragma: no cover - cache bookkeeping must never fail an extraction
+        return
+
+
 def run_mineru_wrapper(
     url: str,
     wrapper_path: Optional[str],
@@ -21,9 +76,23 @@ def run_mineru_wrapper(
     max_chars: int = 20000,
     language: str = "ch",
     model_version: str = "MinerU-HTML",
+    cache_max_bytes: int = 0,
+    cache_max_age_seconds: int = 0,
 ) -> ExtractionResponse:
     project_root = Path(__file__).resolve().parents[3]
     target = Path(wrapper_path) if wrapper_path else _default_mineru_wrapper(project_root)
+    index = MineruCacheIndex.for_workspace(workspace)
+    options = cache_options(model_version, language)
+
+    if index is not None:
+        try:
+            hit = index.lookup(url, options)
+        except Exception:
+            hit = None
+        if hit:
+            cached = _response_from_cache(url, hit, max_chars)
+            if cached is not None:
+                return cached
 
     if not target.exists():
         return ExtractionResponse(
@@ -84,6 +153,8 @@ def run_mineru_wrapper(
         )
 
     first = items[0]
+    if index is not None and first.get("cache_key"):
+        _record_and_enforce(index, url, options, first, cache_max_bytes, cache_max_age_seconds)
     sources = [url]
     if first.get("full_zip_url"):
         sources.append(first["full_zip_url"])
@@ -0,0 +1,304 @@
+import json
+import shutil
+import sqlite3
+import time
+from pathlib import Path
+from typing import Any, Dict, Iterable, List, Optional
+
+from ..search.scoring import normalize_url
+
+_INDEX_FILE = "index.sqlite3"
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS entries (
+    cache_key TEXT PRIMARY KEY,
+    canonical_url TEXT NOT NULL,
+    options TEXT NOT NULL,
+    out_dir TEXT NOT NULL,
+    markdown_path TEXT NOT NULL DEFAULT '',
+    task_id TEXT NOT NULL DEFAULT '',
+    zip_path TEXT NOT NULL DEFAULT '',
+    size_bytes INTEGER NOT NULL DEFAULT 0,
+    created_at REAL NOT NULL,
+    last_access REAL NOT NULL,
+    hits INTEGER NOT NULL DEFAULT 0
+);
+CREATE INDEX IF NOT EXISTS idx_entries_lookup ON entries (canonical_url, options);
+CREATE INDEX IF NOT EXISTS idx_entries_access ON entries (last_access);
+"""
+
+
+def mineru_cache_root(workspace: Optional[str]) -> Optional[Path]:
+    if not workspace:
+        return None
+    return Path(workspace).expanduser() / "mineru-cache"
+
+
+def cache_options(model_version: str, language: str, is_ocr: bool = False) -> str:
+    # 与 mineru_parse_documents.py 的任务 payload 字段保持一致（url 之外的部分）。
+    return json.dumps(
+        {"is_ocr": bool(is_ocr), "language": language or "", "model_version": model_version or ""},
+        sort_keys=True,
+    )
+
+
+def _dir_size(path: Path) -> int:
+    total = 0
+    try:
+        for item in path.rglob("*"):
+            try:
+                if item.is_file():
+                    total += item.stat().st_size
+            except OSError:
+                continue
+    except OSError:
+        return 0
+    return total
+
+
+class MineruCacheIndex:
+    """SQLite 索引：canonical URL + 选项 -> MinerU 缓存目录，附带体积统计与 LRU/过期淘汰。"""
+
+    def __init__(self, root: Path) -> None:
+        self.root = Path(root)
+        self.path = self.root / _INDEX_FILE
+
+    @classmethod
+    def for_workspace(cls, workspace: Optional[str]) -> Optional["MineruCacheIndex"]:
+        root = mineru_cache_root(workspace)
+        if root is None:
+            return None
+        return cls(root)
+
+    def exists(self) -> bool:
+        return self.path.exists()
+
+    def _connect(self) -> sqlite3.Connection:
+        self.root.mkdir(parents=True, exist_ok=True)
+        conn = sqlite3.connect(str(self.path), timeout=10)
+        conn.row_factory = sqlite3.Row
+        conn.executescript(_SCHEMA)
+        return conn
+
+    def _is_managed(self, out_dir: str) -> bool:
+        # 只管理 cache root 下的一级目录，避免误删 wrapper 返回的任意路径。
+        if not out_dir:
+            return False
+        try:
+            return Path(out_dir).expanduser().resolve().parent == self.root.expanduser().resolve()
+        except OSError:
+            return False
+
+    def lookup(self, url: str, options: str) -> Optional[Dict[str, Any]]:
+        if not self.exists():
+            return None
+        canonical = normalize_url(url)
+        conn = self._connect()
+        try:
+            rows = conn.execute(
+                "SELECT * FROM entries WHERE canonical_url = ? AND options = ? ORDER BY last_access DESC",
+                (canonical, options),
+            ).fetchall()
+            for row in rows:
+                markdown_path = row["markdown_path"] or ""
+                if markdown_path and Path(markdown_path).exists():
+                    with conn:
+                        conn.execute(
+                            "UPDATE entries SET last_access = ?, hits = hits + 1 WHERE cache_key = ?",
+                            (time.time(), row["cache_key"]),
+                        )
+                    return dict(row)
+            return None
+        finally:
+            conn.close()
+
+    def record(
+        self,
+        url: str,
+        options: str,
+        cache_key: str,
+        out_dir: str,
+        markdown_path: str = "",
+        task_id: str = "",
+        zip_path: str = "",
+    ) -> bool:
+        if not cache_key or not self._is_managed(out_dir):
+            return False
+        now = time.time()
+        size = _dir_size(Path(out_dir))
+        conn = self._connect()
+        try:
+            with conn:
+                conn.execute(
+                    """
+                    INSERT INTO entries (
+                        cache_key, canonical_url, options, out_dir, markdown_path,
+                        task_id, zip_path, size_bytes, created_at, last_access, hits
+                    ) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, 0)
+                    ON CONFLICT(cache_key) DO UPDATE SET
+                        canonical_url = excluded.canonical_url,
+                        options = excluded.options,
+                        out_dir = excluded.out_dir,
+                        markdown_path = excluded.markdown_path,
+                        task_id = excluded.task_id,
+                        zip_path = excluded.zip_path,
+                        size_bytes = excluded.size_bytes,
+                        last_access = excluded.last_access
+                    """,
+                    (
+                        cache_key,
+                        normalize_url(url),
+                        options,
+                        str(out_dir),
+                        markdown_path or "",
+                        task_id or "",
+                        zip_path or "",
+                        size,
+                        now,
+                        now,
+                    ),
+                )
+        finally:
+            conn.close()
+        return True
+
+    def sync(self) -> int:
+        """把尚未入索引的旧缓存目录（只有 meta.json）补录进索引。"""
+        if not self.root.exists():
+            return 0
+        conn = self._connect()
+        added = 0
+        try:
+            known = {row["cache_key"] for row in conn.execute("SELECT cache_key FROM entries")}
+            for meta_path in sorted(self.root.glob("*/meta.json")):
+                key = meta_path.parent.name
+                if key in known:
+                    continue
+                try:
+                    meta = json.loads(meta_path.read_text(encoding="utf-8"))
+                except Exception:
+                    continue
+                source = str(meta.get("source") or "")
+                if not source:
+                    continue
+                stamp = float(meta.get("fetched_at") or meta_path.stat().st_mtime)
+                with conn:
+                    conn.execute(
+                        """
+                        INSERT OR IGNORE INTO entries (
+                            cache_key, canonical_url, options, out_dir, markdown_path,
+                            task_id, zip_path, size_bytes, created_at, last_access, hits
+                        ) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, 0)
+                        """,
+                        (
+                            key,
+                            normalize_url(source),
+                            cache_options(
+                                str(meta.get("model_version") or ""),
+                                str(meta.get("language") or ""),
+                                bool(meta.get("enable_ocr")),
+                            ),
+                            str(meta_path.parent),
+                            str(meta.get("markdown_path") or ""),
+                            str(meta.get("task_id") or ""),
+                            str(meta.get("zip_path") or ""),
+                            _dir_size(meta_path.parent),
+                            stamp,
+                            stamp,
+                        ),
+                    )
+                added += 1
+        finally:
+            conn.close()
+        return added
+
+    def stats(self) -> Dict[str, Any]:
+        if not self.exists():
+            return {"index_path": str(self.path), "entries": 0, "total_bytes": 0, "oldest_access": 0, "newest_access": 0}
+        conn = self._connect()
+        try:
+            row = conn.execute(
+                "SELECT COUNT(*) AS n, COALESCE(SUM(size_bytes), 0) AS total, "
+                "COALESCE(MIN(last_access), 0) AS oldest, COALESCE(MAX(last_access), 0) AS newest FROM entries"
+            ).fetchone()
+        finally:
+            conn.close()
+        return {
+            "index_path": str(self.path),
+            "entries": int(row["n"]),
+            "total_bytes": int(row["total"]),
+            "oldest_access": int(row["oldest"]),
+            "newest_access": int(row["newest"]),
+        }
+
+    def _evict(self, conn: sqlite3.Connection, rows: Iterable[sqlite3.Row], dry_run: bool) -> List[str]:
+        evicted: List[str] = []
+        for row in rows:
+            if not dry_run:
+                out_dir = row["out_dir"] or ""
+                if self._is_managed(out_dir):
+                    shutil.rmtree(out_dir, ignore_errors=True)
+                with conn:
+                    conn.execute("DELETE FROM entries WHERE cache_key = ?", (row["cache_key"],))
+            evicted.append(row["cache_key"])
+        return evicted
+
+    def prune(
+        self,
+        max_bytes: int = 0,
+        max_age_seconds: int = 0,
+        dry_run: bool = False,
+        sync: bool = True,
+    ) -> Dict[str, Any]:
+        synced = self.sync() if sync else 0
+        if not self.exists():
+            return {"synced": synced, "evicted": 0, "freed_bytes": 0, "dry_run": dry_run, **self.stats()}
+
+        now = time.time()
+        conn = self._connect()
+        evicted: List[str] = []
+        freed = 0
+        try:
+            rows = conn.execute("SELECT * FROM entries ORDER BY last_access ASC").fetchall()
+            missing = [row for row in rows if not Path(row["out_dir"] or "").exists()]
+            self._evict(conn, missing, dry_run)
+            missing_keys = {row["cache_key"] for row in missing}
+            live = [row for row in rows if row["cache_key"] not in missing_keys]
+
+            expired = []
+            if max_age_seconds > 0:
+                cutoff = now - max_age_seconds
+                expired = [row for row in live if float(row["last_access"]) < cutoff]
+            evicted.extend(self._evict(conn, expired, dry_run))
+            freed += sum(int(row["size_bytes"]) for row in expired)
+
+            expired_keys = {row["cache_key"] for row in expired}
+            live = [row for row in live if row["cache_key"] not in expired_keys]
+            total = sum(int(row["size_bytes"]) for row in live)
+            overflow = []
+            if max_bytes > 0:
+                for row in live:
+                    if total <= max_bytes:
+                        break
+                    overflow.append(row)
+                    total -= int(row["size_bytes"])
+            evicted.extend(self._evict(conn, overflow, dry_run))
+            freed += sum(int(row["size_bytes"]) for row in overflow)
+        finally:
+            conn.close()
+
+        out = self.stats()
+        if dry_run:
+            out["total_bytes"] = max(0, out["total_bytes"] - freed)
+            out["entries"] = max(0, out["entries"] - len(evicted))
+        out.update(
+            {
+                "synced": synced,
+                "evicted": len(evicted),
+                "evicted_keys": evicted,
+                "freed_bytes": freed,
+                "dry_run": dry_run,
+                "max_bytes": max_bytes,
+                "max_age_seconds": max_age_seconds,
+            }
+        )
+        return out
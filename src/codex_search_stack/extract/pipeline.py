@@ -1,4 +1,7 @@
-from typing import Dict, List, Optional
+from pathlib import Path
+from queue import Queue
+from typing import Dict, List, Optional, Tuple
+import threading
 import time
 
 import requests
@@ -8,7 +11,15 @@ from ..contracts import DecisionTrace, ExtractRequest, ExtractionArtifacts, Extr
 from ..key_pool import build_service_candidates, mask_key
 from ..observability import collect_extract_source_hits, persist_decision_trace_jsonl
 from ..policy import build_extract_plan
+from .content_store import ContentStore
 from .mineru_adapter import run_mineru_wrapper
+from .projection import (
+    DEFAULT_CHUNK_TOKENS,
+    DEFAULT_HEAD_CHARS,
+    DEFAULT_MAX_CHUNKS,
+    DEFAULT_SUMMARY_CHARS,
+    build_projection,
+)
 
 def _is_content_usable(markdown: Optional[str]) -> bool:
     if not markdown:
@@ -30,6 +41,63 @@ def _is_content_usable(markdown: Optional[str]) -> bool:
     return not any(s in head for s in bad_signals)
 
 
+def _projection_policy(settings: Settings) -> Dict[str, int]:
+    policy = getattr(settings, "policy", {}) or {}
+    raw = ((policy.get("extract") or {}).get("projection")) or {}
+    defaults = {
+        "head_chars": DEFAULT_HEAD_CHARS,
+        "summary_chars": DEFAULT_SUMMARY_CHARS,
+        "chunk_tokens": DEFAULT_CHUNK_TOKENS,
+        "max_chunks": DEFAULT_MAX_CHUNKS,
+    }
+    out: Dict[str, int] = {}
+    for key, default in defaults.items():
+        try:
+            out[key] = max(0, int(raw.get(key, default)))
+        except Exception:
+            out[key] = default
+    return out
+
+
+def _project_response(
+    response: ExtractionResponse,
+    url: str,
+    settings: Settings,
+    max_chars: int,
+    include_markdown: bool,
+) -> List[str]:
+    """完整正文进内容缓存，响应里只保留投影 + 截断到 max_chars 的 markdown。"""
+    notes: List[str] = []
+    full = response.markdown or ""
+    markdown_path = response.artifacts.markdown_path if response.artifacts else None
+    if response.ok and markdown_path and full.endswith("[TRUNCATED]"):
+        # MinerU 返回的是截断后的 markdown，完整正文以落盘文件为准。
+        try:
+            full = Path(markdown_path).read_text(encoding="utf-8", errors="replace")
+        except Exception:
+            pass
+    if response.ok and full:
+        store = ContentStore.for_workspace(getattr(settings, "mineru_workspace", None))
+        if store is not None:
+            try:
+                response.artifacts.content_handle = store.put(url, full, engine=response.engine)
+                store.enforce(
+                    max_bytes=max(0, int(getattr(settings, "content_cache_max_mb", 0) or 0)) * 1024 * 1024,
+                    max_age_seconds=max(0, int(getattr(settings, "content_cache_max_age_days", 0) or 0)) * 86400,
+                )
+            except Exception as exc:
+                notes.append("content_store_failed:%s" % exc)
+        response.projection = build_projection(full, **_projection_policy(settings))
+    current = response.markdown or ""
+    if not include_markdown:
+        response.markdown = None
+    elif max_chars and len(current) > max_chars and not current.endswith("[TRUNCATED]"):
+        # 与 MinerU wrapper 的 --max-chars 截断格式一致。
+        response.markdown = current[:max_chars] + "\n\n[TRUNCATED]"
+        notes.append("markdown_truncated:%s" % len(current))
+    return notes
+
+
 def _extract_via_tavily_once(url: str, api_url: str, api_key: str, timeout: int) -> ExtractionResponse:
     endpoint = api_url.rstrip("/") + "/extract"
     payload: Dict = {
@@ -87,6 +155,7 @@ def run_extract_pipeline(
     force_mineru: bool = False,
     max_chars: int = 20000,
     strategy: str = "auto",
+    include_markdown: bool = True,
 ) -> ExtractionResponse:
     started_at = time.perf_counter()
     request = ExtractRequest(
@@ -111,7 +180,7 @@ def run_extract_pipeline(
     notes: List[str] = []
     notes.extend(plan.notes)
 
-    def run_tavily_route() -> ExtractionResponse:
+    def run_tavily_route(announce: bool = True) -> ExtractionResponse:
         candidates = build_service_candidates(
             service="tavily",
             primary_url=settings.tavily_api_url,
@@ -119,15 +188,16 @@ def run_extract_pipeline(
             pool_file=settings.key_pool_file,
             pool_enabled=settings.key_pool_enabled,
         )
-        trace.add_event(
-            stage="extract.execute",
-            decision="try_tavily",
-            reason="tavily extract route selected",
-            metadata={
-                "candidate_count": str(len(candidates)),
-                "timeout": str(plan.tavily_timeout),
-            },
-        )
+        if announce:
+            trace.add_event(
+                stage="extract.execute",
+                decision="try_tavily",
+                reason="tavily extract route selected",
+                metadata={
+                    "candidate_count": str(len(candidates)),
+                    "timeout": str(plan.tavily_timeout),
+                },
+            )
 
         if not candidates:
             return ExtractionResponse(
@@ -168,13 +238,14 @@ def run_extract_pipeline(
                 break
         return primary
 
-    def run_mineru_route() -> ExtractionResponse:
-        trace.add_event(
-            stage="extract.execute",
-            decision="try_mineru",
-            reason="mineru route selected",
-            metadata={"max_chars": str(max_chars)},
-        )
+    def run_mineru_route(announce: bool = True) -> ExtractionResponse:
+        if announce:
+            trace.add_event(
+                stage="extract.execute",
+                decision="try_mineru",
+                reason="mineru route selected",
+                metadata={"max_chars": str(max_chars)},
+            )
         return run_mineru_wrapper(
             url=url,
             wrapper_path=settings.mineru_wrapper_path,
@@ -184,10 +255,36 @@ def run_extract_pipeline(
             max_chars=max_chars,
             language="ch",
             model_version="MinerU-HTML",
+            cache_max_bytes=max(0, int(settings.mineru_cache_max_mb)) * 1024 * 1024,
+            cache_max_age_seconds=max(0, int(settings.mineru_cache_max_age_days)) * 86400,
         )
 
+    def record_engine(engine: str, response: ExtractionResponse, latency_ms: int) -> None:
+        # 每个引擎一条结果事件，供 observability.extract_host_stats 学习按 host 路由。
+        failure = ""
+        if not response.ok:
+            failure = next((note for note in (response.notes or []) if not note.startswith("tavily_candidate")), "")
+        trace.add_event(
+            stage="extract.execute",
+            decision="engine_finished",
+            reason="engine attempt completed",
+            metadata={
+                "engine": engine,
+                "ok": str(bool(response.ok)).lower(),
+                "latency_ms": str(max(0, int(latency_ms))),
+                "reason": failure.split(":", 1)[0] if failure else "",
+            },
+        )
+
+    def timed_route(engine: str) -> ExtractionResponse:
+        route_started = time.perf_counter()
+        out = run_tavily_route() if engine == "tavily" else run_mineru_route()
+        record_engine(engine, out, int((time.perf_counter() - route_started) * 1000))
+        return out
+
     def finalize(response: ExtractionResponse) -> ExtractionResponse:
         response.notes = list(notes)
+        response.notes.extend(_project_response(response, url, settings, max_chars, include_markdown))
         if settings.decision_trace_enabled:
             trace.add_event(
                 stage="extract.response",
@@ -211,14 +308,79 @@ def run_extract_pipeline(
                     metadata={
                         "strategy": strategy,
                         "force_mineru": str(force_mineru).lower(),
+                        "host": plan.host,
                     },
                 )
                 if error:
                     response.notes.append("decision_trace_persist_failed:%s" % error)
         return response
 
+    def run_race() -> ExtractionResponse:
+        # 两个引擎同时起跑，取第一个可用结果；落败方在 daemon 线程里被放弃（不阻塞返回）。
+        # 落败线程不写 trace/notes，保证轨迹只由主线程产出。
+        trace.add_event(
+            stage="extract.execute",
+            decision="race_started",
+            reason="tavily and mineru launched concurrently",
+            metadata={"engines": "tavily,mineru", "tavily_timeout": str(plan.tavily_timeout)},
+        )
+        done: "Queue[Tuple[str, ExtractionResponse, int]]" = Queue()
+        routes = {"tavily": run_tavily_route, "mineru": run_mineru_route}
+
+        def worker(engine: str) -> None:
+            route_started = time.perf_counter()
+            try:
+                out = routes[engine](announce=False)
+            except Exception as exc:
+                out = ExtractionResponse(
+                    ok=False,
+                    source_url=url,
+                    engine="tavily_extract" if engine == "tavily" else "mineru",
+                    notes=["%s_race_failed:%s" % (engine, exc)],
+                    sources=[url],
+                )
+            done.put((engine, out, int((time.perf_counter() - route_started) * 1000)))
+
+        for engine in routes:
+            threading.Thread(target=worker, args=(engine,), daemon=True).start()
+
+        finished: Dict[str, ExtractionResponse] = {}
+        while len(finished) < len(routes):
+            engine, out, latency_ms = done.get()
+            finished[engine] = out
+            record_engine(engine, out, latency_ms)
+            if out.ok:
+                abandoned = [name for name in routes if name not in finished]
+                for name in routes:
+                    if name in finished:
+                        notes.extend(finished[name].notes or [])
+                notes.append("race_winner:%s" % engine)
+                if abandoned:
+                    notes.append("race_abandoned:%s" % ",".join(abandoned))
+                trace.add_event(
+                    stage="extract.execute",
+                    decision="race_resolved",
+                    reason="first usable result wins",
+                    metadata={"winner": engine, "abandoned": ",".join(abandoned) or "none"},
+                )
+                return out
+
+        for name in routes:
+            notes.extend(finished[name].notes or [])
+        notes.append("race_winner:none")
+        trace.add_event(
+            stage="extract.execute",
+            decision="race_resolved",
+            reason="no engine produced usable content",
+            metadata={"winner": "none", "abandoned": "none"},
+        )
+        return finished["mineru"]
+
+    if plan.is_race:
+        return finalize(run_race())
+
     if plan.first_engine == "tavily":
-        first = run_tavily_route()
+        first = timed_route("tavily")
         notes.extend(first.notes or [])
         if first.ok or not plan.fallback_engine:
             return finalize(first)
@@ -229,12 +391,12 @@ def run_extract_pipeline(
                 reason="primary engine failed",
                 metadata={"from": "tavily", "to": "mineru"},
             )
-            second = run_mineru_route()
+            second = timed_route("mineru")
             notes.extend(second.notes or [])
             return finalize(second)
         return finalize(first)
 
-    first = run_mineru_route()
+    first = timed_route("mineru")
     notes.extend(first.notes or [])
     if first.ok or not plan.fallback_engine:
         return finalize(first)
@@ -245,7 +407,7 @@ def run_extract_pipeline(
             reason="primary engine failed",
             metadata={"from": "mineru", "to": "tavily"},
         )
-        second = run_tavily_route()
+        second = timed_route("tavily")
         notes.extend(second.notes or [])
         return finalize(second)
     return finalize(first)
@@ -0,0 +1,168 @@
+import re
+from typing import Iterable, Iterator, List, Tuple
+
+from ..contracts import ExtractionChunk, ExtractionProjection
+
+# CJK 字符按 1 token 计；拉丁词按 ~4 字符 1 token；其余非空白符号各 1 token。
+_CJK_RANGES = r"\u3040-\u30ff\u3400-\u4dbf\u4e00-\u9fff\uac00-\ud7af\uf900-\ufaff"
+_TOKEN_RE = re.compile(r"[%s]|[A-Za-z0-9_]+|\S" % _CJK_RANGES)
+_CJK_RE = re.compile(r"[%s]" % _CJK_RANGES)
+_HEADING_RE = re.compile(r"^\s{0,3}#{1,6}\s+(.*?)\s*#*\s*$")
+_IMAGE_RE = re.compile(r"!\[[^\]]*\]\([^)]*\)")
+_LINK_RE = re.compile(r"\[([^\]]*)\]\([^)]*\)")
+_HTML_TAG_RE = re.compile(r"<[^>]{1,200}>")
+_LINE_MARKER_RE = re.compile(r"^\s*(?:#{1,6}\s+|>\s*|[-*+]\s+|\d+[.)]\s+|\|)")
+_EMPHASIS_RE = re.compile(r"[*_`~]{1,3}")
+
+DEFAULT_HEAD_CHARS = 600
+DEFAULT_SUMMARY_CHARS = 320
+DEFAULT_CHUNK_TOKENS = 512
+DEFAULT_MAX_CHUNKS = 64
+
+
+def approx_token_count(text: str) -> int:
+    total = 0
+    for match in _TOKEN_RE.finditer(text or ""):
+        piece = match.group(0)
+        if len(piece) > 1 and not _CJK_RE.match(piece):
+            total += (len(piece) + 3) // 4
+        else:
+            total += 1
+    return total
+
+
+def _plain_line(line: str) -> str:
+    text = _IMAGE_RE.sub("", line)
+    text = _LINK_RE.sub(r"\1", text)
+    text = _HTML_TAG_RE.sub(" ", text)
+    text = _LINE_MARKER_RE.sub("", text)
+    text = _EMPHASIS_RE.sub("", text)
+    return " ".join(text.split())
+
+
+def summary_window(text: str, limit: int = DEFAULT_SUMMARY_CHARS) -> str:
+    """去掉 markdown 标记后的正文窗口，跳过图片/代码围栏/纯链接导航行。"""
+    limit = max(1, int(limit))
+    parts: List[str] = []
+    size = 0
+    in_fence = False
+    for line in (text or "").splitlines():
+        if line.lstrip().startswith("```"):
+            in_fence = not in_fence
+            continue
+        if in_fence:
+            continue
+        plain = _plain_line(line)
+        if not plain or set(plain) <= set("-=|: "):
+            continue
+        parts.append(plain)
+        size += len(plain) + 1
+        if size > limit:
+            break
+    value = " ".join(parts)
+    if len(value) <= limit:
+        return value
+    return value[: max(1, limit - 3)] + "..."
+
+
+def iter_markdown_chunks(
+    lines: Iterable[str],
+    max_tokens: int = DEFAULT_CHUNK_TOKENS,
+) -> Iterator[Tuple[ExtractionChunk, str]]:
+    """流式切块：按行消费（可直接传文件对象），优先在标题/空行处断开，单行过长时硬切。
+
+    `lines` 需保留行尾换行符，chunk 的 start/end 是原文字符偏移。
+    """
+    max_tokens = max(16, int(max_tokens))
+    buf: List[str] = []
+    buf_tokens = 0
+    buf_start = 0
+    offset = 0
+    index = 0
+    heading = ""
+    chunk_heading = ""
+    soft_break = False
+
+    def flush() -> Tuple[ExtractionChunk, str]:
+        text = "".join(buf)
+        chunk = ExtractionChunk(
+            index=index,
+            start=buf_start,
+            end=buf_start + len(text),
+            tokens=buf_tokens,
+            heading=chunk_heading,
+        )
+        return chunk, text
+
+    for raw in lines:
+        pieces = [raw]
+        line_tokens = approx_token_count(raw)
+        if line_tokens > max_tokens:
+            # 超长单行按字符近似等分；首段先填满当前块的剩余预算，避免留下过碎的小块。
+            step = max(1, int(len(raw) * max_tokens / line_tokens))
+            # 按字符切分的 token 数只是近似，预留少量余量。
+            room = max_tokens - buf_tokens - max(2, max_tokens // 16)
+            first = int(len(raw) * room / line_tokens) if buf and room >= max_tokens // 4 else step
+            pieces = [raw[:first]] + [raw[i : i + step] for i in range(first, len(raw), step)]
+        for piece in pieces:
+            tokens = approx_token_count(piece) if len(pieces) > 1 else line_tokens
+            match = _HEADING_RE.match(piece)
+            starts_section = bool(match)
+            if buf and (
+                buf_tokens + tokens > max_tokens
+                or (starts_section and buf_tokens >= max_tokens // 4)
+                or (soft_break and buf_tokens >= max_tokens * 3 // 4)
+            ):
+                yield flush()
+                index += 1
+                buf = []
+                buf_tokens = 0
+                buf_start = offset
+            if match:
+                heading = match.group(1).strip()
+            if not buf:
+                chunk_heading = heading
+            buf.append(piece)
+            buf_tokens += tokens
+            offset += len(piece)
+            soft_break = not piece.strip()
+    if buf and "".join(buf).strip():
+        yield flush()
+
+
+def build_projection(
+    text: str,
+    head_chars: int = DEFAULT_HEAD_CHARS,
+    summary_chars: int = DEFAULT_SUMMARY_CHARS,
+    chunk_tokens: int = DEFAULT_CHUNK_TOKENS,
+    max_chunks: int = DEFAULT_MAX_CHUNKS,
+) -> ExtractionProjection:
+    text = text or ""
+    chunks: List[ExtractionChunk] = []
+    total_tokens = 0
+    truncated = False
+    for chunk, _ in iter_markdown_chunks(text.splitlines(keepends=True), max_tokens=chunk_tokens):
+        total_tokens += chunk.tokens
+        if max_chunks > 0 and len(chunks) >= max_chunks:
+            truncated = True
+            continue
+        chunks.append(chunk)
+    return ExtractionProjection(
+        head=text[: max(0, int(head_chars))],
+        summary=summary_window(text, summary_chars),
+        total_chars=len(text),
+        total_tokens=total_tokens,
+        chunks=chunks,
+        chunks_truncated=truncated,
+    )
+
+
+def projection_summary(response: object, limit: int) -> str:
+    """研究/explore 调用方用：优先取 projection.summary，旧结果或 mock 回退到 markdown。"""
+    projection = getattr(response, "projection", None)
+    summary = getattr(projection, "summary", "") if projection is not None else ""
+    if not summary:
+        summary = summary_window(getattr(response, "markdown", None) or "", limit)
+    if len(summary) <= limit:
+        return summary
+    return summary[: max(1, limit - 3)] + "..."
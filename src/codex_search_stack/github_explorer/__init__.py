@@ -1,4 +1,5 @@
+from .batch import run_github_explorer_batch
 from .orchestrator import run_github_explorer
 from .report import render_markdown
 
-__all__ = ["run_github_explorer", "render_markdown"]
+__all__ = ["run_github_explorer", "run_github_explorer_batch", "render_markdown"]
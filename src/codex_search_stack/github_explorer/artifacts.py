@@ -1,16 +1,41 @@
+import hashlib
 import json
+import os
 import re
+import shutil
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import contextmanager
 from datetime import datetime, timezone
 from pathlib import Path
-from typing import Any, Dict, List
+from typing import Any, Dict, Iterator, List, Optional, Tuple
 from urllib.parse import urlparse
 
 import requests
 
+try:
+    import fcntl
+except ImportError:  # Windows：只做进程内互斥
+    fcntl = None
+
 from ..config import Settings
 from ..search.orchestrator import run_multi_source_search
+from .explore_cache import explore_cache_for
 
 _SAFE_NAME_RE = re.compile(r"[^A-Za-z0-9._-]+")
+_PROJECT_ROOT = Path(__file__).resolve().parents[3]
+_REPORT_DIR_TS_RE = re.compile(r"_(\d{8}_\d{6}Z)$")
+_DEFAULT_DOWNLOAD_CONCURRENCY = 4
+_DEFAULT_PDF_MAX_BYTES = 50 * 1024 * 1024
+_DEFAULT_BOOK_CACHE_MAX_MB = 2048
+_PDF_EOF_WINDOW = 1024
+_CONTENT_RANGE_TOTAL_RE = re.compile(r"/(\d+)\s*$")
+_LOCAL_LOCKS: Dict[str, threading.Lock] = {}
+_LOCAL_LOCKS_GUARD = threading.Lock()
+_ENFORCE_INTERVAL_SECONDS = 60.0
+_ENFORCE_LOCK = threading.Lock()
+_LAST_ENFORCED: Dict[str, float] = {}
 
 
 def _host(url: str) -> str:
@@ -56,6 +81,43 @@ def _repo_slug(result: Dict[str, Any]) -> str:
     return "repo"
 
 
+def report_generated_at(report: Dict[str, Any], report_dir: Optional[Path] = None) -> str:
+    """报告生成时间（UTC ISO8601）；旧报告没有 generated_at 字段时从目录名 `<slug>_<ts>` 推断。"""
+    value = str(report.get("generated_at") or "").strip()
+    if value:
+        return value
+    match = _REPORT_DIR_TS_RE.search(report_dir.name) if report_dir is not None else None
+    if not match:
+        return ""
+    return datetime.strptime(match.group(1), "%Y%m%d_%H%M%SZ").strftime("%Y-%m-%dT%H:%M:%SZ")
+
+
+def find_latest_report(full_name: str, project_root: Optional[Path] = None) -> Tuple[Optional[Dict[str, Any]], str]:
+    """在 `.runtime/github-explorer/` 下找该仓库最近一次成功的 report.json，返回 (报告, 路径)；没有时返回 (None, "")。"""
+    root = (project_root or _PROJECT_ROOT) / ".runtime" / "github-explorer"
+    prefix = "%s_" % _repo_slug({"repo": {"full_name": full_name}}).lower()
+    best: Tuple[str, Optional[Dict[str, Any]], str] = ("", None, "")
+    try:
+        candidates = [path for path in root.iterdir() if path.is_dir() and path.name.lower().startswith(prefix)]
+    except Exception:
+        return None, ""
+    for report_dir in candidates:
+        path = report_dir / "report.json"
+        try:
+            report = json.loads(path.read_text(encoding="utf-8"))
+        except Exception:
+            continue
+        if not isinstance(report, dict) or not report.get("ok"):
+            continue
+        # slug 会把 owner/repo 中的特殊字符归一，按 full_name 再确认一次。
+        if str((report.get("repo") or {}).get("full_name") or "").lower() != full_name.lower():
+            continue
+        generated_at = report_generated_at(report, report_dir)
+        if generated_at and generated_at > best[0]:
+            best = (generated_at, report, str(path))
+    return best[1], best[2]
+
+
 def collect_book(result: Dict[str, Any], settings: Settings, max_items: int) -> Dict[str, Any]:
     max_items = max(0, int(max_items))
     book: Dict[str, Any] = {"papers": [], "deepwiki": [], "zread": [], "notes": []}
@@ -142,7 +204,17 @@ def collect_book(result: Dict[str, Any], settings: Settings, max_items: int) ->
 def attach_book_to_result(result: Dict[str, Any], settings: Settings, max_items: int) -> None:
     if not result.get("ok"):
         return
-    book = collect_book(result, settings=settings, max_items=max_items)
+    repo = result.get("repo") or {}
+    owner, name = (repo.get("owner") or "").strip(), (repo.get("name") or "").strip()
+    cache = explore_cache_for(settings) if owner and name else None
+    options = {"max_items": max(0, int(max_items))}
+    book = cache.get("book", owner, name, options) if cache is not None else None
+    if book is not None:
+        result["notes"] = list(result.get("notes") or []) + ["explore_cache_hit:book"]
+    else:
+        book = collect_book(result, settings=settings, max_items=max_items)
+        if cache is not None and not any("_failed" in note for note in book.get("notes") or []):
+            cache.put("book", owner, name, options, book)
     result["book"] = book
 
     papers = list(book.get("papers") or [])
@@ -158,19 +230,267 @@ def attach_book_to_result(result: Dict[str, Any], settings: Settings, max_items:
         result["notes"] = list(result.get("notes") or []) + ["book_notes:%s" % len(book.get("notes") or [])]
 
 
-def _download_binary(url: str, dest: Path, timeout: int) -> str:
+@contextmanager
+def _file_lock(path: Path) -> Iterator[None]:
+    """跨进程互斥（fcntl.flock，同进程内的多个线程也互斥）；没有 fcntl 的平台退化为进程内锁。"""
+    with _LOCAL_LOCKS_GUARD:
+        local = _LOCAL_LOCKS.setdefault(str(path), threading.Lock())
+    with local:
+        if fcntl is None:
+            yield
+            return
+        path.parent.mkdir(parents=True, exist_ok=True)
+        with path.open("a") as fp:
+            fcntl.flock(fp.fileno(), fcntl.LOCK_EX)
+            try:
+                yield
+            finally:
+                fcntl.flock(fp.fileno(), fcntl.LOCK_UN)
+
+
+class _PdfStore:
+    """跨次 explore 共享的 PDF 存储：按内容 sha256 存一份，URL -> sha 索引用于跳过重复下载。
+
+    未完成的下载留在 parts/ 下（按 URL 命名），下次用 HTTP Range 续传；报告目录里只放完整文件。
+    多个 explore 进程可能共用同一个存储：同一 URL 的下载由 locks/ 下的文件锁串行化，
+    index.json 在锁内重读合并后再写，不会覆盖别的进程刚写入的条目。
+    """
+
+    def __init__(self, root: Path) -> None:
+        self.root = Path(root)
+        self.blobs = self.root / "blobs"
+        self.parts = self.root / "parts"
+        self.locks = self.root / "locks"
+        self.index_path = self.root / "index.json"
+        self._lock = threading.Lock()
+        self._index: Dict[str, str] = self._read_index()
+
+    def _read_index(self) -> Dict[str, str]:
+        try:
+            index = json.loads(self.index_path.read_text(encoding="utf-8"))
+        except Exception:
+            index = {}
+        return index if isinstance(index, dict) else {}
+
+    def lookup(self, url: str, refresh: bool = False) -> Optional[Path]:
+        """refresh=True 时先合并磁盘上的索引（别的进程可能刚下完同一个 URL）。命中时刷新 mtime，供 LRU 淘汰。"""
+        with self._lock:
+            if refresh:
+                self._index.update(self._read_index())
+            digest = self._index.get(url)
+        if not digest:
+            return None
+        blob = self.blobs / ("%s.pdf" % digest)
+        try:
+            os.utime(str(blob), None)
+        except OSError:
+            return None
+        return blob
+
+    def _key(self, url: str) -> str:
+        return hashlib.sha256(url.encode("utf-8")).hexdigest()[:32]
+
+    def part_path(self, url: str) -> Path:
+        self.parts.mkdir(parents=True, exist_ok=True)
+        return self.parts / ("%s.part" % self._key(url))
+
+    def download_lock(self, url: str):
+        return _file_lock(self.locks / ("%s.lock" % self._key(url)))
+
+    def commit(self, url: str, part: Path) -> Tuple[Path, bool]:
+        """把下载完成的 part 收入存储；同内容已存在时丢弃 part，返回 (blob, 是否去重命中)。"""
+        sha = hashlib.sha256()
+        with part.open("rb") as fp:
+            for block in iter(lambda: fp.read(1 << 20), b""):
+                sha.update(block)
+        digest = sha.hexdigest()
+        blob = self.blobs / ("%s.pdf" % digest)
+        self.blobs.mkdir(parents=True, exist_ok=True)
+        with self._lock, _file_lock(self.locks / "index.lock"):
+            duplicate = blob.exists()
+            if duplicate:
+                part.unlink()
+                os.utime(str(blob), None)
+            else:
+                os.replace(str(part), str(blob))
+            # 以磁盘上的最新索引为底合并，其他进程在本进程启动后写入的条目不会丢。
+            self._index.update(self._read_index())
+            self._index[url] = digest
+            self._write_index()
+        return blob, duplicate
+
+    def _write_index(self) -> None:
+        tmp = self.index_path.with_name("index.json.%s.%s.tmp" % (os.getpid(), threading.get_ident()))
+        tmp.write_text(json.dumps(self._index, ensure_ascii=False), encoding="utf-8")
+        os.replace(str(tmp), str(self.index_path))
+
+    def prune(self, max_bytes: int) -> int:
+        """按 blob 的 mtime（命中时刷新）从旧到新删到总量不超过 max_bytes，并清掉指向已删 blob 的索引项。
+
+        只处理 blobs/；parts/ 里可能有别的进程正在续传的文件，不在这里动。返回删除的 blob 数。
+        """
+        if max_bytes <= 0:
+            return 0
+        entries: List[Tuple[float, int, Path]] = []
+        try:
+            paths = list(self.blobs.glob("*.pdf"))
+        except OSError:
+            return 0
+        for path in paths:
+            try:
+                stat = path.stat()
+            except OSError:
+                continue
+            entries.append((stat.st_mtime, stat.st_size, path))
+        total = sum(size for _, size, _ in entries)
+        if total <= max_bytes:
+            return 0
+        entries.sort(key=lambda item: item[0])
+        with self._lock, _file_lock(self.locks / "index.lock"):
+            evicted = set()
+            for _, size, path in entries:
+                if total <= max_bytes:
+                    break
+                try:
+                    path.unlink()
+                except OSError:
+                    continue
+                total -= size
+                evicted.add(path.stem)
+            if evicted:
+                self._index.update(self._read_index())
+                self._index = {url: digest for url, digest in self._index.items() if digest not in evicted}
+                self._write_index()
+        return len(evicted)
+
+    def enforce(self, max_bytes: int) -> Optional[int]:
+        """下载结束后调用：同一存储 60 秒内只 prune 一次；未设上限或未到间隔时返回 None。"""
+        if max_bytes <= 0:
+            return None
+        key = str(self.root)
+        now = time.monotonic()
+        with _ENFORCE_LOCK:
+            last = _LAST_ENFORCED.get(key)
+            if last is not None and now - last < _ENFORCE_INTERVAL_SECONDS:
+                return None
+            _LAST_ENFORCED[key] = now
+        return self.prune(max_bytes)
+
+
+def book_cache_max_bytes(settings: Settings) -> int:
+    """policy.explore.book_cache.max_mb：book-cache 体积上限（MB，0 不限）。"""
+    explore = (getattr(settings, "policy", None) or {}).get("explore", {})
+    raw = explore.get("book_cache") if isinstance(explore, dict) else None
+    max_mb = _DEFAULT_BOOK_CACHE_MAX_MB
+    if isinstance(raw, dict):
+        try:
+            max_mb = int(raw.get("max_mb", _DEFAULT_BOOK_CACHE_MAX_MB))
+        except Exception:
+            max_mb = _DEFAULT_BOOK_CACHE_MAX_MB
+    return max(0, max_mb) * 1024 * 1024
+
+
+def _place_file(blob: Path, dest: Path) -> None:
+    # 先落到临时名再 rename，报告目录里不会出现半个文件；能硬链接就不占第二份空间。
+    tmp = dest.with_name("%s.%s.tmp" % (dest.name, threading.get_ident()))
+    try:
+        os.link(str(blob), str(tmp))
+    except OSError:
+        shutil.copyfile(str(blob), str(tmp))
+    os.replace(str(tmp), str(dest))
+
+
+def _download_binary(url: str, part: Path, timeout: int, max_bytes: int) -> str:
+    """下载到 part 文件；part 已有内容时用 Range 续传。超过 max_bytes 时删除 part 并返回错误。"""
+    offset = part.stat().st_size if part.exists() else 0
+    headers = {"Range": "bytes=%d-" % offset} if offset else {}
     try:
-        response = requests.get(url, timeout=timeout, stream=True)
+        response = requests.get(url, timeout=timeout, stream=True, headers=headers)
+        if offset and response.status_code == 416:
+            # 请求范围越界：只有服务端报告的总长（Content-Range: bytes */N）与 part 一致才算已下完；
+            # 对不上（文件已更新或 part 损坏）或没给总长时丢弃 part 从头下载。
+            content_range = str((getattr(response, "headers", None) or {}).get("Content-Range") or "")
+            match = _CONTENT_RANGE_TOTAL_RE.search(content_range)
+            if match and int(match.group(1)) == offset:
+                return ""
+            part.unlink(missing_ok=True)
+            return _download_binary(url, part, timeout=timeout, max_bytes=max_bytes)
         response.raise_for_status()
-        with dest.open("wb") as fw:
+        append = bool(offset) and response.status_code == 206
+        written = offset if append else 0
+        length = (getattr(response, "headers", None) or {}).get("Content-Length")
+        if length and str(length).isdigit() and written + int(length) > max_bytes:
+            part.unlink(missing_ok=True)
+            return "too_large:%s" % (written + int(length))
+        with part.open("ab" if append else "wb") as fw:
             for chunk in response.iter_content(chunk_size=65536):
-                if chunk:
-                    fw.write(chunk)
+                if not chunk:
+                    continue
+                written += len(chunk)
+                if written > max_bytes:
+                    break
+                fw.write(chunk)
+        if written > max_bytes:
+            part.unlink(missing_ok=True)
+            return "too_large:>%s" % max_bytes
         return ""
     except Exception as exc:
+        # part 保留，下次续传。
         return str(exc)
 
 
+def _pdf_complete(path: Path, expected: Optional[Path]) -> bool:
+    """报告目录里已有的文件是否可信：须以 %PDF- 开头；存储里有对应 blob 时大小须一致，
+    没有时末尾 1KB 内须有 %%EOF。上次中断留下的半个文件都通不过。"""
+    try:
+        size = path.stat().st_size
+        if size <= 0:
+            return False
+        if expected is not None and size != expected.stat().st_size:
+            return False
+        with path.open("rb") as fp:
+            if fp.read(5) != b"%PDF-":
+                return False
+            if expected is not None:
+                return True
+            fp.seek(max(0, size - _PDF_EOF_WINDOW))
+            return b"%%EOF" in fp.read()
+    except OSError:
+        return False
+
+
+def _fetch_paper(store: _PdfStore, url: str, dest: Path, timeout: int, max_bytes: int) -> Tuple[str, str]:
+    """返回 (状态, 错误)：状态为 exists / cached / deduped / downloaded / failed。"""
+    blob = store.lookup(url)
+    if dest.exists():
+        if _pdf_complete(dest, blob):
+            return "exists", ""
+        # 截断或内容不符：删掉后按正常流程从存储放置或重新下载。
+        dest.unlink(missing_ok=True)
+    if blob is not None:
+        try:
+            _place_file(blob, dest)
+            return "cached", ""
+        except OSError:
+            pass  # blob 刚被别的进程淘汰：走下载
+    # 同一 URL 同时只有一个下载者写 part；等到锁后先看别人是不是已经下完入库。
+    with store.download_lock(url):
+        blob = store.lookup(url, refresh=True)
+        if blob is not None:
+            _place_file(blob, dest)
+            return "cached", ""
+        part = store.part_path(url)
+        err = _download_binary(url, part, timeout=timeout, max_bytes=max_bytes)
+        if err:
+            return "failed", err
+        try:
+            blob, duplicate = store.commit(url, part)
+            _place_file(blob, dest)
+        except Exception as exc:
+            return "failed", str(exc)
+    return ("deduped" if duplicate else "downloaded"), ""
+
+
 def persist_explore_artifacts(
     result: Dict[str, Any],
     markdown_text: str,
@@ -178,6 +498,9 @@ def persist_explore_artifacts(
     out_dir: str,
     download_book: bool,
     timeout: int,
+    download_concurrency: int = _DEFAULT_DOWNLOAD_CONCURRENCY,
+    max_pdf_bytes: int = _DEFAULT_PDF_MAX_BYTES,
+    cache_max_bytes: int = _DEFAULT_BOOK_CACHE_MAX_MB * 1024 * 1024,
 ) -> Dict[str, Any]:
     if out_dir.strip():
         base_dir = Path(out_dir).expanduser()
@@ -198,6 +521,7 @@ def persist_explore_artifacts(
     papers_dir.mkdir(parents=True, exist_ok=True)
 
     downloaded = 0
+    reused = 0
     failed = 0
     lines: List[str] = [
         "# Book 资料包",
@@ -209,28 +533,55 @@ def persist_explore_artifacts(
         "",
     ]
     papers = book.get("papers") or []
-    if not papers:
-        lines.append("- 未找到")
-    else:
+    # 下载先并发跑完，README 再按论文顺序生成；同一 pdf_url 只下载一次。
+    store = _PdfStore(project_root / ".runtime" / "book-cache")
+    jobs: Dict[str, Any] = {}
+    pool = ThreadPoolExecutor(max_workers=max(1, int(download_concurrency)))
+    try:
+        planned = []
         for idx, paper in enumerate(papers, start=1):
             title = paper.get("title", "") or ("paper_%s" % idx)
-            url = paper.get("url", "")
-            pdf_url = paper.get("pdf_url", "") or _arxiv_pdf_url(url)
-            lines.append("- [%s](%s)" % (title, url))
-            if pdf_url:
-                lines.append("  - pdf_url: %s" % pdf_url)
-            if download_book and pdf_url:
-                file_name = _safe_filename(title, "paper_%s" % idx) + ".pdf"
-                file_path = papers_dir / file_name
-                err = _download_binary(pdf_url, file_path, timeout=max(10, timeout))
-                if err:
-                    failed += 1
-                    lines.append("  - download: failed (%s)" % err)
-                else:
-                    downloaded += 1
-                    lines.append("  - download: ok -> papers/%s" % file_name)
-            else:
-                lines.append("  - download: skipped")
+            pdf_url = paper.get("pdf_url", "") or _arxiv_pdf_url(paper.get("url", ""))
+            file_name = _safe_filename(title, "paper_%s" % idx) + ".pdf"
+            planned.append((title, paper.get("url", ""), pdf_url, file_name))
+            if download_book and pdf_url and pdf_url not in jobs:
+                jobs[pdf_url] = pool.submit(
+                    _fetch_paper, store, pdf_url, papers_dir / file_name, max(10, timeout), max(1, int(max_pdf_bytes))
+                )
+        outcomes: Dict[str, Tuple[str, str]] = {pdf_url: future.result() for pdf_url, future in jobs.items()}
+    finally:
+        pool.shutdown(wait=False, cancel_futures=True)
+
+    if not papers:
+        lines.append("- 未找到")
+    for title, url, pdf_url, file_name in planned:
+        lines.append("- [%s](%s)" % (title, url))
+        if pdf_url:
+            lines.append("  - pdf_url: %s" % pdf_url)
+        if not (download_book and pdf_url):
+            lines.append("  - download: skipped")
+            continue
+        status, err = outcomes[pdf_url]
+        file_path = papers_dir / file_name
+        if status != "failed" and not file_path.exists():
+            # 同一 pdf_url 的第二篇（标题不同）：从存储里再放一份。
+            blob = store.lookup(pdf_url)
+            if blob is not None:
+                _place_file(blob, file_path)
+                status = "cached"
+        if status == "failed":
+            failed += 1
+            lines.append("  - download: failed (%s)" % err)
+        elif status == "downloaded":
+            downloaded += 1
+            lines.append("  - download: ok -> papers/%s" % file_name)
+        else:
+            reused += 1
+            lines.append("  - download: ok (%s) -> papers/%s" % (status, file_name))
+
+    # 报告目录里的文件是硬链接或副本，淘汰 blob 不影响已放好的论文。
+    if jobs:
+        store.enforce(max(0, int(cache_max_bytes)))
 
     for key, label in [("deepwiki", "DeepWiki"), ("zread", "zread")]:
         lines.append("")
@@ -251,5 +602,6 @@ def persist_explore_artifacts(
         "report_json": str(report_json),
         "book_readme": str(book_readme),
         "book_downloaded": downloaded,
+        "book_download_reused": reused,
         "book_download_failed": failed,
     }
@@ -0,0 +1,176 @@
+import hashlib
+import json
+import os
+import re
+import threading
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from pathlib import Path
+from typing import Any, Callable, Dict, List, Optional
+
+import requests
+from requests.adapters import HTTPAdapter
+
+from ..config import Settings
+from .orchestrator import run_github_explorer
+from .report import render_markdown
+
+_PROJECT_ROOT = Path(__file__).resolve().parents[3]
+_SAFE_NAME_RE = re.compile(r"[^A-Za-z0-9._-]+")
+_DEFAULT_BATCH_CONCURRENCY = 4
+
+
+def normalize_targets(targets: List[str]) -> List[str]:
+    """去掉空行、`#` 注释与重复项，保持原顺序。"""
+    out: List[str] = []
+    seen = set()
+    for raw in targets:
+        value = (raw or "").strip()
+        if not value or value.startswith("#"):
+            continue
+        key = value.lower().rstrip("/")
+        if key in seen:
+            continue
+        seen.add(key)
+        out.append(value)
+    return out
+
+
+def report_slug(target: str) -> str:
+    value = re.sub(r"^https?://(www\.)?github\.com/", "", target.strip(), flags=re.IGNORECASE).strip("/")
+    slug = _SAFE_NAME_RE.sub("_", value.replace("/", "__")).strip("._")[:80]
+    digest = hashlib.sha256(target.strip().lower().encode("utf-8")).hexdigest()[:8]
+    return "%s-%s" % (slug or "target", digest)
+
+
+def default_batch_dir(targets: List[str], options: Dict[str, Any]) -> Path:
+    # 同一批目标 + 参数得到同一个目录，重跑即续跑。
+    raw = json.dumps({"targets": targets, "options": sorted(options.items())}, default=str)
+    batch_id = hashlib.sha256(raw.encode("utf-8")).hexdigest()[:12]
+    return _PROJECT_ROOT / ".runtime" / "github-explorer-batch" / batch_id
+
+
+def _write_atomic(path: Path, text: str) -> None:
+    tmp = path.with_name("%s.%s.%s.tmp" % (path.name, os.getpid(), threading.get_ident()))
+    tmp.write_text(text, encoding="utf-8")
+    os.replace(str(tmp), str(path))
+
+
+def _load_finished(path: Path) -> Optional[Dict[str, Any]]:
+    try:
+        report = json.loads(path.read_text(encoding="utf-8"))
+    except Exception:
+        return None
+    return report if isinstance(report, dict) and report.get("ok") else None
+
+
+def _summary_row(target: str, status: str, report: Optional[Dict[str, Any]], json_path: Path) -> Dict[str, Any]:
+    row: Dict[str, Any] = {"target": target, "status": status, "report_json": str(json_path)}
+    if report is not None:
+        row["full_name"] = (report.get("repo") or {}).get("full_name", "")
+        row["confidence"] = (report.get("confidence") or {}).get("score")
+        if not report.get("ok"):
+            row["error"] = report.get("error", "")
+    return row
+
+
+def run_github_explorer_batch(
+    targets: List[str],
+    settings: Settings,
+    concurrency: int = _DEFAULT_BATCH_CONCURRENCY,
+    out_dir: str = "",
+    resume: bool = True,
+    incremental: bool = False,
+    on_result: Optional[Callable[[Dict[str, Any]], None]] = None,
+    issues_limit: int = 5,
+    commits_limit: int = 5,
+    external_limit: int = 8,
+    extract_top: int = 2,
+    with_extract: bool = True,
+    confidence_profile: str = "deep",
+) -> Dict[str, Any]:
+    """批量 explore：多个仓库并发执行，每个仓库完成即落盘 `<slug>.json/.md`。
+
+    所有仓库共用一个 HTTP Session（连接池）、GitHub 配额状态与磁盘缓存；resume 时已有 ok 报告的目标直接跳过，
+    失败的目标重新执行。incremental 时已有 ok 报告的目标不跳过，而是以它为基线只拉变化并覆盖（适合 watchlist 定期重跑）。
+    on_result 在每个目标结束时（含跳过）被调用，可用于输出进度。
+    """
+    targets = normalize_targets(targets)
+    options = {
+        "issues_limit": issues_limit,
+        "commits_limit": commits_limit,
+        "external_limit": external_limit,
+        "extract_top": extract_top,
+        "with_extract": with_extract,
+        "confidence_profile": confidence_profile,
+    }
+    base_dir = Path(out_dir).expanduser() if out_dir.strip() else default_batch_dir(targets, options)
+    base_dir.mkdir(parents=True, exist_ok=True)
+    workers = max(1, min(int(concurrency or 1), 32))
+
+    rows: Dict[str, Dict[str, Any]] = {}
+    emit_lock = threading.Lock()
+
+    def finish(target: str, row: Dict[str, Any]) -> None:
+        with emit_lock:
+            rows[target] = row
+            if on_result is not None:
+                on_result(row)
+
+    pending: List[str] = []
+    previous: Dict[str, Dict[str, Any]] = {}
+    for target in targets:
+        json_path = base_dir / ("%s.json" % report_slug(target))
+        finished = _load_finished(json_path) if (resume or incremental) else None
+        if finished is not None and incremental:
+            previous[target] = finished
+            pending.append(target)
+        elif finished is not None:
+            finish(target, _summary_row(target, "skipped", finished, json_path))
+        else:
+            pending.append(target)
+
+    session = requests.Session()
+    adapter = HTTPAdapter(pool_connections=workers, pool_maxsize=workers * 4)
+    session.mount("https://", adapter)
+    session.mount("http://", adapter)
+
+    def run_one(target: str) -> Dict[str, Any]:
+        json_path = base_dir / ("%s.json" % report_slug(target))
+        try:
+            report = run_github_explorer(
+                target=target, settings=settings, session=session, previous_report=previous.get(target), **options
+            )
+        except Exception as exc:
+            report = {"ok": False, "target": target, "error": str(exc), "notes": ["explore_batch_error:%s" % exc]}
+        try:
+            # json 是 resume 判断「已完成」的依据，最后写：md 失败时不会留下一个看似完成的报告。
+            _write_atomic(json_path.with_suffix(".md"), render_markdown(report))
+            _write_atomic(json_path, json.dumps(report, ensure_ascii=False, indent=2))
+        except Exception as exc:
+            # 单个目标落盘失败（磁盘满、权限、渲染异常）只记为失败，不中断整批与 summary.json。
+            row = _summary_row(target, "failed", report, json_path)
+            row["error"] = "write_failed:%s" % exc
+            return row
+        return _summary_row(target, "ok" if report.get("ok") else "failed", report, json_path)
+
+    pool = ThreadPoolExecutor(max_workers=workers)
+    try:
+        futures = {pool.submit(run_one, target): target for target in pending}
+        for future in as_completed(futures):
+            finish(futures[future], future.result())
+    finally:
+        pool.shutdown(wait=False, cancel_futures=True)
+        session.close()
+
+    ordered = [rows[target] for target in targets if target in rows]
+    summary = {
+        "ok": all(row["status"] != "failed" for row in ordered),
+        "out_dir": str(base_dir),
+        "total": len(targets),
+        "completed": len([row for row in ordered if row["status"] == "ok"]),
+        "skipped": len([row for row in ordered if row["status"] == "skipped"]),
+        "failed": len([row for row in ordered if row["status"] == "failed"]),
+        "results": ordered,
+    }
+    _write_atomic(base_dir / "summary.json", json.dumps(summary, ensure_ascii=False, indent=2))
+    return summary
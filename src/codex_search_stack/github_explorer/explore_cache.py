@@ -0,0 +1,79 @@
+import hashlib
+import json
+import os
+import threading
+import time
+from pathlib import Path
+from typing import Any, Dict, Optional
+
+# 各阶段默认有效期（秒）。repo_data 另外用 pushed_at/updated_at 校验，TTL 只是兜底上限。
+DEFAULT_PHASE_TTLS = {
+    "repo_data": 86400,
+    "external": 21600,
+    "index": 604800,
+    "book": 604800,
+}
+
+
+class ExploreCache:
+    """explore 分阶段结果缓存：每个阶段按 owner/repo + 该阶段相关参数单独落盘，各自 TTL。"""
+
+    def __init__(self, root: Path, ttls: Optional[Dict[str, int]] = None) -> None:
+        self.root = Path(root)
+        self.ttls = dict(DEFAULT_PHASE_TTLS)
+        self.ttls.update(ttls or {})
+
+    def _path(self, phase: str, owner: str, repo: str, options: Dict[str, Any]) -> Path:
+        raw = json.dumps(
+            {"repo": ("%s/%s" % (owner, repo)).lower(), "options": sorted((options or {}).items())},
+            default=str,
+        )
+        key = hashlib.sha256(raw.encode("utf-8")).hexdigest()[:32]
+        return self.root / phase / ("%s.json" % key)
+
+    def get(self, phase: str, owner: str, repo: str, options: Optional[Dict[str, Any]] = None) -> Optional[Dict[str, Any]]:
+        ttl = int(self.ttls.get(phase) or 0)
+        if ttl <= 0:
+            return None
+        try:
+            entry = json.loads(self._path(phase, owner, repo, options or {}).read_text(encoding="utf-8"))
+        except Exception:
+            return None
+        if not isinstance(entry, dict) or not isinstance(entry.get("payload"), dict):
+            return None
+        if time.time() - float(entry.get("stored_at") or 0) >= ttl:
+            return None
+        return entry["payload"]
+
+    def put(self, phase: str, owner: str, repo: str, options: Optional[Dict[str, Any]], payload: Dict[str, Any]) -> None:
+        if int(self.ttls.get(phase) or 0) <= 0:
+            return
+        path = self._path(phase, owner, repo, options or {})
+        try:
+            path.parent.mkdir(parents=True, exist_ok=True)
+            entry = {"repo": "%s/%s" % (owner, repo), "phase": phase, "stored_at": int(time.time()), "payload": payload}
+            tmp = path.with_name("%s.%s.%s.tmp" % (path.name, os.getpid(), threading.get_ident()))
+            tmp.write_text(json.dumps(entry, ensure_ascii=False), encoding="utf-8")
+            os.replace(str(tmp), str(path))
+        except Exception:
+            # 缓存写失败不影响本次结果。
+            pass
+
+
+def explore_cache_for(settings: Any) -> Optional[ExploreCache]:
+    """按 settings 构造缓存；未配置目录或 policy.explore.cache.enabled=false 时返回 None。"""
+    root = getattr(settings, "explore_cache_dir", "") or ""
+    policy = getattr(settings, "policy", {})
+    explore = policy.get("explore") if isinstance(policy, dict) else None
+    cache_policy = explore.get("cache") if isinstance(explore, dict) else None
+    cache_policy = cache_policy if isinstance(cache_policy, dict) else {}
+    if not root or cache_policy.get("enabled", True) is False:
+        return None
+    ttls: Dict[str, int] = {}
+    raw_ttls = cache_policy.get("ttl_seconds")
+    for phase, value in (raw_ttls.items() if isinstance(raw_ttls, dict) else []):
+        try:
+            ttls[str(phase)] = max(0, int(value))
+        except Exception:
+            continue
+    return ExploreCache(Path(root).expanduser(), ttls)
@@ -0,0 +1,416 @@
+import hashlib
+import json
+import os
+import re
+import threading
+import time
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Sequence, Tuple, Union
+
+import requests
+
+GITHUB_API_BASE = "https://api.github.com"
+DEFAULT_RATE_LIMIT_POLICY = {
+    # 剩余配额低于 optional_reserve 时不再发可选请求（README、issue 评论）。
+    "optional_reserve": 100,
+    # 剩余配额低于 pace_below 时，把剩余请求均匀摊到 reset 之前，单次间隔不超过 max_pace_seconds。
+    "pace_below": 100,
+    "max_pace_seconds": 2.0,
+    # 403/429 限流：Retry-After（或主配额耗尽到 reset）不超过 max_retry_wait_seconds 时等待后重试。
+    "max_retry_wait_seconds": 15.0,
+    "max_retries": 2,
+}
+DEFAULT_HTTP_CACHE_MAX_ENTRIES = 5000
+_CACHE_ENTRY_RE = re.compile(r"^[0-9a-f]{32}$")
+# 写入后的淘汰要扫描整个缓存目录，同一进程内对同一目录最多每隔这么久做一次。
+_ENFORCE_INTERVAL_SECONDS = 60.0
+_ENFORCE_LOCK = threading.Lock()
+_LAST_ENFORCED: Dict[str, float] = {}
+
+# 配额按 token 身份 + resource（core/graphql/search）在进程内共享，批量 explore 时后续仓库能提前看到余量。
+_RATE_LOCK = threading.Lock()
+_RATE_STATE: Dict[Tuple[str, str], Dict[str, int]] = {}
+_LAST_REQUEST_AT: Dict[str, float] = {}
+
+
+def _identity(token: Optional[str]) -> str:
+    return hashlib.sha256(token.encode("utf-8")).hexdigest()[:12] if token else "anon"
+
+
+def _header(headers: Any, name: str) -> str:
+    if not headers:
+        return ""
+    return str(headers.get(name) or headers.get(name.lower()) or "")
+
+
+def record_rate_limit(token: Optional[str], headers: Any) -> None:
+    """从响应头记录 X-RateLimit-*；REST 与 GraphQL 响应都会带。"""
+    remaining = _header(headers, "X-RateLimit-Remaining")
+    if not remaining:
+        return
+    try:
+        state = {
+            "limit": int(_header(headers, "X-RateLimit-Limit") or 0),
+            "remaining": int(remaining),
+            "reset": int(_header(headers, "X-RateLimit-Reset") or 0),
+        }
+    except ValueError:
+        return
+    resource = _header(headers, "X-RateLimit-Resource") or "core"
+    with _RATE_LOCK:
+        _RATE_STATE[(_identity(token), resource)] = state
+
+
+def _aggregate(states: List[Dict[str, int]]) -> Dict[str, int]:
+    """多个 token 的配额合并：limit/remaining 求和，reset 取最早一个。"""
+    resets = [state["reset"] for state in states if state["reset"]]
+    merged = {
+        "limit": sum(state["limit"] for state in states),
+        "remaining": sum(state["remaining"] for state in states),
+        "reset": min(resets) if resets else 0,
+    }
+    if len(states) > 1:
+        merged["tokens"] = len(states)
+    return merged
+
+
+def rate_limit_snapshot(tokens: Union[Optional[str], Sequence[str]]) -> Dict[str, Dict[str, int]]:
+    """单个 token 返回其各 resource 的配额；传入 token 列表时按 resource 合并。"""
+    token_list = [tokens] if tokens is None or isinstance(tokens, str) else list(tokens)
+    identities = {_identity(token) for token in token_list} or {_identity(None)}
+    grouped: Dict[str, List[Dict[str, int]]] = {}
+    with _RATE_LOCK:
+        for (owner, resource), state in _RATE_STATE.items():
+            if owner in identities:
+                grouped.setdefault(resource, []).append(dict(state))
+    return {resource: _aggregate(states) for resource, states in grouped.items()}
+
+
+def github_headers(token: Optional[str]) -> Dict[str, str]:
+    headers = {
+        "Accept": "application/vnd.github+json",
+        "User-Agent": "codex-search",
+    }
+    if token:
+        headers["Authorization"] = "Bearer %s" % token
+    return headers
+
+
+def prune_http_cache(root: Union[str, Path], max_entries: int) -> int:
+    """ETag 缓存按最近使用时间（文件 mtime，命中时刷新）只保留最新的 max_entries 条，返回删除条数。
+
+    只处理 <2 位>/<32 位 hex>.json 形状的条目，同目录下的 index-probe/ 等不受影响。
+    """
+    if max_entries <= 0:
+        return 0
+    entries: List[Tuple[float, Path]] = []
+    try:
+        paths = list(Path(root).expanduser().glob("*/*.json"))
+    except OSError:
+        return 0
+    for path in paths:
+        if not (_CACHE_ENTRY_RE.match(path.stem) and path.parent.name == path.stem[:2]):
+            continue
+        try:
+            entries.append((path.stat().st_mtime, path))
+        except OSError:
+            continue
+    if len(entries) <= max_entries:
+        return 0
+    entries.sort(key=lambda item: item[0])
+    removed = 0
+    for _, path in entries[: len(entries) - max_entries]:
+        try:
+            path.unlink()
+            removed += 1
+        except OSError:
+            pass
+    return removed
+
+
+class CachedResponse:
+    """304 命中时返回的响应：接口与 requests.Response 在调用方用到的部分保持一致。"""
+
+    def __init__(self, url: str, body: str, headers: Dict[str, str]) -> None:
+        self.url = url
+        self.status_code = 200
+        self.headers = dict(headers)
+        self.text = body
+        self.from_cache = True
+
+    def json(self) -> Any:
+        return json.loads(self.text)
+
+    def raise_for_status(self) -> None:
+        return None
+
+
+class GitHubClient:
+    """GitHub REST GET 客户端：按 URL 缓存 ETag/Last-Modified，条件请求返回 304 时从磁盘回放。
+
+    缓存按最近使用做 LRU，条目数超过 cache_max_entries 时淘汰最久未用的。
+
+    304 不计入 GitHub 主速率限制；同时跟踪 X-RateLimit-* 配额，低余量时节流并让调用方跳过可选请求，
+    遇到 403/429 限流按 Retry-After 等待重试。传入 pool_tokens 时每个请求选剩余配额最多的 token，
+    某个 token 耗尽后立即切到下一个。线程安全，可在并发抓取中共用一个实例。
+    """
+
+    def __init__(
+        self,
+        token: Optional[str],
+        timeout: int,
+        cache_dir: Optional[str] = None,
+        rate_policy: Optional[Dict[str, Any]] = None,
+        pool_tokens: Optional[List[str]] = None,
+        session: Optional[requests.Session] = None,
+        cache_max_entries: int = DEFAULT_HTTP_CACHE_MAX_ENTRIES,
+    ) -> None:
+        self.token = token or ""
+        self.tokens: List[str] = []
+        for item in [self.token] + list(pool_tokens or []):
+            if item and item not in self.tokens:
+                self.tokens.append(item)
+        if not self.token and self.tokens:
+            self.token = self.tokens[0]
+        self.timeout = timeout
+        # 批量 explore 时多个客户端共用一个 Session，复用 keep-alive 连接池。
+        self.session = session
+        self.cache_root = Path(cache_dir).expanduser() if cache_dir else None
+        self.cache_max_entries = max(0, int(cache_max_entries))
+        self.rate_policy = dict(DEFAULT_RATE_LIMIT_POLICY)
+        self.rate_policy.update(rate_policy or {})
+        self.stats = {
+            "hits": 0,
+            "misses": 0,
+            "stored": 0,
+            "errors": 0,
+            "rate_limited": 0,
+            "paced": 0,
+            "failover": 0,
+        }
+        self._lock = threading.Lock()
+
+    def _bump(self, name: str) -> None:
+        with self._lock:
+            self.stats[name] += 1
+
+    def _cache_path(self, url: str, params: Optional[Dict[str, Any]]) -> Optional[Path]:
+        if self.cache_root is None:
+            return None
+        # token 参与 key：不同身份可见的私有仓库内容不同，不能互相回放。
+        # 轮换的 pool token 共用主 token 的缓存身份（同一组 token 应有相同可见范围）。
+        raw = json.dumps(
+            {"url": url, "params": sorted((params or {}).items()), "identity": _identity(self.token)},
+            default=str,
+        )
+        key = hashlib.sha256(raw.encode("utf-8")).hexdigest()[:32]
+        return self.cache_root / key[:2] / ("%s.json" % key)
+
+    def _load(self, path: Optional[Path]) -> Optional[Dict[str, Any]]:
+        if path is None:
+            return None
+        try:
+            entry = json.loads(path.read_text(encoding="utf-8"))
+        except Exception:
+            return None
+        return entry if isinstance(entry, dict) and "body" in entry else None
+
+    def _store(self, path: Optional[Path], url: str, response: Any) -> None:
+        headers = getattr(response, "headers", None) or {}
+        etag = headers.get("ETag") or headers.get("etag") or ""
+        last_modified = headers.get("Last-Modified") or headers.get("last-modified") or ""
+        if path is None or not (etag or last_modified):
+            return
+        try:
+            path.parent.mkdir(parents=True, exist_ok=True)
+            entry = {
+                "url": url,
+                "etag": etag,
+                "last_modified": last_modified,
+                "body": response.text,
+                "stored_at": int(time.time()),
+            }
+            tmp = path.with_name("%s.%s.%s.tmp" % (path.name, os.getpid(), threading.get_ident()))
+            tmp.write_text(json.dumps(entry, ensure_ascii=False), encoding="utf-8")
+            os.replace(str(tmp), str(path))
+            self._bump("stored")
+        except Exception:
+            self._bump("errors")
+            return
+        self._enforce()
+
+    def _enforce(self) -> None:
+        if self.cache_root is None or self.cache_max_entries <= 0:
+            return
+        key = str(self.cache_root)
+        now = time.monotonic()
+        with _ENFORCE_LOCK:
+            last = _LAST_ENFORCED.get(key)
+            if last is not None and now - last < _ENFORCE_INTERVAL_SECONDS:
+                return
+            _LAST_ENFORCED[key] = now
+        prune_http_cache(self.cache_root, self.cache_max_entries)
+
+    def _token_quota(self, token: str, resource: str) -> Optional[Dict[str, int]]:
+        with _RATE_LOCK:
+            state = _RATE_STATE.get((_identity(token), resource))
+            return dict(state) if state else None
+
+    def quota(self, resource: str = "core") -> Optional[Dict[str, int]]:
+        """已知配额；多个 token 时合并（remaining 求和），全部未知返回 None。"""
+        states = [state for state in (self._token_quota(token, resource) for token in self.tokens or [""]) if state]
+        return _aggregate(states) if states else None
+
+    def _available(self, token: str, resource: str) -> Optional[int]:
+        """token 当前可用余量；未知或已过 reset 时返回 None。"""
+        state = self._token_quota(token, resource)
+        if state is None or (state["reset"] and state["reset"] <= time.time()):
+            return None
+        return state["remaining"]
+
+    def pick_token(self, resource: str = "core") -> str:
+        """选剩余配额最多的 token；未知配额视为满额，并列时保持配置顺序（主 token 优先）。"""
+        if len(self.tokens) <= 1:
+            return self.token
+        best, best_remaining = self.tokens[0], -1.0
+        for token in self.tokens:
+            available = self._available(token, resource)
+            remaining = float("inf") if available is None else float(available)
+            if remaining > best_remaining:
+                best, best_remaining = token, remaining
+        return best
+
+    def optional_budget(self) -> Optional[int]:
+        """还能发多少个可选请求（所有 token 合计）；任一 token 配额未知时返回 None（不限制）。"""
+        total = 0
+        for token in self.tokens or [""]:
+            available = self._available(token, "core")
+            if available is None:
+                return None
+            total += available
+        return max(0, total - int(self.rate_policy["optional_reserve"]))
+
+    def _pace(self, token: str, resource: str = "core") -> None:
+        state = self._token_quota(token, resource)
+        if state is None or state["remaining"] >= int(self.rate_policy["pace_below"]):
+            return
+        window = state["reset"] - time.time()
+        if window <= 0:
+            return
+        interval = min(float(self.rate_policy["max_pace_seconds"]), window / max(1, state["remaining"]))
+        identity = "%s:%s" % (_identity(token), resource)
+        # 在锁内预约时间片，锁外睡眠，并发线程依次错开。
+        with _RATE_LOCK:
+            now = time.time()
+            slot = max(now, _LAST_REQUEST_AT.get(identity, 0.0) + interval)
+            _LAST_REQUEST_AT[identity] = slot
+        if slot > now:
+            self._bump("paced")
+            time.sleep(slot - now)
+
+    def _retry_wait(self, response: Any) -> Optional[float]:
+        if response.status_code not in {403, 429}:
+            return None
+        headers = getattr(response, "headers", None) or {}
+        retry_after = _header(headers, "Retry-After")
+        if retry_after:
+            try:
+                return max(0.0, float(retry_after))
+            except ValueError:
+                return None
+        if _header(headers, "X-RateLimit-Remaining") == "0":
+            try:
+                return max(0.0, float(_header(headers, "X-RateLimit-Reset")) - time.time() + 1)
+            except ValueError:
+                return None
+        return None
+
+    def _request(
+        self,
+        url: str,
+        conditional: Dict[str, str],
+        params: Optional[Dict[str, Any]],
+        json_body: Optional[Dict[str, Any]] = None,
+        resource: str = "core",
+    ) -> Any:
+        """GET（json_body 为 None）或 POST；选 token、节流、记录配额、限流重试与 token 切换都在这里。"""
+        max_retries = max(0, int(self.rate_policy["max_retries"]))
+        attempt = 0
+        failovers = 0
+        while True:
+            token = self.pick_token(resource)
+            self._pace(token, resource)
+            headers = github_headers(token)
+            headers.update(conditional)
+            if json_body is None:
+                http_get = self.session.get if self.session is not None else requests.get
+                response = http_get(url, headers=headers, params=params, timeout=self.timeout)
+            else:
+                http_post = self.session.post if self.session is not None else requests.post
+                response = http_post(url, headers=headers, json=json_body, timeout=self.timeout)
+            record_rate_limit(token, getattr(response, "headers", None))
+            wait = self._retry_wait(response)
+            if wait is None:
+                return response
+            self._bump("rate_limited")
+            # 还有别的 token 余量更多时直接切过去，不等这个 token 的 reset。
+            if failovers < len(self.tokens) - 1 and self.pick_token(resource) != token:
+                failovers += 1
+                self._bump("failover")
+                continue
+            if attempt >= max_retries or wait > float(self.rate_policy["max_retry_wait_seconds"]):
+                return response
+            attempt += 1
+            time.sleep(wait)
+
+    def get(self, url: str, params: Optional[Dict[str, Any]] = None) -> Any:
+        path = self._cache_path(url, params)
+        cached = self._load(path)
+        conditional: Dict[str, str] = {}
+        if cached is not None:
+            if cached.get("etag"):
+                conditional["If-None-Match"] = cached["etag"]
+            if cached.get("last_modified"):
+                conditional["If-Modified-Since"] = cached["last_modified"]
+        response = self._request(url, conditional, params)
+        if response.status_code == 304 and cached is not None:
+            self._bump("hits")
+            # 命中刷新 mtime，LRU 淘汰时保留常用条目。
+            try:
+                os.utime(str(path), None)
+            except OSError:
+                pass
+            return CachedResponse(url, cached["body"], {"ETag": cached.get("etag", "")})
+        self._bump("misses")
+        if response.status_code == 200:
+            self._store(path, url, response)
+        return response
+
+    def post(self, url: str, json_body: Dict[str, Any], resource: str = "graphql") -> Any:
+        """GraphQL 等 POST 请求：不缓存，但与 GET 共用节流、配额记录和限流重试。"""
+        return self._request(url, {}, None, json_body=json_body, resource=resource)
+
+    def stats_note(self) -> str:
+        with self._lock:
+            return "github_cache:hits=%s,misses=%s,stored=%s" % (
+                self.stats["hits"],
+                self.stats["misses"],
+                self.stats["stored"],
+            )
+
+    def quota_note(self, resource: str = "core") -> str:
+        state = self.quota(resource)
+        with self._lock:
+            limited, paced, failover = self.stats["rate_limited"], self.stats["paced"], self.stats["failover"]
+        # 只有多 token 时才带 tokens/failover，单 token 的 note 形状保持不变。
+        pool = ",tokens=%s,failover=%s" % (len(self.tokens), failover) if len(self.tokens) > 1 else ""
+        if state is None:
+            return "github_quota:unknown,rate_limited=%s,paced=%s%s" % (limited, paced, pool)
+        return "github_quota:remaining=%s/%s,reset=%s,rate_limited=%s,paced=%s%s" % (
+            state["remaining"],
+            state["limit"],
+            state["reset"],
+            limited,
+            paced,
+            pool,
+        )
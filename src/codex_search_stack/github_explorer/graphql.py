@@ -0,0 +1,170 @@
+from typing import Any, Dict, List, Optional, Tuple
+
+from .github_client import GitHubClient
+
+GITHUB_GRAPHQL_URL = "https://api.github.com/graphql"
+_COMMENTS_PER_ISSUE = 30
+# 与 REST /readme 的自动识别不同，GraphQL 只能按路径取 blob，这里覆盖最常见的几种命名。
+_README_ALIASES = {
+    "readmeMd": "HEAD:README.md",
+    "readmeLowerMd": "HEAD:readme.md",
+    "readmeRst": "HEAD:README.rst",
+    "readmePlain": "HEAD:README",
+}
+
+REPO_QUERY = """
+query($owner: String!, $name: String!, $issues: Int!, $commits: Int!, $comments: Int!) {
+  repository(owner: $owner, name: $name) {
+    nameWithOwner
+    url
+    description
+    primaryLanguage { name }
+    repositoryTopics(first: 20) { nodes { topic { name } } }
+    licenseInfo { spdxId }
+    stargazerCount
+    forkCount
+    updatedAt
+    pushedAt
+    openIssueCount: issues(states: OPEN) { totalCount }
+    openPullRequestCount: pullRequests(states: OPEN) { totalCount }
+%(readme)s
+    topIssues: issues(first: $issues, states: OPEN, orderBy: {field: COMMENTS, direction: DESC}) {
+      nodes {
+        number
+        title
+        url
+        body
+        state
+        updatedAt
+        authorAssociation
+        author { login }
+        comments(first: $comments) {
+          totalCount
+          nodes { authorAssociation author { login } }
+        }
+      }
+    }
+    defaultBranchRef {
+      target {
+        ... on Commit {
+          history(first: $commits) {
+            nodes { oid message committedDate url }
+          }
+        }
+      }
+    }
+  }
+}
+""" % {
+    "readme": "\n".join(
+        '    %s: object(expression: "%s") { ... on Blob { text } }' % (alias, expression)
+        for alias, expression in _README_ALIASES.items()
+    )
+}
+
+
+def fetch_repository(
+    owner: str,
+    repo: str,
+    client: GitHubClient,
+    issues_limit: int,
+    commits_limit: int,
+) -> Tuple[Optional[Dict[str, Any]], List[str]]:
+    """一次 GraphQL 请求取回 repo/README/issues(含评论作者身份)/commits；返回 (repository 节点, 部分错误)。
+
+    请求经由 client 发出：按 graphql 配额选 token、节流、记录 X-RateLimit-* 并处理限流重试。
+    请求失败或 repository 为空时抛异常，由调用方回退到 REST。
+    """
+    response = client.post(
+        GITHUB_GRAPHQL_URL,
+        {
+            "query": REPO_QUERY,
+            "variables": {
+                "owner": owner,
+                "name": repo,
+                "issues": max(1, min(int(issues_limit), 100)),
+                "commits": max(1, min(int(commits_limit), 100)),
+                "comments": _COMMENTS_PER_ISSUE,
+            },
+        },
+    )
+    response.raise_for_status()
+    payload = response.json() or {}
+    errors = [str((item or {}).get("message") or item) for item in (payload.get("errors") or [])]
+    node = (payload.get("data") or {}).get("repository")
+    if not node:
+        raise RuntimeError("; ".join(errors) or "repository not returned")
+    return node, errors
+
+
+def to_rest_repo_info(node: Dict[str, Any]) -> Tuple[Dict[str, Any], str]:
+    """转换为 REST /repos/{owner}/{repo} 的字段形状，另返回 README 原文。"""
+    topics = [
+        ((item or {}).get("topic") or {}).get("name", "")
+        for item in ((node.get("repositoryTopics") or {}).get("nodes") or [])
+    ]
+    open_issues = int((node.get("openIssueCount") or {}).get("totalCount") or 0)
+    open_pulls = int((node.get("openPullRequestCount") or {}).get("totalCount") or 0)
+    readme = ""
+    for alias in _README_ALIASES:
+        readme = ((node.get(alias) or {}).get("text")) or ""
+        if readme:
+            break
+    info = {
+        "full_name": node.get("nameWithOwner", ""),
+        "html_url": node.get("url", ""),
+        "description": node.get("description") or "",
+        "language": (node.get("primaryLanguage") or {}).get("name", ""),
+        "topics": [name for name in topics if name],
+        "license": {"spdx_id": (node.get("licenseInfo") or {}).get("spdxId") or ""},
+        "stargazers_count": node.get("stargazerCount", 0),
+        "forks_count": node.get("forkCount", 0),
+        # REST 的 open_issues_count 包含 PR，这里保持一致。
+        "open_issues_count": open_issues + open_pulls,
+        "updated_at": node.get("updatedAt", ""),
+        "pushed_at": node.get("pushedAt", ""),
+    }
+    return info, readme
+
+
+def to_rest_issues(node: Dict[str, Any]) -> List[Tuple[Dict[str, Any], List[Dict[str, Any]]]]:
+    """转换为 (REST issue 形状, REST comment 形状列表)；GraphQL 的 issues 本身不含 PR。"""
+    out: List[Tuple[Dict[str, Any], List[Dict[str, Any]]]] = []
+    for item in ((node.get("topIssues") or {}).get("nodes") or []):
+        if not item:
+            continue
+        comments = item.get("comments") or {}
+        issue = {
+            "number": item.get("number"),
+            "title": item.get("title", ""),
+            "html_url": item.get("url", ""),
+            "body": item.get("body") or "",
+            "state": str(item.get("state") or "").lower(),
+            "updated_at": item.get("updatedAt", ""),
+            "comments": int(comments.get("totalCount") or 0),
+            "author_association": item.get("authorAssociation", ""),
+            "user": {"login": (item.get("author") or {}).get("login", "")},
+        }
+        comment_rows = [
+            {
+                "author_association": (comment or {}).get("authorAssociation", ""),
+                "user": {"login": ((comment or {}).get("author") or {}).get("login", "")},
+            }
+            for comment in (comments.get("nodes") or [])
+        ]
+        out.append((issue, comment_rows))
+    return out
+
+
+def to_rest_commits(node: Dict[str, Any]) -> List[Dict[str, Any]]:
+    target = ((node.get("defaultBranchRef") or {}).get("target")) or {}
+    history = ((target.get("history") or {}).get("nodes")) or []
+    return [
+        {
+            "sha": item.get("oid", ""),
+            "commit": {"message": item.get("message", ""), "committer": {"date": item.get("committedDate", "")}},
+            "html_url": item.get("url", ""),
+        }
+        for item in history
+        if item
+    ]
@@ -1,6 +1,14 @@
 import base64
+import codecs
+import hashlib
+import json
+import os
 import re
+import time
+from concurrent.futures import FIRST_COMPLETED, ThreadPoolExecutor, as_completed, wait
+from concurrent.futures import TimeoutError as FuturesTimeout
 from datetime import datetime, timezone
+from pathlib import Path
 from typing import Dict, List, Optional, Tuple
 from urllib.parse import urlparse
 
@@ -8,7 +16,13 @@ import requests
 
 from ..config import Settings
 from ..extract.pipeline import run_extract_pipeline
+from ..extract.projection import projection_summary
+from ..key_pool import build_service_candidates
 from ..search.orchestrator import run_multi_source_search
+from . import graphql as github_graphql
+from .artifacts import find_latest_report, report_generated_at
+from .explore_cache import ExploreCache, explore_cache_for
+from .github_client import DEFAULT_HTTP_CACHE_MAX_ENTRIES, GITHUB_API_BASE, GitHubClient, rate_limit_snapshot
 
 _GITHUB_REPO_PATH = re.compile(r"^([A-Za-z0-9_.-]+)/([A-Za-z0-9_.-]+)$")
 _RISKY_HOSTS = {
@@ -37,6 +51,18 @@ _COMMUNITY_DOMAINS = [
     "x.com",
     "twitter.com",
 ]
+_DEFAULT_GITHUB_CONCURRENCY = 8
+_DEFAULT_EXTERNAL_CONCURRENCY = 4
+_DEFAULT_EXTRACT_CONCURRENCY = 4
+_DEFAULT_EXTRACT_DEADLINE_SECONDS = 120.0
+# 增量模式一页拉取 since 之后更新过的 issue；整页都满说明变化太多，直接回退完整抓取。
+_INCREMENTAL_ISSUES_PAGE = 100
+_DEFAULT_INDEX_PROBE_POLICY = {
+    # 找到 anchor 与 <title> 前最多读取的字节数。
+    "max_bytes": 262144,
+    # not_indexed 结论的磁盘缓存有效期；0 表示不缓存。
+    "negative_ttl_seconds": 86400,
+}
 _PAPER_DOMAINS = ["arxiv.org"]
 _INDEX_DOMAINS = ["deepwiki.com", "zread.ai", "zread.cc", "zread.net"]
 _COMPETE_HINTS = ["alternative", "alternatives", "vs", "compare", "comparison", "替代", "对比", "竞品"]
@@ -137,16 +163,6 @@ def _repo_from_target(target: str) -> Optional[Tuple[str, str]]:
     return match.group(1), match.group(2)
 
 
-def _github_headers(token: Optional[str]) -> Dict[str, str]:
-    headers = {
-        "Accept": "application/vnd.github+json",
-        "User-Agent": "codex-search",
-    }
-    if token:
-        headers["Authorization"] = "Bearer %s" % token
-    return headers
-
-
 def _infer_project_stage(pushed_at: Optional[str]) -> str:
     if not pushed_at:
         return "未知"
@@ -290,6 +306,19 @@ def _normalize_sources(value: object, fallback: List[str]) -> List[str]:
     return out or list(fallback)
 
 
+def _index_probe_policy(settings: Settings) -> Dict[str, int]:
+    policy = getattr(settings, "policy", {})
+    explore = policy.get("explore") if isinstance(policy, dict) else None
+    raw = explore.get("index_probe") if isinstance(explore, dict) else None
+    merged = dict(_DEFAULT_INDEX_PROBE_POLICY)
+    for key, default in _DEFAULT_INDEX_PROBE_POLICY.items():
+        try:
+            merged[key] = max(0, int((raw or {}).get(key, default))) if isinstance(raw, dict) else default
+        except Exception:
+            merged[key] = default
+    return merged
+
+
 def _external_timeout_seconds(settings: Settings) -> int:
     external_policy = _policy_explore_external(settings)
     raw = external_policy.get("timeout_seconds")
@@ -322,6 +351,86 @@ def _external_followup_rounds(settings: Settings) -> int:
     return max(0, min(value, 4))
 
 
+def _external_concurrency(settings: Settings) -> int:
+    external_policy = _policy_explore_external(settings)
+    raw = external_policy.get("concurrency")
+    if raw is None:
+        return _DEFAULT_EXTERNAL_CONCURRENCY
+    try:
+        value = int(raw)
+    except Exception:
+        value = _DEFAULT_EXTERNAL_CONCURRENCY
+    return max(1, min(value, 16))
+
+
+def _external_hedge_fraction(settings: Settings) -> Optional[float]:
+    """对冲启动点（主检索预算的比例）；未开启时返回 None。"""
+    hedge = _policy_explore_external(settings).get("hedge")
+    if not isinstance(hedge, dict) or not hedge.get("enabled"):
+        return None
+    try:
+        value = float(hedge.get("after_fraction", 0.5))
+    except Exception:
+        value = 0.5
+    return max(0.0, min(value, 1.0))
+
+
+def _explore_extract_policy(settings: Settings) -> Tuple[int, float]:
+    """(并发数, 整体截止秒数)；截止 <= 0 表示不设上限。"""
+    policy = getattr(settings, "policy", {})
+    explore = policy.get("explore") if isinstance(policy, dict) else None
+    raw = explore.get("extract") if isinstance(explore, dict) else None
+    raw = raw if isinstance(raw, dict) else {}
+    try:
+        concurrency = max(1, min(int(raw.get("concurrency", _DEFAULT_EXTRACT_CONCURRENCY)), 16))
+    except Exception:
+        concurrency = _DEFAULT_EXTRACT_CONCURRENCY
+    try:
+        deadline = float(raw.get("deadline_seconds", _DEFAULT_EXTRACT_DEADLINE_SECONDS))
+    except Exception:
+        deadline = _DEFAULT_EXTRACT_DEADLINE_SECONDS
+    return concurrency, deadline
+
+
+def _extract_external_items(items: List[Dict], settings: Settings) -> List[str]:
+    """并发提取，完成一个就写回对应 item["extract"]；共享截止时间到了仍未完成的记为超时，不再等待。"""
+    if not items:
+        return []
+    concurrency, deadline = _explore_extract_policy(settings)
+    notes: List[str] = []
+    pool = ThreadPoolExecutor(max_workers=min(concurrency, len(items)))
+    futures = {
+        pool.submit(run_extract_pipeline, url=item["url"], settings=settings, max_chars=1200, include_markdown=False): item
+        for item in items
+    }
+    try:
+        for future in as_completed(futures, timeout=deadline if deadline > 0 else None):
+            item = futures[future]
+            try:
+                out = future.result()
+            except Exception as exc:
+                item["extract"] = {"ok": False, "engine": "", "notes": ["extract_exception:%s" % exc], "summary": ""}
+                continue
+            item["extract"] = {
+                "ok": out.ok,
+                "engine": out.engine,
+                "notes": out.notes,
+                "summary": projection_summary(out, 280),
+            }
+            handle = getattr(getattr(out, "artifacts", None), "content_handle", None)
+            if handle:
+                item["extract"]["content_handle"] = handle
+    except FuturesTimeout:
+        timed_out = [item for future, item in futures.items() if not future.done()]
+        for item in timed_out:
+            item["extract"] = {"ok": False, "engine": "", "notes": ["extract_deadline_exceeded"], "summary": ""}
+        notes.append("external_extract_timeout:%s/%s" % (len(timed_out), len(items)))
+    finally:
+        # 超时的提取留在后台线程里自然结束，不等待；尚未开始的直接取消。
+        pool.shutdown(wait=False, cancel_futures=True)
+    return notes
+
+
 def _external_fallback_source(settings: Settings) -> str:
     external_policy = _policy_explore_external(settings)
     value = str(external_policy.get("fallback_source") or "").strip().lower()
@@ -502,6 +611,27 @@ def _title_from_html(content: str, fallback: str) -> str:
     return _trim_text(raw, 120)
 
 
+def _read_index_page(response, anchor: str, anchor_in_url: bool, max_bytes: int) -> str:
+    """流式读取正文：拿到 <title> 且确认 anchor（URL 或正文中）后即停止，最多读 max_bytes。"""
+    iter_content = getattr(response, "iter_content", None)
+    if iter_content is None:
+        return (response.text or "")[:max_bytes]
+    # 索引站点都是 UTF-8；不用 response.encoding，避免无 charset 时被 requests 猜成 ISO-8859-1。
+    decoder = codecs.getincrementaldecoder("utf-8")(errors="ignore")
+    content = ""
+    read = 0
+    for chunk in iter_content(chunk_size=8192):
+        if not chunk:
+            continue
+        read += len(chunk)
+        content += decoder.decode(chunk)
+        if _HTML_TITLE_RE.search(content) and (anchor_in_url or anchor in content.lower()):
+            break
+        if read >= max_bytes:
+            break
+    return content
+
+
 def _probe_index_page(
     name: str,
     url: str,
@@ -514,20 +644,29 @@ def _probe_index_page(
     timeout = max(int(getattr(settings, "search_timeout_seconds", 30) or 30), 5)
     headers = {"User-Agent": "codex-search"}
     try:
-        response = requests.get(url, headers=headers, timeout=timeout, allow_redirects=True)
+        response = requests.get(url, headers=headers, timeout=timeout, allow_redirects=True, stream=True)
     except Exception as exc:
         return None, "%s_unavailable:%s" % (name, exc)
 
-    if response.status_code >= 400:
-        if response.status_code == 404:
+    try:
+        if response.status_code >= 400:
+            if response.status_code == 404:
+                return None, "%s_unavailable:not_indexed" % name
+            return None, "%s_unavailable:http_%s" % (name, response.status_code)
+
+        anchor = ("%s/%s" % (owner, repo)).lower()
+        final_url = response.url or url
+        anchor_in_url = anchor in final_url.lower()
+        try:
+            content = _read_index_page(response, anchor, anchor_in_url, _index_probe_policy(settings)["max_bytes"])
+        except Exception as exc:
+            return None, "%s_unavailable:%s" % (name, exc)
+        if not anchor_in_url and anchor not in content.lower():
             return None, "%s_unavailable:not_indexed" % name
-        return None, "%s_unavailable:http_%s" % (name, response.status_code)
-
-    content = response.text or ""
-    anchor = ("%s/%s" % (owner, repo)).lower()
-    final_url = response.url or url
-    if (anchor not in final_url.lower()) and (anchor not in content.lower()):
-        return None, "%s_unavailable:not_indexed" % name
+    finally:
+        close = getattr(response, "close", None)
+        if close is not None:
+            close()
 
     item = {
         "title": _title_from_html(content, fallback_title),
@@ -539,7 +678,42 @@ def _probe_index_page(
     return item, ""
 
 
+def _index_negative_path(settings: Settings, name: str, owner: str, repo: str) -> Optional[Path]:
+    root = getattr(settings, "github_cache_dir", "") or ""
+    if not root or _index_probe_policy(settings)["negative_ttl_seconds"] <= 0:
+        return None
+    key = hashlib.sha256(("%s:%s/%s" % (name, owner, repo)).lower().encode("utf-8")).hexdigest()[:24]
+    return Path(root).expanduser() / "index-probe" / ("%s-%s.json" % (name, key))
+
+
+def _index_negative_cached(settings: Settings, name: str, owner: str, repo: str) -> bool:
+    path = _index_negative_path(settings, name, owner, repo)
+    if path is None:
+        return False
+    try:
+        entry = json.loads(path.read_text(encoding="utf-8"))
+        checked_at = float(entry.get("checked_at") or 0)
+    except Exception:
+        return False
+    return time.time() - checked_at < _index_probe_policy(settings)["negative_ttl_seconds"]
+
+
+def _remember_index_negative(settings: Settings, name: str, owner: str, repo: str) -> None:
+    path = _index_negative_path(settings, name, owner, repo)
+    if path is None:
+        return
+    try:
+        path.parent.mkdir(parents=True, exist_ok=True)
+        tmp = path.with_name("%s.%s.tmp" % (path.name, os.getpid()))
+        tmp.write_text(json.dumps({"repo": "%s/%s" % (owner, repo), "checked_at": int(time.time())}), encoding="utf-8")
+        os.replace(str(tmp), str(path))
+    except Exception:
+        pass
+
+
 def _collect_deepwiki(owner: str, repo: str, settings: Settings) -> Tuple[Optional[Dict], List[str]]:
+    if _index_negative_cached(settings, "deepwiki", owner, repo):
+        return None, ["deepwiki_unavailable:not_indexed", "deepwiki_negative_cache_hit"]
     item, note = _probe_index_page(
         name="deepwiki",
         url="https://deepwiki.com/%s/%s" % (owner, repo),
@@ -549,10 +723,14 @@ def _collect_deepwiki(owner: str, repo: str, settings: Settings) -> Tuple[Option
         snippet="DeepWiki repository knowledge graph",
         fallback_title="%s/%s DeepWiki" % (owner, repo),
     )
+    if note == "deepwiki_unavailable:not_indexed":
+        _remember_index_negative(settings, "deepwiki", owner, repo)
     return item, ([note] if note else [])
 
 
 def _collect_zread(owner: str, repo: str, settings: Settings) -> Tuple[Optional[Dict], List[str]]:
+    if _index_negative_cached(settings, "zread", owner, repo):
+        return None, ["zread_unavailable:not_indexed", "zread_negative_cache_hit"]
     candidates = [
         "https://zread.ai/%s/%s" % (owner, repo),
         "https://zread.ai/github/%s/%s" % (owner, repo),
@@ -560,23 +738,40 @@ def _collect_zread(owner: str, repo: str, settings: Settings) -> Tuple[Optional[
         "https://zread.net/%s/%s" % (owner, repo),
     ]
     errors: List[str] = []
-    for url in candidates:
-        item, note = _probe_index_page(
-            name="zread",
-            url=url,
-            owner=owner,
-            repo=repo,
-            settings=settings,
-            snippet="zread repository index",
-            fallback_title="%s/%s zread" % (owner, repo),
-        )
-        if item:
-            return item, []
-        if note and (note not in errors):
-            errors.append(note)
-    if not errors:
-        return None, ["zread_unavailable:not_indexed"]
-    if any("not_indexed" in note for note in errors):
+    # 候选同时探测，谁先命中用谁，不再等其它候选（某个域名挂起也不拖慢结果）；
+    # 都没命中时错误注记仍按候选顺序汇总。
+    pool = ThreadPoolExecutor(max_workers=len(candidates))
+    try:
+        futures = [
+            pool.submit(
+                _probe_index_page,
+                name="zread",
+                url=url,
+                owner=owner,
+                repo=repo,
+                settings=settings,
+                snippet="zread repository index",
+                fallback_title="%s/%s zread" % (owner, repo),
+            )
+            for url in candidates
+        ]
+        pending = set(futures)
+        while pending:
+            done, pending = wait(pending, return_when=FIRST_COMPLETED)
+            for future in done:
+                item, _ = future.result()
+                if item:
+                    return item, []
+        for future in futures:
+            _, note = future.result()
+            if note and (note not in errors):
+                errors.append(note)
+    finally:
+        pool.shutdown(wait=False, cancel_futures=True)
+    if all("not_indexed" in note for note in errors):
+        # 只有全部候选都明确未收录时才缓存，超时/5xx 不缓存。
+        _remember_index_negative(settings, "zread", owner, repo)
+    if not errors or any("not_indexed" in note for note in errors):
         return None, ["zread_unavailable:not_indexed"]
     return None, [errors[0]]
 
@@ -596,18 +791,35 @@ def _run_external_query(
     notes: List[str] = []
     failed_count = 0
     primary_budget_ms = max(timeout_seconds, 1) * 1000 * max(1, len(primary_sources))
-    result = run_multi_source_search(
-        query=query,
-        settings=settings,
-        mode="deep",
-        limit=fetch_limit,
-        intent=query_intent,
-        boost_domains=boost_domains,
-        sources=primary_sources,
-        model_profile=model_profile,
-        budget_max_calls=max(1, len(primary_sources)),
-        budget_max_latency_ms=primary_budget_ms,
-    )
+    fallback_budget_ms = max(timeout_seconds, 1) * 1000
+
+    def search(sources: List[str], budget_ms: int):
+        return run_multi_source_search(
+            query=query,
+            settings=settings,
+            mode="deep",
+            limit=fetch_limit,
+            intent=query_intent,
+            boost_domains=boost_domains,
+            sources=sources,
+            model_profile=model_profile,
+            budget_max_calls=max(1, len(sources)),
+            budget_max_latency_ms=budget_ms,
+        )
+
+    hedge_fraction = _external_hedge_fraction(settings)
+    if hedge_fraction is not None and fallback_source not in primary_sources:
+        return _run_hedged_external_query(
+            search,
+            query_tag=query_tag,
+            primary_sources=primary_sources,
+            primary_budget_ms=primary_budget_ms,
+            fallback_source=fallback_source,
+            fallback_budget_ms=fallback_budget_ms,
+            hedge_after_seconds=primary_budget_ms * hedge_fraction / 1000.0,
+        )
+
+    result = search(primary_sources, primary_budget_ms)
     notes.extend(result.notes)
     failed_count += len([item for item in (result.notes or []) if "_failed" in item])
 
@@ -615,19 +827,7 @@ def _run_external_query(
     if rows:
         return rows, notes, failed_count
 
-    fallback_budget_ms = max(timeout_seconds, 1) * 1000
-    fallback = run_multi_source_search(
-        query=query,
-        settings=settings,
-        mode="deep",
-        limit=fetch_limit,
-        intent=query_intent,
-        boost_domains=boost_domains,
-        sources=[fallback_source],
-        model_profile=model_profile,
-        budget_max_calls=1,
-        budget_max_latency_ms=fallback_budget_ms,
-    )
+    fallback = search([fallback_source], fallback_budget_ms)
     notes.extend(fallback.notes)
     failed_count += len([item for item in (fallback.notes or []) if "_failed" in item])
     if fallback.results:
@@ -635,6 +835,54 @@ def _run_external_query(
     return list(fallback.results), notes, failed_count
 
 
+def _run_hedged_external_query(
+    search,
+    query_tag: str,
+    primary_sources: List[str],
+    primary_budget_ms: int,
+    fallback_source: str,
+    fallback_budget_ms: int,
+    hedge_after_seconds: float,
+) -> Tuple[List, List[str], int]:
+    """主检索超过 hedge_after_seconds 仍未返回时并行启动回退源，谁先带结果返回用谁。
+
+    主检索在对冲点之前就空手返回时与串行路径相同，直接回退；输掉的一方不再等待，其 notes 不计入。
+    """
+    notes: List[str] = []
+    failed_count = 0
+    pool = ThreadPoolExecutor(max_workers=2)
+    try:
+        primary = pool.submit(search, primary_sources, primary_budget_ms)
+        labels = {primary: "primary"}
+        hedged = False
+        done, _ = wait([primary], timeout=hedge_after_seconds)
+        if not done:
+            hedged = True
+            notes.append("external_query_hedged:%s:%s" % (fallback_source, query_tag))
+            labels[pool.submit(search, [fallback_source], fallback_budget_ms)] = fallback_source
+        pending = set(labels)
+        while pending:
+            done, pending = wait(pending, return_when=FIRST_COMPLETED)
+            # 同时完成时主检索优先，与串行路径的偏好一致。
+            for future in sorted(done, key=lambda item: labels[item] != "primary"):
+                result = future.result()
+                notes.extend(result.notes)
+                failed_count += len([item for item in (result.notes or []) if "_failed" in item])
+                if result.results:
+                    if hedged:
+                        notes.append("external_query_hedge_winner:%s:%s" % (labels[future], query_tag))
+                    if labels[future] != "primary":
+                        notes.append("external_query_fallback_%s:%s" % (fallback_source, query_tag))
+                    return list(result.results), notes, failed_count
+                if not hedged and labels[future] == "primary":
+                    fallback = pool.submit(search, [fallback_source], fallback_budget_ms)
+                    labels[fallback] = fallback_source
+                    pending.add(fallback)
+        return [], notes, failed_count
+    finally:
+        pool.shutdown(wait=False, cancel_futures=True)
+
+
 def _followup_terms(owner: str, repo: str, merged: List[Dict]) -> List[str]:
     tokens: Dict[str, int] = {}
     owner_l = owner.lower()
@@ -848,143 +1096,597 @@ def _resolve_repo(target: str, settings: Settings) -> Tuple[Optional[str], Optio
     return None, None, notes
 
 
+def _github_concurrency(settings: Settings) -> int:
+    policy = getattr(settings, "policy", {})
+    explore = policy.get("explore") if isinstance(policy, dict) else None
+    github = explore.get("github") if isinstance(explore, dict) else None
+    raw = github.get("concurrency") if isinstance(github, dict) else None
+    if raw is None:
+        return _DEFAULT_GITHUB_CONCURRENCY
+    try:
+        value = int(raw)
+    except Exception:
+        value = _DEFAULT_GITHUB_CONCURRENCY
+    return max(1, min(value, 32))
+
+
+def _fetch_repo_info(client: GitHubClient, base: str) -> Dict:
+    repo_resp = client.get(base)
+    repo_resp.raise_for_status()
+    return repo_resp.json()
+
+
+def _fetch_readme_excerpt(client: GitHubClient, base: str) -> Tuple[str, List[str]]:
+    try:
+        readme_resp = client.get(base + "/readme")
+        if readme_resp.status_code != 200:
+            return "", ["readme_api_skipped:http_%s" % readme_resp.status_code]
+        readme_payload = readme_resp.json()
+        return (
+            _decode_github_readme(readme_payload.get("content", ""), readme_payload.get("encoding", "")),
+            [],
+        )
+    except Exception as exc:
+        return "", ["readme_api_failed:%s" % exc]
+
+
+def _fetch_open_issues(client: GitHubClient, base: str, issues_limit: int) -> List[Dict]:
+    issues_resp = client.get(
+        base + "/issues",
+        params={"state": "open", "sort": "comments", "direction": "desc", "per_page": max(issues_limit * 2, 10)},
+    )
+    issues_resp.raise_for_status()
+    # issues 接口会混入 PR，先过滤再截断，只为真正入选的 issue 拉评论。
+    return [item for item in issues_resp.json() if "pull_request" not in item][: max(issues_limit, 0)]
+
+
+def _count_maintainers(item: Dict, comments: List[Dict]) -> Tuple[int, List[str]]:
+    maintainer_comments = 0
+    maintainer_logins: List[str] = []
+    if _is_maintainer_association(item.get("author_association", "")):
+        maintainer_comments += 1
+        if item.get("user", {}).get("login"):
+            maintainer_logins.append(item["user"]["login"])
+    for comment in comments:
+        if _is_maintainer_association(comment.get("author_association", "")):
+            maintainer_comments += 1
+            login = (comment.get("user") or {}).get("login", "")
+            if login and login not in maintainer_logins:
+                maintainer_logins.append(login)
+    return maintainer_comments, maintainer_logins
+
+
+def _issue_entry(item: Dict, maintainer_comments: int, maintainer_logins: List[str]) -> Dict:
+    risk_tags = _issue_risk_tags(item.get("title", ""), item.get("body", "") or "")
+    return {
+        "number": item.get("number"),
+        "title": item.get("title", ""),
+        "url": item.get("html_url", ""),
+        "comments": item.get("comments", 0),
+        "state": item.get("state", ""),
+        "updated_at": item.get("updated_at", ""),
+        "risk_tags": risk_tags,
+        "maintainer_participated": maintainer_comments > 0,
+        "maintainer_comment_count": maintainer_comments,
+        "maintainer_logins": maintainer_logins[:3],
+        "quality_score": _issue_quality_score(
+            comments=item.get("comments", 0),
+            maintainer_comment_count=maintainer_comments,
+            risk_tags=risk_tags,
+            updated_at=item.get("updated_at", ""),
+        ),
+    }
+
+
+def _rescore_issue(issue: Dict) -> Dict:
+    """上次报告里的 issue 条目按当前评分规则重算 quality_score（字段本身未变，不需要重新请求）。"""
+    node = dict(issue)
+    node["quality_score"] = _issue_quality_score(
+        comments=int(node.get("comments", 0) or 0),
+        maintainer_comment_count=int(node.get("maintainer_comment_count", 0) or 0),
+        risk_tags=list(node.get("risk_tags") or []),
+        updated_at=node.get("updated_at", ""),
+    )
+    return node
+
+
+def _sort_issues(issues: List[Dict]) -> None:
+    issues.sort(
+        key=lambda node: (
+            int(node.get("quality_score", 0)),
+            int(node.get("comments", 0)),
+            node.get("updated_at", ""),
+        ),
+        reverse=True,
+    )
+
+
+def _commit_entry(item: Dict) -> Dict:
+    commit = item.get("commit") or {}
+    meta = commit.get("committer") or {}
+    return {
+        "sha": (item.get("sha") or "")[:7],
+        "message": _trim_text(commit.get("message", ""), 140),
+        "date": meta.get("date", ""),
+        "url": item.get("html_url", ""),
+    }
+
+
+def _fetch_issue_maintainers(client: GitHubClient, item: Dict) -> Tuple[int, List[str], List[str]]:
+    """返回 (维护者评论数, 维护者 login, notes)；评论请求失败不影响 issue 本身入选。"""
+    maintainer_comments, maintainer_logins = _count_maintainers(item, [])
+    comments_url = item.get("comments_url") or ""
+    if not (item.get("comments", 0) and comments_url):
+        return maintainer_comments, maintainer_logins, []
+    try:
+        comments_resp = client.get(comments_url, params={"per_page": min(max(item.get("comments", 0), 5), 30)})
+        if comments_resp.status_code != 200:
+            return (
+                maintainer_comments,
+                maintainer_logins,
+                ["issue_comments_skipped:#%s:http_%s" % (item.get("number"), comments_resp.status_code)],
+            )
+        maintainer_comments, maintainer_logins = _count_maintainers(item, comments_resp.json())
+    except Exception as exc:
+        return maintainer_comments, maintainer_logins, ["issue_comments_failed:#%s:%s" % (item.get("number"), exc)]
+    return maintainer_comments, maintainer_logins, []
+
+
+def _fetch_recent_commits(client: GitHubClient, base: str, commits_limit: int, since: str = "") -> List[Dict]:
+    params: Dict[str, object] = {"per_page": max(commits_limit, 1)}
+    if since:
+        params["since"] = since
+    commits_resp = client.get(base + "/commits", params=params)
+    commits_resp.raise_for_status()
+    return [_commit_entry(item) for item in commits_resp.json()]
+
+
+def _fetch_updated_issues(client: GitHubClient, base: str, since: str) -> Tuple[List[Dict], bool]:
+    """since 之后更新过的 issue（含已关闭，不含 PR）；第二项表示是否拉满一页。"""
+    issues_resp = client.get(
+        base + "/issues",
+        params={"state": "all", "since": since, "sort": "updated", "direction": "desc", "per_page": _INCREMENTAL_ISSUES_PAGE},
+    )
+    issues_resp.raise_for_status()
+    rows = issues_resp.json()
+    return [item for item in rows if "pull_request" not in item], len(rows) >= _INCREMENTAL_ISSUES_PAGE
+
+
+def _github_tokens(settings: Settings) -> List[str]:
+    """主 token 在前，key pool 里 service=github 的行按权重在后；未启用 pool 时只有主 token。"""
+    candidates = build_service_candidates(
+        service="github",
+        primary_url=GITHUB_API_BASE,
+        primary_key=settings.github_token,
+        pool_file=getattr(settings, "key_pool_file", None),
+        pool_enabled=bool(getattr(settings, "key_pool_enabled", False)),
+    )
+    tokens: List[str] = []
+    for candidate in candidates:
+        if candidate.key not in tokens:
+            tokens.append(candidate.key)
+    return tokens
+
+
+def _github_client(settings: Settings, session: Optional[requests.Session] = None) -> GitHubClient:
+    policy = getattr(settings, "policy", {})
+    explore = policy.get("explore") if isinstance(policy, dict) else None
+    github = explore.get("github") if isinstance(explore, dict) else None
+    github = github if isinstance(github, dict) else {}
+    cache_dir = getattr(settings, "github_cache_dir", "") if github.get("http_cache", True) is not False else ""
+    rate_policy = github.get("rate_limit") if isinstance(github.get("rate_limit"), dict) else None
+    tokens = _github_tokens(settings)
+    return GitHubClient(
+        settings.github_token,
+        timeout=settings.search_timeout_seconds,
+        cache_dir=cache_dir or None,
+        rate_policy=rate_policy,
+        pool_tokens=tokens,
+        session=session,
+        cache_max_entries=int(github.get("http_cache_max_entries", DEFAULT_HTTP_CACHE_MAX_ENTRIES)),
+    )
+
+
+def _github_backend(settings: Settings) -> str:
+    policy = getattr(settings, "policy", {})
+    explore = policy.get("explore") if isinstance(policy, dict) else None
+    github = explore.get("github") if isinstance(explore, dict) else None
+    value = str((github or {}).get("backend") or "auto").strip().lower() if isinstance(github, dict) else "auto"
+    return value if value in {"auto", "graphql", "rest"} else "auto"
+
+
+def _collect_repo_data_graphql(
+    owner: str,
+    repo: str,
+    settings: Settings,
+    client: GitHubClient,
+    issues_limit: int,
+    commits_limit: int,
+) -> Tuple[Dict, List[Dict], List[Dict], List[str]]:
+    notes: List[str] = []
+    node, errors = github_graphql.fetch_repository(
+        owner,
+        repo,
+        client,
+        issues_limit=issues_limit,
+        commits_limit=commits_limit,
+    )
+    for error in errors:
+        notes.append("github_graphql_partial:%s" % error)
+    repo_info, readme = github_graphql.to_rest_repo_info(node)
+    readme_excerpt = _decode_github_readme(readme, "")
+    if readme_excerpt:
+        repo_info["readme_excerpt"] = readme_excerpt
+    else:
+        notes.append("readme_graphql_missing")
+    issues = [
+        _issue_entry(item, *_count_maintainers(item, comments))
+        for item, comments in github_graphql.to_rest_issues(node)[: max(issues_limit, 0)]
+    ]
+    _sort_issues(issues)
+    commits = [_commit_entry(item) for item in github_graphql.to_rest_commits(node)]
+    # GraphQL 是 POST，不走 ETag 缓存；照样带上缓存统计，与 REST 路径的 notes 形状一致。
+    # GraphQL 有独立的点数配额（resource=graphql），quota 注记报告的是它。
+    notes.extend([client.stats_note(), client.quota_note("graphql")])
+    return repo_info, issues, commits, notes
+
+
 def _collect_repo_data(
     owner: str,
     repo: str,
     settings: Settings,
     issues_limit: int,
     commits_limit: int,
+    session: Optional[requests.Session] = None,
 ) -> Tuple[Dict, List[Dict], List[Dict], List[str]]:
+    """有 token 时优先 GraphQL 单请求；无 token（GraphQL 不支持匿名）或 GraphQL 失败时回退 REST。"""
+    backend = _github_backend(settings)
+    client = _github_client(settings, session=session)
     notes: List[str] = []
-    headers = _github_headers(settings.github_token)
-    timeout = settings.search_timeout_seconds
-    base = "https://api.github.com/repos/%s/%s" % (owner, repo)
+    if len(client.tokens) > 1:
+        notes.append("github_token_pool:%s" % len(client.tokens))
+    if backend != "rest":
+        if client.tokens:
+            try:
+                repo_info, issues, commits, graphql_notes = _collect_repo_data_graphql(
+                    owner, repo, settings, client, issues_limit, commits_limit
+                )
+                return repo_info, issues, commits, notes + ["github_backend:graphql"] + graphql_notes
+            except Exception as exc:
+                notes.append("github_graphql_fallback:%s" % exc)
+        elif backend == "graphql":
+            notes.append("github_graphql_requires_token")
+    repo_info, issues, commits, rest_notes = _collect_repo_data_rest(
+        owner, repo, settings, client, issues_limit, commits_limit
+    )
+    return repo_info, issues, commits, notes + rest_notes
+
+
+def _collect_repo_data_cached(
+    owner: str,
+    repo: str,
+    settings: Settings,
+    issues_limit: int,
+    commits_limit: int,
+    cache: Optional[ExploreCache],
+    session: Optional[requests.Session] = None,
+) -> Tuple[Dict, List[Dict], List[Dict], List[str]]:
+    """命中缓存时只发一次 /repos 请求（通常是 ETag 304）比对 pushed_at/updated_at，未变化则复用 issues/commits/README。"""
+    if cache is None:
+        return _collect_repo_data(owner, repo, settings, issues_limit, commits_limit, session=session)
+    options = {"issues": issues_limit, "commits": commits_limit}
+    notes: List[str] = []
+    cached = cache.get("repo_data", owner, repo, options)
+    if cached:
+        cached_info = cached.get("repo_info") or {}
+        client = _github_client(settings, session=session)
+        try:
+            fresh = _fetch_repo_info(client, "%s/repos/%s/%s" % (GITHUB_API_BASE, owner, repo))
+        except Exception as exc:
+            fresh = {}
+            notes.append("explore_cache_check_skipped:%s" % exc)
+        if fresh and all(
+            fresh.get(field) and fresh.get(field) == cached_info.get(field) for field in ("pushed_at", "updated_at")
+        ):
+            repo_info = dict(fresh)
+            if cached_info.get("readme_excerpt"):
+                repo_info["readme_excerpt"] = cached_info["readme_excerpt"]
+            # 旧的 github_cache/github_quota 注记换成本次的，其余注记（如 readme 缺失）原样保留。
+            kept = [
+                note
+                for note in (cached.get("notes") or [])
+                if not note.startswith(("github_cache:", "github_quota:", "github_token_pool:"))
+            ]
+            notes = ["explore_cache_hit:repo_data"] + kept + [client.stats_note(), client.quota_note()]
+            return repo_info, list(cached.get("issues") or []), list(cached.get("commits") or []), notes
+        if fresh:
+            notes.append("explore_cache_stale:repo_data")
+    repo_info, issues, commits, repo_notes = _collect_repo_data(
+        owner, repo, settings, issues_limit, commits_limit, session=session
+    )
+    if repo_info:
+        cache.put(
+            "repo_data",
+            owner,
+            repo,
+            options,
+            {"repo_info": repo_info, "issues": issues, "commits": commits, "notes": repo_notes},
+        )
+    return repo_info, issues, commits, notes + repo_notes
+
+
+def _collect_repo_data_rest(
+    owner: str,
+    repo: str,
+    settings: Settings,
+    client: GitHubClient,
+    issues_limit: int,
+    commits_limit: int,
+) -> Tuple[Dict, List[Dict], List[Dict], List[str]]:
+    notes: List[str] = []
+    base = "%s/repos/%s/%s" % (GITHUB_API_BASE, owner, repo)
 
     repo_info: Dict = {}
     issues: List[Dict] = []
     commits: List[Dict] = []
 
+    # 第一跳：repo / readme / issues / commits 互不依赖，同时发出；
+    # 第二跳：只有 issue 评论依赖 issues 列表，拿到后在同一个池里扇出。notes 仍按原串行顺序拼接。
+    pool = ThreadPoolExecutor(max_workers=_github_concurrency(settings))
     try:
-        repo_resp = requests.get(base, headers=headers, timeout=timeout)
-        repo_resp.raise_for_status()
-        repo_info = repo_resp.json()
-    except Exception as exc:
-        notes.append("repo_api_failed:%s" % exc)
-        return repo_info, issues, commits, notes
-
-    try:
-        readme_resp = requests.get(base + "/readme", headers=headers, timeout=timeout)
-        if readme_resp.status_code == 200:
-            readme_payload = readme_resp.json()
-            readme_excerpt = _decode_github_readme(
-                readme_payload.get("content", ""),
-                readme_payload.get("encoding", ""),
-            )
+        repo_future = pool.submit(_fetch_repo_info, client, base)
+        # README 与 issue 评论是可选请求：已知配额逼近保留线时提前跳过，把余量留给必需请求。
+        readme_future = None
+        budget = client.optional_budget()
+        if budget is None or budget > 0:
+            readme_future = pool.submit(_fetch_readme_excerpt, client, base)
+        issues_future = pool.submit(_fetch_open_issues, client, base, issues_limit)
+        commits_future = pool.submit(_fetch_recent_commits, client, base, commits_limit)
+
+        try:
+            repo_info = repo_future.result()
+        except Exception as exc:
+            notes.append("repo_api_failed:%s" % exc)
+            notes.extend([client.stats_note(), client.quota_note()])
+            return repo_info, issues, commits, notes
+
+        if readme_future is None:
+            notes.append("github_quota_skip:readme")
+        else:
+            readme_excerpt, readme_notes = readme_future.result()
             if readme_excerpt:
                 repo_info["readme_excerpt"] = readme_excerpt
-        else:
-            notes.append("readme_api_skipped:http_%s" % readme_resp.status_code)
-    except Exception as exc:
-        notes.append("readme_api_failed:%s" % exc)
+            notes.extend(readme_notes)
+
+        try:
+            raw_issues = issues_future.result()
+            # 第一跳之后配额已知：评论请求数不超过可选预算，按 issue 的原始（评论数降序）顺序分配。
+            budget = client.optional_budget()
+            comment_futures = []
+            skipped = 0
+            for item in raw_issues:
+                if not (item.get("comments", 0) and item.get("comments_url")):
+                    comment_futures.append(None)
+                elif budget is not None and budget <= 0:
+                    comment_futures.append(None)
+                    skipped += 1
+                else:
+                    comment_futures.append(pool.submit(_fetch_issue_maintainers, client, item))
+                    budget = None if budget is None else budget - 1
+            for item, future in zip(raw_issues, comment_futures):
+                if future is None:
+                    maintainer_comments, maintainer_logins = _count_maintainers(item, [])
+                else:
+                    maintainer_comments, maintainer_logins, comment_notes = future.result()
+                    notes.extend(comment_notes)
+                issues.append(_issue_entry(item, maintainer_comments, maintainer_logins))
+            _sort_issues(issues)
+            if skipped:
+                notes.append("github_quota_skip:comments:%s" % skipped)
+        except Exception as exc:
+            notes.append("issues_api_failed:%s" % exc)
+
+        try:
+            commits = commits_future.result()
+        except Exception as exc:
+            notes.append("commits_api_failed:%s" % exc)
+        notes.extend([client.stats_note(), client.quota_note()])
+    finally:
+        # repo 失败提前返回时不等仍在飞的请求。
+        pool.shutdown(wait=False, cancel_futures=True)
 
-    try:
-        issues_resp = requests.get(
-            base + "/issues",
-            headers=headers,
-            params={"state": "open", "sort": "comments", "direction": "desc", "per_page": max(issues_limit * 2, 10)},
-            timeout=timeout,
-        )
-        issues_resp.raise_for_status()
-        raw_issues = issues_resp.json()
-        for item in raw_issues:
-            if "pull_request" in item:
-                continue
-            risk_tags = _issue_risk_tags(item.get("title", ""), item.get("body", "") or "")
-            maintainer_comments = 0
-            maintainer_logins: List[str] = []
-            if _is_maintainer_association(item.get("author_association", "")):
-                maintainer_comments += 1
-                if item.get("user", {}).get("login"):
-                    maintainer_logins.append(item["user"]["login"])
-
-            comments_url = item.get("comments_url") or ""
-            if item.get("comments", 0) and comments_url:
-                try:
-                    comments_resp = requests.get(
-                        comments_url,
-                        headers=headers,
-                        params={"per_page": min(max(item.get("comments", 0), 5), 30)},
-                        timeout=timeout,
-                    )
-                    if comments_resp.status_code == 200:
-                        for comment in comments_resp.json():
-                            if _is_maintainer_association(comment.get("author_association", "")):
-                                maintainer_comments += 1
-                                login = (comment.get("user") or {}).get("login", "")
-                                if login and login not in maintainer_logins:
-                                    maintainer_logins.append(login)
-                    else:
-                        notes.append("issue_comments_skipped:#%s:http_%s" % (item.get("number"), comments_resp.status_code))
-                except Exception as exc:
-                    notes.append("issue_comments_failed:#%s:%s" % (item.get("number"), exc))
-
-            issues.append(
-                {
-                    "number": item.get("number"),
-                    "title": item.get("title", ""),
-                    "url": item.get("html_url", ""),
-                    "comments": item.get("comments", 0),
-                    "state": item.get("state", ""),
-                    "updated_at": item.get("updated_at", ""),
-                    "risk_tags": risk_tags,
-                    "maintainer_participated": maintainer_comments > 0,
-                    "maintainer_comment_count": maintainer_comments,
-                    "maintainer_logins": maintainer_logins[:3],
-                    "quality_score": _issue_quality_score(
-                        comments=item.get("comments", 0),
-                        maintainer_comment_count=maintainer_comments,
-                        risk_tags=risk_tags,
-                        updated_at=item.get("updated_at", ""),
-                    ),
-                }
-            )
-            if len(issues) >= issues_limit:
-                break
+    return repo_info, issues, commits, notes
 
-        issues.sort(
-            key=lambda node: (
-                int(node.get("quality_score", 0)),
-                int(node.get("comments", 0)),
-                node.get("updated_at", ""),
-            ),
-            reverse=True,
-        )
-    except Exception as exc:
-        notes.append("issues_api_failed:%s" % exc)
 
+def _collect_repo_data_incremental(
+    owner: str,
+    repo: str,
+    settings: Settings,
+    previous: Dict,
+    since: str,
+    issues_limit: int,
+    commits_limit: int,
+    session: Optional[requests.Session] = None,
+) -> Tuple[Dict, List[Dict], List[Dict], List[str], List[int]]:
+    """只拉 since 之后的 commits/issues 并合并进上次报告；另返回本次确认已关闭的 issue 编号。
+
+    未更新的 issue 评论数不会变，上次入选的 issue 都还开着时，「上次入选 + 本次更新过的 open issue」
+    按评论数重选即与完整抓取一致；一旦有入选 issue 关闭，榜外未更新的 issue 可能补位，
+    这时重新拉一次 open 列表按评论数重选（已知且未更新的 issue 复用维护者统计，不再拉评论）。
+    复用的 issue 会按当前规则重算 quality_score。README 只在 pushed_at 变化时重取。
+    变化太多（issue 拉满一页）时回退完整抓取。
+    """
+    client = _github_client(settings, session=session)
+    base = "%s/repos/%s/%s" % (GITHUB_API_BASE, owner, repo)
+    previous_repo = previous.get("repo") or {}
+    notes: List[str] = ["explore_incremental:since=%s" % since]
+    if len(client.tokens) > 1:
+        notes.append("github_token_pool:%s" % len(client.tokens))
+
+    repo_info: Dict = {}
+    issues: List[Dict] = []
+    commits: List[Dict] = [dict(commit) for commit in (previous.get("commits") or [])][: max(commits_limit, 0)]
+    closed: List[int] = []
+
+    pool = ThreadPoolExecutor(max_workers=_github_concurrency(settings))
     try:
-        commits_resp = requests.get(
-            base + "/commits",
-            headers=headers,
-            params={"per_page": max(commits_limit, 1)},
-            timeout=timeout,
-        )
-        commits_resp.raise_for_status()
-        for item in commits_resp.json():
-            commit = item.get("commit") or {}
-            meta = commit.get("committer") or {}
-            commits.append(
-                {
-                    "sha": (item.get("sha") or "")[:7],
-                    "message": _trim_text(commit.get("message", ""), 140),
-                    "date": meta.get("date", ""),
-                    "url": item.get("html_url", ""),
-                }
+        repo_future = pool.submit(_fetch_repo_info, client, base)
+        issues_future = pool.submit(_fetch_updated_issues, client, base, since)
+        commits_future = pool.submit(_fetch_recent_commits, client, base, commits_limit, since)
+
+        try:
+            repo_info = repo_future.result()
+        except Exception as exc:
+            notes.append("repo_api_failed:%s" % exc)
+            notes.extend([client.stats_note(), client.quota_note()])
+            return repo_info, issues, commits, notes, closed
+
+        try:
+            updated, overflow = issues_future.result()
+        except Exception as exc:
+            notes.append("issues_api_failed:%s" % exc)
+            updated, overflow = [], False
+        if overflow:
+            pool.shutdown(wait=False, cancel_futures=True)
+            repo_info, issues, commits, full_notes = _collect_repo_data(
+                owner, repo, settings, issues_limit, commits_limit, session=session
             )
-    except Exception as exc:
-        notes.append("commits_api_failed:%s" % exc)
+            return repo_info, issues, commits, notes + ["explore_incremental_overflow:issues"] + full_notes, closed
 
-    return repo_info, issues, commits, notes
+        if previous_repo.get("readme_excerpt") and repo_info.get("pushed_at") == previous_repo.get("pushed_at"):
+            repo_info["readme_excerpt"] = previous_repo["readme_excerpt"]
+        else:
+            readme_excerpt, readme_notes = _fetch_readme_excerpt(client, base)
+            if readme_excerpt:
+                repo_info["readme_excerpt"] = readme_excerpt
+            notes.extend(readme_notes)
+
+        merged = {issue.get("number"): _rescore_issue(issue) for issue in (previous.get("issues") or [])}
+        # 评论请求与完整抓取一样受可选预算约束：配额逼近保留线时跳过，
+        # 上次报告里已有的 issue 沿用当时的维护者统计，新 issue 只按作者身份计。
+        budget = client.optional_budget()
+        skipped = 0
+
+        def _submit_maintainers(item: Dict):
+            nonlocal budget, skipped
+            # 没有评论的 issue 不发请求，不占预算。
+            if item.get("comments", 0) and item.get("comments_url"):
+                if budget is not None and budget <= 0:
+                    skipped += 1
+                    return None
+                budget = None if budget is None else budget - 1
+            return pool.submit(_fetch_issue_maintainers, client, item)
+
+        def _merge_issue(item: Dict, future) -> None:
+            if future is not None:
+                maintainer_comments, maintainer_logins, comment_notes = future.result()
+                notes.extend(comment_notes)
+            elif item.get("number") in merged:
+                known = merged[item.get("number")]
+                maintainer_comments = int(known.get("maintainer_comment_count", 0) or 0)
+                maintainer_logins = list(known.get("maintainer_logins") or [])
+            else:
+                maintainer_comments, maintainer_logins = _count_maintainers(item, [])
+            merged[item.get("number")] = _issue_entry(item, maintainer_comments, maintainer_logins)
+
+        comment_futures = []
+        for item in updated:
+            if item.get("state") != "open":
+                closed.append(item.get("number"))
+            else:
+                comment_futures.append((item, _submit_maintainers(item)))
+        dropped = [number for number in closed if number in merged]
+        for number in closed:
+            merged.pop(number, None)
+        for item, future in comment_futures:
+            _merge_issue(item, future)
+        if dropped:
+            try:
+                raw_open = _fetch_open_issues(client, base, issues_limit)
+            except Exception as exc:
+                notes.append("explore_incremental_rerank_failed:%s" % exc)
+            else:
+                notes.append("explore_incremental_rerank:closed=%s" % len(dropped))
+                # 补位 issue 的评论请求发出前配额已更新，重新取一次预算。
+                budget = client.optional_budget()
+                refill = []
+                for item in raw_open:
+                    if item.get("number") not in merged:
+                        refill.append((item, _submit_maintainers(item)))
+                for item, future in refill:
+                    _merge_issue(item, future)
+        if skipped:
+            notes.append("github_quota_skip:comments:%s" % skipped)
+        # 与完整抓取一样先按评论数取前 N，再按质量分排序。
+        issues = sorted(merged.values(), key=lambda node: int(node.get("comments", 0)), reverse=True)
+        issues = issues[: max(issues_limit, 0)]
+        _sort_issues(issues)
+
+        try:
+            fresh = commits_future.result()
+            shas = set(commit.get("sha") for commit in fresh)
+            commits = (fresh + [commit for commit in commits if commit.get("sha") not in shas])[: max(commits_limit, 0)]
+        except Exception as exc:
+            notes.append("commits_api_failed:%s" % exc)
+        notes.extend([client.stats_note(), client.quota_note()])
+    finally:
+        pool.shutdown(wait=False, cancel_futures=True)
+
+    return repo_info, issues, commits, notes, closed
+
+
+def _incremental_changes(previous: Dict, report: Dict, closed: List[int]) -> Dict:
+    """对比上次报告，给新增/更新的行打 change 标记（上次报告里的旧标记先清掉），并汇总变化。"""
+    previous_repo = previous.get("repo") or {}
+    repo_changes: Dict[str, Dict] = {}
+    for field in ("description", "stars", "forks", "open_issues", "license", "pushed_at", "project_stage"):
+        before, after = previous_repo.get(field), (report.get("repo") or {}).get(field)
+        if before != after:
+            repo_changes[field] = {"before": before, "after": after}
+
+    known_shas = set(commit.get("sha") for commit in (previous.get("commits") or []))
+    new_commits: List[str] = []
+    for commit in report.get("commits") or []:
+        commit.pop("change", None)
+        if commit.get("sha") not in known_shas:
+            commit["change"] = "new"
+            new_commits.append(commit.get("sha", ""))
+
+    known_issues = {issue.get("number"): issue for issue in (previous.get("issues") or [])}
+    new_issues: List[int] = []
+    updated_issues: List[int] = []
+    for issue in report.get("issues") or []:
+        issue.pop("change", None)
+        before = known_issues.get(issue.get("number"))
+        if before is None:
+            issue["change"] = "new"
+            new_issues.append(issue.get("number"))
+        elif before.get("updated_at") != issue.get("updated_at"):
+            issue["change"] = "updated"
+            updated_issues.append(issue.get("number"))
+
+    known_urls = set(item.get("url") for item in (previous.get("external") or []))
+    current_urls = set()
+    new_external: List[str] = []
+    for item in report.get("external") or []:
+        item.pop("change", None)
+        current_urls.add(item.get("url"))
+        if item.get("url") not in known_urls:
+            item["change"] = "new"
+            new_external.append(item.get("url", ""))
+    dropped_external = [
+        item.get("url", "") for item in (previous.get("external") or []) if item.get("url") not in current_urls
+    ]
+
+    return {
+        "repo": repo_changes,
+        "new_commits": new_commits,
+        "new_issues": new_issues,
+        "updated_issues": updated_issues,
+        "closed_issues": [number for number in closed if number in known_issues],
+        "new_external": new_external,
+        "dropped_external": dropped_external,
+    }
 
 
 def _collect_external(
@@ -994,6 +1696,8 @@ def _collect_external(
     external_limit: int,
     extract_top: int,
     with_extract: bool,
+    cache: Optional[ExploreCache] = None,
+    known_extracts: Optional[Dict[str, Dict]] = None,
 ) -> Tuple[List[Dict], List[str], List[Dict], Dict[str, Dict[str, str]]]:
     notes: List[str] = []
     external_timeout = _external_timeout_seconds(settings)
@@ -1004,10 +1708,19 @@ def _collect_external(
         "external_search_profile:model=%s,timeout=%s,fallback=%s,followup_rounds=%s"
         % (external_model, external_timeout, fallback_source, followup_rounds)
     )
-    deepwiki_item, deepwiki_notes = _collect_deepwiki(owner, repo, settings)
-    notes.extend(deepwiki_notes)
-    zread_item, zread_notes = _collect_zread(owner, repo, settings)
-    notes.extend(zread_notes)
+    # DeepWiki/zread 探测与外部检索互不依赖，只在最后挑选 external 时用到：放到后台与查询波次重叠，
+    # notes 仍插回原来的位置。
+    probe_pool = ThreadPoolExecutor(max_workers=2)
+    # index 阶段缓存只存命中（收录页面），未收录交给 index_probe.negative_ttl_seconds 的负缓存，
+    # 否则「未收录」会按 index 的 7 天 TTL 粘住；缓存里缺的那一侧照常探测。
+    cached_index = (cache.get("index", owner, repo) if cache is not None else None) or {}
+    deepwiki_future = None
+    zread_future = None
+    if not cached_index.get("deepwiki"):
+        deepwiki_future = probe_pool.submit(_collect_deepwiki, owner, repo, settings)
+    if not cached_index.get("zread"):
+        zread_future = probe_pool.submit(_collect_zread, owner, repo, settings)
+    probe_notes_at = len(notes)
     queries = _build_external_queries(owner, repo)
     merged: List[Dict] = []
     competitor_scores: Dict[str, Dict[str, object]] = {}
@@ -1052,70 +1765,85 @@ def _collect_external(
                         "score": comp_score,
                     }
 
-    for query_spec in queries:
-        query = str(query_spec.get("query") or "").strip()
-        query_intent = str(query_spec.get("intent") or "exploratory")
-        query_tag = str(query_spec.get("tag") or "")
-        boost_domains = [str(item).strip() for item in (query_spec.get("boost_domains") or []) if str(item).strip()]
-        primary_sources = _preferred_sources_for_query(query_tag, settings)
-        if not query:
-            continue
-        rows, query_notes, failed = _run_external_query(
-            query=query,
-            query_intent=query_intent,
-            query_tag=query_tag,
-            boost_domains=boost_domains,
-            fetch_limit=fetch_limit,
-            settings=settings,
-            primary_sources=primary_sources,
-            model_profile=external_model,
-            timeout_seconds=external_timeout,
-            fallback_source=fallback_source,
-        )
-        notes.extend(query_notes)
-        failed_count += failed
-        append_rows(rows, query_tag=query_tag)
-
-    seen_followup_queries = set()
-    for round_idx in range(1, followup_rounds + 1):
-        followups = _build_followup_queries(owner, repo, merged, list(competitor_scores.values()))
-        followups = [item for item in followups if str(item.get("query") or "").strip() not in seen_followup_queries]
-        if not followups:
-            break
-        notes.append("external_followup_queries:%s" % len(followups))
-        notes.append("external_followup_round:%s:queries:%s" % (round_idx, len(followups)))
-        round_added = 0
-        for query_spec in followups:
+    def run_wave(pool: ThreadPoolExecutor, specs: List[Dict[str, object]], default_tag: str) -> List[Tuple]:
+        """同一波查询互不依赖，全部提交后按提交顺序取结果，合并顺序与串行执行一致。"""
+        submitted = []
+        for query_spec in specs:
             query = str(query_spec.get("query") or "").strip()
-            query_intent = str(query_spec.get("intent") or "exploratory")
-            query_tag = str(query_spec.get("tag") or "followup")
-            boost_domains = [str(item).strip() for item in (query_spec.get("boost_domains") or []) if str(item).strip()]
-            primary_sources = _preferred_sources_for_query(query_tag, settings)
+            query_tag = str(query_spec.get("tag") or default_tag)
             if not query:
                 continue
-            seen_followup_queries.add(query)
-            before = len(merged)
-            rows, query_notes, failed = _run_external_query(
+            future = pool.submit(
+                _run_external_query,
                 query=query,
-                query_intent=query_intent,
+                query_intent=str(query_spec.get("intent") or "exploratory"),
                 query_tag=query_tag,
-                boost_domains=boost_domains,
+                boost_domains=[
+                    str(item).strip() for item in (query_spec.get("boost_domains") or []) if str(item).strip()
+                ],
                 fetch_limit=fetch_limit,
                 settings=settings,
-                primary_sources=primary_sources,
+                primary_sources=_preferred_sources_for_query(query_tag, settings),
                 model_profile=external_model,
                 timeout_seconds=external_timeout,
                 fallback_source=fallback_source,
             )
+            submitted.append((query, query_tag, future))
+        return [(query, query_tag) + tuple(future.result()) for query, query_tag, future in submitted]
+
+    pool = ThreadPoolExecutor(max_workers=_external_concurrency(settings))
+    try:
+        for _, query_tag, rows, query_notes, failed in run_wave(pool, queries, ""):
             notes.extend(query_notes)
             failed_count += failed
             append_rows(rows, query_tag=query_tag)
-            delta = len(merged) - before
-            round_added += max(0, delta)
-            notes.append("external_followup_used:%s:%s" % (query_tag, len(rows)))
-        if round_added <= 0:
-            notes.append("external_followup_round:%s:no_new_rows" % round_idx)
-            break
+
+        seen_followup_queries = set()
+        for round_idx in range(1, followup_rounds + 1):
+            followups = _build_followup_queries(owner, repo, merged, list(competitor_scores.values()))
+            followups = [
+                item for item in followups if str(item.get("query") or "").strip() not in seen_followup_queries
+            ]
+            if not followups:
+                break
+            notes.append("external_followup_queries:%s" % len(followups))
+            notes.append("external_followup_round:%s:queries:%s" % (round_idx, len(followups)))
+            round_added = 0
+            for query, query_tag, rows, query_notes, failed in run_wave(pool, followups, "followup"):
+                seen_followup_queries.add(query)
+                before = len(merged)
+                notes.extend(query_notes)
+                failed_count += failed
+                append_rows(rows, query_tag=query_tag)
+                delta = len(merged) - before
+                round_added += max(0, delta)
+                notes.append("external_followup_used:%s:%s" % (query_tag, len(rows)))
+            if round_added <= 0:
+                notes.append("external_followup_round:%s:no_new_rows" % round_idx)
+                break
+    finally:
+        pool.shutdown(wait=False, cancel_futures=True)
+        probe_pool.shutdown(wait=False)
+
+    if deepwiki_future is None:
+        deepwiki_item, deepwiki_notes = cached_index["deepwiki"], []
+    else:
+        deepwiki_item, deepwiki_notes = deepwiki_future.result()
+    if zread_future is None:
+        zread_item, zread_notes = cached_index["zread"], []
+    else:
+        zread_item, zread_notes = zread_future.result()
+    if cached_index:
+        notes.insert(probe_notes_at, "explore_cache_hit:index")
+        probe_notes_at += 1
+    positive = {name: item for name, item in (("deepwiki", deepwiki_item), ("zread", zread_item)) if item}
+    # 只有本次新探测到命中才写缓存，避免每次重写把旧命中的有效期无限续上。
+    if cache is not None and ((deepwiki_future is not None and deepwiki_item) or (zread_future is not None and zread_item)):
+        cache.put("index", owner, repo, None, positive)
+    # 探测结果会被插入 selected 并在下面被修改，缓存里的对象不能共享。
+    deepwiki_item = dict(deepwiki_item) if deepwiki_item else None
+    zread_item = dict(zread_item) if zread_item else None
+    notes[probe_notes_at:probe_notes_at] = deepwiki_notes + zread_notes
 
     ranked = sorted(
         merged,
@@ -1187,14 +1915,17 @@ def _collect_external(
             selected,
             key=lambda item: 0 if (urlparse(item.get("url", "")).hostname or "").lower() in _RISKY_HOSTS else 1,
         )
-        for item in prioritized[:extract_top]:
-            out = run_extract_pipeline(url=item["url"], settings=settings, max_chars=1200)
-            item["extract"] = {
-                "ok": out.ok,
-                "engine": out.engine,
-                "notes": out.notes,
-                "summary": _trim_text(out.markdown or "", 280),
-            }
+        targets = prioritized[:extract_top]
+        # 增量模式：上次已成功提取过的链接直接沿用，只提取新出现的。
+        reused = 0
+        for item in targets:
+            prior = (known_extracts or {}).get(item.get("url", ""))
+            if prior and prior.get("ok"):
+                item["extract"] = dict(prior)
+                reused += 1
+        notes.extend(_extract_external_items([item for item in targets if "extract" not in item], settings))
+        if reused:
+            notes.append("external_extract_reused:%s" % reused)
     return selected, notes, competitors, coverage
 
 
@@ -1207,7 +1938,12 @@ def run_github_explorer(
     extract_top: int = 2,
     with_extract: bool = True,
     confidence_profile: str = "deep",
+    session: Optional[requests.Session] = None,
+    incremental: bool = False,
+    previous_report: Optional[Dict] = None,
 ) -> Dict:
+    """incremental=True 时找该仓库最近一次落盘的报告（或直接用 previous_report），只拉 since 之后的变化并合并。"""
+    generated_at = datetime.now(timezone.utc).strftime("%Y-%m-%dT%H:%M:%SZ")
     owner, repo, resolve_notes = _resolve_repo(target, settings)
     if not owner or not repo:
         return {
@@ -1217,10 +1953,64 @@ def run_github_explorer(
             "error": "无法解析 GitHub 仓库，请直接传入 URL 或 owner/repo",
         }
 
-    repo_info, issues, commits, repo_notes = _collect_repo_data(owner, repo, settings, issues_limit, commits_limit)
-    external, external_notes, competitors, index_coverage = _collect_external(
-        owner, repo, settings, external_limit, extract_top, with_extract
-    )
+    cache = explore_cache_for(settings)
+    previous: Optional[Dict] = None
+    previous_path = ""
+    if previous_report is not None:
+        previous = previous_report
+    elif incremental:
+        previous, previous_path = find_latest_report("%s/%s" % (owner, repo))
+    if previous is not None and (
+        not previous.get("ok")
+        or str((previous.get("repo") or {}).get("full_name") or "").lower() != ("%s/%s" % (owner, repo)).lower()
+    ):
+        previous = None
+    since = report_generated_at(previous) if previous is not None else ""
+    if (incremental or previous_report is not None) and not since:
+        previous = None
+        resolve_notes.append("explore_incremental_skipped:no_previous_report")
+
+    closed: List[int] = []
+    if previous is not None:
+        repo_info, issues, commits, repo_notes, closed = _collect_repo_data_incremental(
+            owner, repo, settings, previous, since, issues_limit, commits_limit, session=session
+        )
+    else:
+        repo_info, issues, commits, repo_notes = _collect_repo_data_cached(
+            owner, repo, settings, issues_limit, commits_limit, cache, session=session
+        )
+    known_extracts = {
+        item["url"]: item["extract"]
+        for item in ((previous or {}).get("external") or [])
+        if item.get("url") and isinstance(item.get("extract"), dict)
+    }
+    external_options = {"external_limit": external_limit, "extract_top": extract_top, "with_extract": with_extract}
+    cached_external = cache.get("external", owner, repo, external_options) if cache is not None else None
+    if cached_external:
+        external = list(cached_external.get("external") or [])
+        external_notes = ["explore_cache_hit:external"] + list(cached_external.get("notes") or [])
+        competitors = list(cached_external.get("competitors") or [])
+        index_coverage = dict(cached_external.get("index_coverage") or {})
+    else:
+        external, external_notes, competitors, index_coverage = _collect_external(
+            owner, repo, settings, external_limit, extract_top, with_extract, cache=cache, known_extracts=known_extracts
+        )
+        # 外部源大面积失败时注入的是种子兜底结果、提取超时的结果不完整，都不缓存，下次重新检索。
+        if cache is not None and not any(
+            note.startswith(("external_failure_seed_injected:", "external_extract_timeout:")) for note in external_notes
+        ):
+            cache.put(
+                "external",
+                owner,
+                repo,
+                external_options,
+                {
+                    "external": external,
+                    "notes": external_notes,
+                    "competitors": competitors,
+                    "index_coverage": index_coverage,
+                },
+            )
     all_notes = resolve_notes + repo_notes + external_notes
 
     repo_url = "https://github.com/%s/%s" % (owner, repo)
@@ -1252,6 +2042,7 @@ def run_github_explorer(
     )
     report = {
         "ok": True,
+        "generated_at": generated_at,
         "repo": repo_block,
         "issues": issues,
         "commits": commits,
@@ -1261,4 +2052,13 @@ def run_github_explorer(
         "confidence": confidence,
         "notes": all_notes,
     }
+    if previous is not None:
+        report["incremental"] = {
+            "since": since,
+            "previous_report": previous_path,
+            "changes": _incremental_changes(previous, report, closed),
+        }
+    quota = rate_limit_snapshot(_github_tokens(settings) or settings.github_token)
+    if quota:
+        report["github_quota"] = quota
     return report
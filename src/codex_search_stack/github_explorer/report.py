@@ -56,6 +56,28 @@ def render_markdown(report: Dict) -> str:
     lines.append("- 最近推送: %s" % (repo.get("pushed_at") or "未知"))
     lines.append("- 阶段判断: %s" % (repo.get("project_stage") or "未知"))
     lines.append("")
+    incremental = report.get("incremental") or {}
+    if incremental:
+        changes = incremental.get("changes") or {}
+        lines.append("**🔄 增量变化**")
+        lines.append("")
+        lines.append("- 基线: %s (%s)" % (incremental.get("since", ""), incremental.get("previous_report") or "指定报告"))
+        for field, delta in (changes.get("repo") or {}).items():
+            lines.append("- %s: %s -> %s" % (field, delta.get("before"), delta.get("after")))
+        lines.append(
+            "- 新提交: %s | 新 Issue: %s | 更新 Issue: %s | 关闭 Issue: %s"
+            % (
+                len(changes.get("new_commits") or []),
+                ", ".join("#%s" % number for number in changes.get("new_issues") or []) or "无",
+                ", ".join("#%s" % number for number in changes.get("updated_issues") or []) or "无",
+                ", ".join("#%s" % number for number in changes.get("closed_issues") or []) or "无",
+            )
+        )
+        lines.append(
+            "- 外部信号: 新增 %s / 移出 %s"
+            % (len(changes.get("new_external") or []), len(changes.get("dropped_external") or []))
+        )
+        lines.append("")
     lines.append("**✅ 结果置信度**")
     lines.append("")
     if not confidence:
@@ -90,7 +112,7 @@ def render_markdown(report: Dict) -> str:
             maintainer_count = issue.get("maintainer_comment_count", 0)
             risk_tags = ",".join(issue.get("risk_tags") or []) or "一般"
             lines.append(
-                "- [#%s %s](%s) | q=%s | comments=%s | maintainer=%s(%s) | risk=%s | state=%s"
+                "- [#%s %s](%s) | q=%s | comments=%s | maintainer=%s(%s) | risk=%s | state=%s%s"
                 % (
                     issue.get("number"),
                     issue.get("title", "").strip(),
@@ -101,6 +123,7 @@ def render_markdown(report: Dict) -> str:
                     maintainer_count,
                     risk_tags,
                     issue.get("state", ""),
+                    " | change=%s" % issue["change"] if issue.get("change") else "",
                 )
             )
     lines.append("")
@@ -111,8 +134,14 @@ def render_markdown(report: Dict) -> str:
     else:
         for commit in commits:
             lines.append(
-                "- [`%s`](%s) %s (%s)"
-                % (commit.get("sha", ""), commit.get("url", ""), commit.get("message", ""), commit.get("date", ""))
+                "- [`%s`](%s) %s (%s)%s"
+                % (
+                    commit.get("sha", ""),
+                    commit.get("url", ""),
+                    commit.get("message", ""),
+                    commit.get("date", ""),
+                    " | change=%s" % commit["change"] if commit.get("change") else "",
+                )
             )
     lines.append("")
     lines.append("**📰 外部信号**")
@@ -121,7 +150,15 @@ def render_markdown(report: Dict) -> str:
         lines.append("- 未找到")
     else:
         for item in external:
-            lines.append("- [%s](%s) | source=%s" % (item.get("title", ""), item.get("url", ""), item.get("source", "")))
+            lines.append(
+                "- [%s](%s) | source=%s%s"
+                % (
+                    item.get("title", ""),
+                    item.get("url", ""),
+                    item.get("source", ""),
+                    " | change=%s" % item["change"] if item.get("change") else "",
+                )
+            )
             if item.get("snippet"):
                 lines.append("  - 摘要: %s" % item.get("snippet"))
             extract = item.get("extract") or {}
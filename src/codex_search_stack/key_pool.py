@@ -2,7 +2,9 @@ from dataclasses import dataclass
 from pathlib import Path
 from typing import Dict, List, Optional, Tuple
 
-SUPPORTED_SERVICES = {"grok", "tavily"}
+SUPPORTED_SERVICES = {"grok", "tavily", "github"}
+# url 列留空时的默认端点（grok/tavily 由调用方的主配置提供）。
+DEFAULT_SERVICE_URLS = {"github": "https://api.github.com"}
 
 
 @dataclass
@@ -65,7 +67,7 @@ def _parse_pool_line(
     norm_key = _normalize_key(key)
     if not norm_key:
         raise _pool_line_error(line_no, line, "empty_key")
-    endpoint = (url or default_urls.get(service) or "").strip()
+    endpoint = (url or default_urls.get(service) or DEFAULT_SERVICE_URLS.get(service) or "").strip()
     if not endpoint:
         raise _pool_line_error(line_no, line, "empty_url")
 
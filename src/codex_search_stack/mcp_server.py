@@ -1,12 +1,15 @@
+import asyncio
 import json
 import sys
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
-from typing import Dict, List, Optional
+from typing import Any, Dict, List, Optional, Tuple
 
 from .config import load_settings, resolve_config_path
 from .github_explorer import render_markdown, run_github_explorer
-from .github_explorer.artifacts import attach_book_to_result, persist_explore_artifacts
-from .research import run_research_loop
+from .github_explorer.artifacts import attach_book_to_result, book_cache_max_bytes, persist_explore_artifacts
+from .research import iter_research_events, run_research_loop
+from .research.session import is_valid_session_id
 from .search.orchestrator import run_multi_source_search
 from .extract.pipeline import run_extract_pipeline
 from .validators import (
@@ -24,6 +27,11 @@ try:
 except Exception:  # pragma: no cover - optional runtime dependency
     FastMCP = None  # type: ignore
 
+try:
+    from mcp.server.fastmcp import Context
+except Exception:  # pragma: no cover - older mcp builds without Context
+    Context = None  # type: ignore
+
 
 def _split_sources(raw: str) -> List[str]:
     if not raw:
@@ -49,6 +57,63 @@ def _error_output(code: str, message: str, details: Optional[Dict] = None) -> st
     return _json_output(payload)
 
 
+def _research_kwargs(
+    query: str,
+    mode: str,
+    intent: str,
+    freshness: str,
+    num: int,
+    domain_boost: str,
+    model_profile: str,
+    max_rounds: int,
+    extract_per_round: int,
+    extract_max_chars: int,
+    extract_strategy: str,
+    extract_concurrency: int,
+    followup_branches: int,
+    session_id: str,
+    deadline_ms: int,
+) -> Tuple[Optional[Dict[str, Any]], str]:
+    """research / research_stream 共用的参数校验与归一化；失败时返回 (None, 错误 JSON)。"""
+    normalized_intent = (intent or "").strip().lower()
+    normalized_freshness = (freshness or "").strip().lower()
+    normalized_mode = (mode or "deep").strip().lower()
+    normalized_num = coerce_int(num, 6)
+    domains = split_domain_boost(domain_boost)
+    err, details = validate_search_protocol(
+        queries=[query],
+        intent=normalized_intent,
+        freshness=normalized_freshness,
+        num=normalized_num,
+        domains=domains,
+        comparison_queries=1,
+        comparison_error_message="research tool expects single query; comparison use search-layer --queries",
+        time_signal_error_message="time-sensitive query requires freshness",
+    )
+    if err:
+        return None, _error_output(code="invalid_arguments", message=err, details=details)
+    session_id = (session_id or "").strip()
+    if session_id and not is_valid_session_id(session_id):
+        return None, _error_output(code="invalid_arguments", message="invalid session_id")
+    return {
+        "query": query,
+        "mode": normalized_mode,
+        "intent": normalized_intent or None,
+        "freshness": normalized_freshness or None,
+        "limit": max(1, normalized_num),
+        "domain_boost": domains,
+        "model_profile": (model_profile or "strong").strip().lower(),
+        "max_rounds": max(1, coerce_int(max_rounds, 3)),
+        "extract_per_round": max(0, coerce_int(extract_per_round, 2)),
+        "extract_max_chars": max(200, coerce_int(extract_max_chars, 1600)),
+        "extract_strategy": (extract_strategy or "auto").strip().lower(),
+        "extract_concurrency": coerce_int(extract_concurrency, 0) or None,
+        "followup_branches": coerce_int(followup_branches, 0) or None,
+        "session_id": session_id,
+        "deadline_ms": max(0, coerce_int(deadline_ms, 0)) or None,
+    }, ""
+
+
 _PROJECT_ROOT = Path(__file__).resolve().parents[2]
 
 
@@ -122,6 +187,7 @@ if FastMCP is not None:
         force_mineru: bool = False,
         max_chars: int = 20000,
         strategy: str = "auto",
+        include_markdown: bool = True,
     ) -> str:
         err, normalized = validate_extract_protocol(url=url, max_chars=max_chars, strategy=strategy)
         if err:
@@ -138,6 +204,7 @@ if FastMCP is not None:
             force_mineru=force_mineru,
             max_chars=int(normalized.get("max_chars", 20000)),
             strategy=str(normalized.get("strategy", "auto")),
+            include_markdown=bool(include_markdown),
         )
         payload = result.to_dict()
         if not payload.get("sources"):
@@ -161,6 +228,7 @@ if FastMCP is not None:
         out_dir: str = "",
         book_max: int = 5,
         download_book: bool = True,
+        incremental: bool = False,
     ) -> str:
         err, normalized = validate_explore_protocol(
             issues=issues,
@@ -182,6 +250,7 @@ if FastMCP is not None:
             extract_top=max(0, int(normalized.get("extract_top", 2))),
             with_extract=with_extract,
             confidence_profile=(confidence_profile or settings.confidence_profile).strip().lower(),
+            incremental=bool(incremental),
         )
         if result.get("ok"):
             attach_book_to_result(result, settings=settings, max_items=max(0, coerce_int(book_max, 5)))
@@ -196,6 +265,7 @@ if FastMCP is not None:
                 out_dir=out_dir or "",
                 download_book=download_book,
                 timeout=max(10, int(getattr(settings, "extract_timeout_seconds", 30) or 30)),
+                cache_max_bytes=book_cache_max_bytes(settings),
             )
             result["artifacts"] = artifacts
 
@@ -204,6 +274,7 @@ if FastMCP is not None:
                 markdown_text += "\n\n**📁 输出目录**\n\n"
                 markdown_text += "- %s\n" % artifacts.get("out_dir", "")
                 markdown_text += "- book_downloaded=%s\n" % artifacts.get("book_downloaded", 0)
+                markdown_text += "- book_download_reused=%s\n" % artifacts.get("book_download_reused", 0)
                 markdown_text += "- book_download_failed=%s\n" % artifacts.get("book_download_failed", 0)
             return markdown_text
         return _json_output(result)
@@ -224,41 +295,77 @@ if FastMCP is not None:
         extract_per_round: int = 2,
         extract_max_chars: int = 1600,
         extract_strategy: str = "auto",
+        extract_concurrency: int = 0,
+        followup_branches: int = 0,
+        session_id: str = "",
+        deadline_ms: int = 0,
     ) -> str:
-        normalized_intent = (intent or "").strip().lower()
-        normalized_freshness = (freshness or "").strip().lower()
-        normalized_mode = (mode or "deep").strip().lower()
-        normalized_num = coerce_int(num, 6)
-        domains = split_domain_boost(domain_boost)
-        err, details = validate_search_protocol(
-            queries=[query],
-            intent=normalized_intent,
-            freshness=normalized_freshness,
-            num=normalized_num,
-            domains=domains,
-            comparison_queries=1,
-            comparison_error_message="research tool expects single query; comparison use search-layer --queries",
-            time_signal_error_message="time-sensitive query requires freshness",
-        )
-        if err:
-            return _error_output(code="invalid_arguments", message=err, details=details)
-        settings = load_settings()
-        payload = run_research_loop(
-            query=query,
-            settings=settings,
-            mode=normalized_mode,
-            intent=normalized_intent or None,
-            freshness=normalized_freshness or None,
-            limit=max(1, normalized_num),
-            domain_boost=domains,
-            model_profile=(model_profile or "strong").strip().lower(),
-            max_rounds=max(1, coerce_int(max_rounds, 3)),
-            extract_per_round=max(0, coerce_int(extract_per_round, 2)),
-            extract_max_chars=max(200, coerce_int(extract_max_chars, 1600)),
-            extract_strategy=(extract_strategy or "auto").strip().lower(),
+        kwargs, error = _research_kwargs(
+            query, mode, intent, freshness, num, domain_boost, model_profile, max_rounds,
+            extract_per_round, extract_max_chars, extract_strategy, extract_concurrency,
+            followup_branches, session_id, deadline_ms,
         )
+        if kwargs is None:
+            return error
+        payload = run_research_loop(settings=load_settings(), **kwargs)
         return _json_output(payload)
 
+    if Context is not None:
+
+        @mcp.tool(
+            name="research_stream",
+            description="与 research 相同，但每轮 search/extract/总结完成即通过 progress 与日志通知推送，最终返回完整 JSON。",
+        )
+        async def mcp_research_stream(
+            query: str,
+            ctx: Context,
+            mode: str = "deep",
+            intent: str = "",
+            freshness: str = "",
+            num: int = 6,
+            domain_boost: str = "",
+            model_profile: str = "strong",
+            max_rounds: int = 3,
+            extract_per_round: int = 2,
+            extract_max_chars: int = 1600,
+            extract_strategy: str = "auto",
+            extract_concurrency: int = 0,
+            followup_branches: int = 0,
+            session_id: str = "",
+            deadline_ms: int = 0,
+        ) -> str:
+            kwargs, error = _research_kwargs(
+                query, mode, intent, freshness, num, domain_boost, model_profile, max_rounds,
+                extract_per_round, extract_max_chars, extract_strategy, extract_concurrency,
+                followup_branches, session_id, deadline_ms,
+            )
+            if kwargs is None:
+                return error
+            events = iter_research_events(settings=load_settings(), **kwargs)
+            # 研究循环是同步阻塞的，逐个事件放到单线程池推进，避免卡住 MCP 事件循环。
+            stepper = ThreadPoolExecutor(max_workers=1)
+            total_rounds = kwargs["max_rounds"]
+            payload: Dict[str, Any] = {}
+            try:
+                while True:
+                    event = await asyncio.wrap_future(stepper.submit(next, events, None))
+                    if event is None:
+                        break
+                    if event.get("event") == "result":
+                        payload = event.get("payload") or {}
+                        continue
+                    if event.get("event") == "round_summary":
+                        await ctx.report_progress(event.get("round", 0), total_rounds)
+                    await ctx.info(json.dumps(event, ensure_ascii=False))
+            finally:
+                # 客户端取消时 next() 可能还在线程里跑；close 排在同一个单线程池里，等它返回后再关闭生成器，
+                # 由生成器自己的 finally 释放检索线程池。
+                close = getattr(events, "close", None)
+                if close is not None:
+                    stepper.submit(close)
+                stepper.shutdown(wait=False)
+            return _json_output(payload)
+
     @mcp.tool(
         name="get_config_info",
         description="读取当前生效配置（脱敏）并返回各能力就绪状态。",
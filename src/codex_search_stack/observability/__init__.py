@@ -4,11 +4,14 @@ from .decision_trace_store import (
     collect_search_source_hits,
     persist_decision_trace_jsonl,
 )
+from .extract_host_stats import load_extract_host_stats, summarize_engine_stats
 
 __all__ = [
     "aggregate_decision_trace_jsonl",
     "collect_extract_source_hits",
     "collect_search_source_hits",
+    "load_extract_host_stats",
     "persist_decision_trace_jsonl",
+    "summarize_engine_stats",
 ]
 
@@ -0,0 +1,184 @@
+import json
+import os
+import threading
+from pathlib import Path
+from typing import Any, Dict, Optional, Tuple
+
+_SIDECAR_SUFFIX = ".extract_host_stats.json"
+_SIDECAR_VERSION = 1
+_ENGINE_ALIASES = {
+    "tavily": "tavily",
+    "tavily_extract": "tavily",
+    "mineru": "mineru",
+}
+
+_MEMO_LOCK = threading.Lock()
+_MEMO: Dict[str, Tuple[int, Dict[str, Dict[str, Dict[str, int]]]]] = {}
+
+
+def _empty_engine() -> Dict[str, int]:
+    return {"attempts": 0, "successes": 0, "not_usable": 0, "latency_samples": 0, "latency_ms_total": 0}
+
+
+def _engine_slot(hosts: Dict[str, Dict[str, Dict[str, int]]], host: str, engine: str) -> Dict[str, int]:
+    per_host = hosts.setdefault(host, {})
+    slot = per_host.get(engine)
+    if slot is None:
+        slot = _empty_engine()
+        per_host[engine] = slot
+    return slot
+
+
+def _apply_record(hosts: Dict[str, Dict[str, Dict[str, int]]], row: Dict[str, Any]) -> None:
+    if str(row.get("kind") or "").strip().lower() != "extract":
+        return
+    events = ((row.get("trace") or {}).get("events")) or []
+    host = ""
+    finished = []
+    tried = []
+    final_engine = ""
+    final_ok = False
+    for event in events:
+        if not isinstance(event, dict):
+            continue
+        meta = event.get("metadata") or {}
+        decision = event.get("decision")
+        if event.get("stage") == "extract.policy" and decision == "extract_plan_selected":
+            host = str(meta.get("host") or "").strip().lower()
+        elif decision == "engine_finished":
+            finished.append(meta)
+        elif decision in {"try_tavily", "try_mineru"}:
+            tried.append(decision.split("_", 1)[1])
+        elif decision == "response_ready":
+            final_engine = _ENGINE_ALIASES.get(str(meta.get("engine") or ""), "")
+            final_ok = str(meta.get("ok") or "").lower() == "true"
+    if not host:
+        return
+
+    if finished:
+        for meta in finished:
+            engine = _ENGINE_ALIASES.get(str(meta.get("engine") or ""), "")
+            if not engine:
+                continue
+            slot = _engine_slot(hosts, host, engine)
+            slot["attempts"] += 1
+            if str(meta.get("ok") or "").lower() == "true":
+                slot["successes"] += 1
+            if str(meta.get("reason") or "") == "tavily_content_not_usable":
+                slot["not_usable"] += 1
+            try:
+                latency = int(meta.get("latency_ms"))
+            except Exception:
+                continue
+            slot["latency_samples"] += 1
+            slot["latency_ms_total"] += max(0, latency)
+        return
+
+    # 旧轨迹没有 engine_finished 事件：按 try_* + 最终引擎推断各引擎成败（无延迟样本）。
+    for engine in tried:
+        slot = _engine_slot(hosts, host, engine)
+        slot["attempts"] += 1
+        if final_ok and final_engine == engine:
+            slot["successes"] += 1
+
+
+def _sidecar_path(trace_path: Path) -> Path:
+    return trace_path.with_name(trace_path.name + _SIDECAR_SUFFIX)
+
+
+def _read_sidecar(path: Path) -> Tuple[int, Dict[str, Dict[str, Dict[str, int]]]]:
+    try:
+        payload = json.loads(path.read_text(encoding="utf-8"))
+    except Exception:
+        return 0, {}
+    if not isinstance(payload, dict) or payload.get("version") != _SIDECAR_VERSION:
+        return 0, {}
+    hosts = payload.get("hosts")
+    if not isinstance(hosts, dict):
+        return 0, {}
+    return max(0, int(payload.get("offset") or 0)), hosts
+
+
+def _write_sidecar(path: Path, offset: int, hosts: Dict[str, Dict[str, Dict[str, int]]]) -> None:
+    tmp = path.with_name("%s.%s.tmp" % (path.name, os.getpid()))
+    try:
+        tmp.write_text(
+            json.dumps({"version": _SIDECAR_VERSION, "offset": offset, "hosts": hosts}, ensure_ascii=False),
+            encoding="utf-8",
+        )
+        os.replace(str(tmp), str(path))
+    except Exception:  # pragma: no cover - read-only filesystem, stats stay in memory
+        try:
+            tmp.unlink()
+        except Exception:
+            pass
+
+
+def _copy_hosts(hosts: Dict[str, Dict[str, Dict[str, int]]]) -> Dict[str, Dict[str, Dict[str, int]]]:
+    return {host: {engine: dict(slot) for engine, slot in engines.items()} for host, engines in hosts.items()}
+
+
+def load_extract_host_stats(path: str) -> Dict[str, Dict[str, Dict[str, int]]]:
+    """增量构建 host -> engine -> 计数 表；只解析上次 offset 之后新追加的 JSONL 行。
+
+    返回副本：内存表只在 _MEMO_LOCK 内修改，调用方（并发的抽取线程）拿到的快照不会被后续刷新改动。
+    """
+    if not path:
+        return {}
+    target = Path(path).expanduser()
+    try:
+        size = target.stat().st_size
+    except OSError:
+        return {}
+
+    key = str(target)
+    with _MEMO_LOCK:
+        memo = _MEMO.get(key)
+        if memo is None:
+            memo = _read_sidecar(_sidecar_path(target))
+        offset, hosts = memo
+        if offset > size:
+            # 文件被截断或轮转，从头重建。
+            offset, hosts = 0, {}
+        if offset == size:
+            _MEMO[key] = (offset, hosts)
+            return _copy_hosts(hosts)
+
+        try:
+            with target.open("rb") as fp:
+                fp.seek(offset)
+                chunk = fp.read(size - offset)
+        except OSError:
+            return _copy_hosts(hosts)
+        # 只消费完整行，半行留给下一次刷新。
+        end = chunk.rfind(b"\n")
+        if end < 0:
+            _MEMO[key] = (offset, hosts)
+            return _copy_hosts(hosts)
+        for line in chunk[: end + 1].splitlines():
+            if not line.strip():
+                continue
+            try:
+                row = json.loads(line.decode("utf-8", errors="ignore"))
+            except Exception:
+                continue
+            if isinstance(row, dict):
+                _apply_record(hosts, row)
+        offset += end + 1
+        _MEMO[key] = (offset, hosts)
+        _write_sidecar(_sidecar_path(target), offset, hosts)
+        return _copy_hosts(hosts)
+
+
+def summarize_engine_stats(slot: Optional[Dict[str, int]]) -> Dict[str, Any]:
+    slot = slot or _empty_engine()
+    attempts = int(slot.get("attempts", 0))
+    successes = int(slot.get("successes", 0))
+    samples = int(slot.get("latency_samples", 0))
+    return {
+        "attempts": attempts,
+        "successes": successes,
+        "not_usable": int(slot.get("not_usable", 0)),
+        "success_rate": round(successes / attempts, 4) if attempts else 0.0,
+        "latency_ms_avg": int(slot.get("latency_ms_total", 0) / samples) if samples else 0,
+    }
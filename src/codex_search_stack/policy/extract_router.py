@@ -1,9 +1,11 @@
+import hashlib
 from dataclasses import dataclass, field
-from typing import List
+from typing import Any, Dict, List, Optional
 from urllib.parse import urlparse
 
 from ..config import Settings
 from ..contracts import DecisionTrace, ExtractRequest
+from ..observability import load_extract_host_stats, summarize_engine_stats
 
 _DEFAULT_ANTI_BOT_DOMAINS = {
     "mp.weixin.qq.com",
@@ -13,7 +15,7 @@ _DEFAULT_ANTI_BOT_DOMAINS = {
     "www.xiaohongshu.com",
     "xiaohongshu.com",
 }
-_SUPPORTED_STRATEGIES = {"auto", "tavily_first", "mineru_first", "tavily_only", "mineru_only"}
+_SUPPORTED_STRATEGIES = {"auto", "tavily_first", "mineru_first", "tavily_only", "mineru_only", "race"}
 
 
 @dataclass
@@ -23,6 +25,7 @@ class ExtractPlan:
     fallback_engine: str
     tavily_timeout: int
     notes: List[str] = field(default_factory=list)
+    host: str = ""
 
     @property
     def try_tavily(self) -> bool:
@@ -32,6 +35,10 @@ class ExtractPlan:
     def try_mineru(self) -> bool:
         return self.first_engine == "mineru" or self.fallback_engine == "mineru"
 
+    @property
+    def is_race(self) -> bool:
+        return self.strategy == "race"
+
 
 def _host(url: str) -> str:
     try:
@@ -52,6 +59,93 @@ def _anti_bot_domains(settings: Settings) -> set:
     return set(_DEFAULT_ANTI_BOT_DOMAINS)
 
 
+def _race_domains(settings: Settings) -> set:
+    extract_policy = (settings.policy or {}).get("extract", {})
+    if not isinstance(extract_policy, dict):
+        return set()
+    domains = extract_policy.get("race_domains")
+    if not isinstance(domains, list):
+        return set()
+    return {(str(item).strip().lower()) for item in domains if str(item).strip()}
+
+
+def _learned_routing_policy(settings: Settings) -> Dict[str, Any]:
+    defaults: Dict[str, Any] = {
+        "enabled": True,
+        "min_samples": 5,
+        "mineru_below": 0.2,
+        "race_below": 0.5,
+        "explore_rate": 0.1,
+    }
+    extract_policy = (settings.policy or {}).get("extract", {})
+    if not isinstance(extract_policy, dict):
+        return defaults
+    raw = extract_policy.get("learned_routing")
+    if not isinstance(raw, dict):
+        return defaults
+    out = dict(defaults)
+    if isinstance(raw.get("enabled"), bool):
+        out["enabled"] = raw["enabled"]
+    for key, cast in (("min_samples", int), ("mineru_below", float), ("race_below", float), ("explore_rate", float)):
+        try:
+            out[key] = cast(raw.get(key, defaults[key]))
+        except Exception:
+            continue
+    out["min_samples"] = max(1, int(out["min_samples"]))
+    out["explore_rate"] = min(1.0, max(0.0, float(out["explore_rate"])))
+    return out
+
+
+def _explore_draw(host: str, samples: int) -> float:
+    """由 (host, 样本数) 派生 [0, 1) 的确定性取值：同一份历史总给出同一路由，新样本落盘后才换签。"""
+    digest = hashlib.sha256(("%s:%s" % (host, samples)).encode("utf-8")).digest()
+    return int.from_bytes(digest[:8], "big") / float(1 << 64)
+
+
+def _learned_strategy(host: str, settings: Settings) -> Optional[Dict[str, Any]]:
+    """按持久化 DecisionTrace 中该 host 的 Tavily 历史成功率选择首发引擎。"""
+    learned = _learned_routing_policy(settings)
+    if not learned["enabled"] or not host:
+        return None
+    stats = load_extract_host_stats(str(getattr(settings, "decision_trace_jsonl_path", "") or ""))
+    per_host = stats.get(host)
+    if not per_host:
+        return None
+    tavily = summarize_engine_stats(per_host.get("tavily"))
+    mineru = summarize_engine_stats(per_host.get("mineru"))
+    if tavily["attempts"] < learned["min_samples"]:
+        return None
+    explored = False
+    if tavily["success_rate"] < learned["mineru_below"]:
+        chosen = "mineru_first"
+        # mineru_first 下 Tavily 只在 MinerU 失败后才跑，成功率再也得不到新样本；
+        # 按 explore_rate 偶尔改走 race，让已恢复的 host 有机会回到 Tavily。
+        samples = tavily["attempts"] + mineru["attempts"]
+        if learned["explore_rate"] > 0 and _explore_draw(host, samples) < learned["explore_rate"]:
+            chosen = "race"
+            explored = True
+    elif tavily["success_rate"] < learned["race_below"]:
+        chosen = "race"
+    else:
+        chosen = "tavily_first"
+    return {
+        "strategy": chosen,
+        "evidence": {
+            "host": host,
+            "tavily_attempts": str(tavily["attempts"]),
+            "tavily_success_rate": str(tavily["success_rate"]),
+            "tavily_not_usable": str(tavily["not_usable"]),
+            "tavily_latency_ms_avg": str(tavily["latency_ms_avg"]),
+            "mineru_attempts": str(mineru["attempts"]),
+            "mineru_success_rate": str(mineru["success_rate"]),
+            "mineru_latency_ms_avg": str(mineru["latency_ms_avg"]),
+            "min_samples": str(learned["min_samples"]),
+            "chosen": chosen,
+            "explored": str(explored).lower(),
+        },
+    }
+
+
 def _default_strategy(settings: Settings) -> str:
     extract_policy = (settings.policy or {}).get("extract", {})
     if not isinstance(extract_policy, dict):
@@ -69,6 +163,7 @@ def build_extract_plan(request: ExtractRequest, settings: Settings, trace: Decis
     host = _host(request.url)
     anti_bot_domains = _anti_bot_domains(settings)
     is_anti_bot = host in anti_bot_domains
+    is_race_host = host in _race_domains(settings)
 
     strategy = (request.strategy or "").strip().lower()
     if strategy not in _SUPPORTED_STRATEGIES:
@@ -85,10 +180,26 @@ def build_extract_plan(request: ExtractRequest, settings: Settings, trace: Decis
         if is_anti_bot:
             strategy = "mineru_only"
             notes.append("auto_strategy_anti_bot:mineru_only")
+        elif is_race_host:
+            strategy = "race"
+            notes.append("auto_strategy_race_domain:race")
         else:
+            learned = _learned_strategy(host, settings)
             strategy = "tavily_first"
-
-    if strategy == "tavily_first":
+            if learned:
+                strategy = learned["strategy"]
+                trace.add_event(
+                    stage="extract.policy",
+                    decision="learned_route_evidence",
+                    reason="host history from persisted decision traces",
+                    metadata=learned["evidence"],
+                )
+                if learned["evidence"]["explored"] == "true":
+                    notes.append("auto_strategy_learned_explore:%s" % strategy)
+                elif strategy != "tavily_first":
+                    notes.append("auto_strategy_learned:%s" % strategy)
+
+    if strategy in {"tavily_first", "race"}:
         first_engine = "tavily"
         fallback_engine = "mineru"
     elif strategy == "mineru_first":
@@ -109,6 +220,7 @@ def build_extract_plan(request: ExtractRequest, settings: Settings, trace: Decis
         metadata={
             "host": host,
             "anti_bot": str(is_anti_bot).lower(),
+            "race_host": str(is_race_host).lower(),
             "strategy": strategy,
             "first_engine": first_engine,
             "fallback_engine": fallback_engine or "none",
@@ -122,4 +234,5 @@ def build_extract_plan(request: ExtractRequest, settings: Settings, trace: Decis
         fallback_engine=fallback_engine,
         tavily_timeout=tavily_timeout,
         notes=notes,
+        host=host,
     )
@@ -1,4 +1,3 @@
-from .orchestrator import run_research_loop
-
-__all__ = ["run_research_loop"]
+from .orchestrator import iter_research_events, run_research_loop
 
+__all__ = ["iter_research_events", "run_research_loop"]
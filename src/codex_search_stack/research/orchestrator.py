@@ -1,14 +1,67 @@
 import time
+from concurrent.futures import Future, ThreadPoolExecutor, TimeoutError as FutureTimeoutError, wait
 from datetime import datetime
-from typing import Dict, List, Optional, Set
+from typing import Any, Dict, Iterator, List, Optional, Set, Tuple
 from urllib.parse import urlparse
 
 from ..config import Settings
 from ..contracts import DecisionTrace, SearchResult
+from ..extract.content_store import ContentStore, content_handle
 from ..extract.pipeline import run_extract_pipeline
-from ..observability import collect_extract_source_hits, collect_search_source_hits, persist_decision_trace_jsonl
+from ..extract.projection import projection_summary, summary_window
+from ..observability import (
+    collect_extract_source_hits,
+    collect_search_source_hits,
+    load_extract_host_stats,
+    persist_decision_trace_jsonl,
+    summarize_engine_stats,
+)
 from ..search.orchestrator import run_multi_source_search
-from ..search.scoring import normalize_url
+from ..search.scoring import authority_score, normalize_url
+from .session import (
+    delete_research_session,
+    is_valid_session_id,
+    load_research_session,
+    new_session_id,
+    prune_research_sessions,
+    restore_trace,
+    save_research_session,
+)
+
+_DEFAULT_EXTRACT_CONCURRENCY = 4
+_DEFAULT_EXTRACT_ROUND_TIMEOUT_SECONDS = 120.0
+_DEFAULT_FOLLOWUP_BRANCHES = 3
+_DEFAULT_SESSION_DIR = "./.runtime/research-sessions"
+_DEFAULT_SESSION_MAX_AGE_HOURS = 72.0
+# 内容缓存里的正文超过这个年龄就视为过期，重新在线抽取。
+_DEFAULT_CONTENT_CACHE_MAX_AGE_SECONDS = 86400
+_DEFAULT_DEADLINE_POLICY = {
+    "search_share": 0.5,
+    "min_round_ms": 3000,
+    "extract_estimate_ms": 8000,
+    "reserve_ms": 500,
+}
+# 边际收益停止：连续 patience 轮既没有新增 min_score 以上的 URL，top-k 平均分也没有上升 min_mean_gain，就不再追问。
+_DEFAULT_STOP_POLICY = {
+    "enabled": True,
+    "min_new_results": 1,
+    "min_score": 0.35,
+    "min_mean_gain": 0.01,
+    "patience": 1,
+}
+# 抽取目标按期望价值排序：相关性分数 + 来源权威度 + 该 host 的历史成功率 - 预估耗时。
+_DEFAULT_EXTRACT_RANKING = {
+    "enabled": True,
+    "score_weight": 1.0,
+    "authority_weight": 0.5,
+    "success_weight": 0.5,
+    "cost_weight": 0.3,
+    "latency_ref_ms": 20000,
+    "min_samples": 3,
+}
+# 没有足够历史样本的 host 按中性先验估计。
+_UNKNOWN_HOST_SUCCESS = 0.5
+_UNKNOWN_HOST_COST = 0.25
 
 _OFFICIAL_HOST_HINTS = [
     "github.com",
@@ -26,13 +79,6 @@ def _host(url: str) -> str:
         return ""
 
 
-def _trim(text: str, limit: int) -> str:
-    value = (text or "").replace("\n", " ").strip()
-    if len(value) <= limit:
-        return value
-    return value[: max(1, limit - 3)] + "..."
-
-
 def _is_official_like(host: str) -> bool:
     if not host:
         return False
@@ -41,6 +87,122 @@ def _is_official_like(host: str) -> bool:
     return host.endswith(".org") or host.endswith(".edu")
 
 
+def _research_policy(settings: Settings) -> Dict[str, Any]:
+    policy = getattr(settings, "policy", None) or {}
+    return dict(policy.get("research") or {})
+
+
+def _top_score_mean(evidence: Dict[str, Dict], k: int) -> float:
+    # 按 k 取平均（不足 k 条按 0 计），新增任何正分结果都会抬高均值，衡量的是最终结果集的质量。
+    k = max(1, int(k))
+    scores = sorted((float(item.get("score") or 0.0) for item in evidence.values()), reverse=True)
+    return sum(scores[:k]) / k
+
+
+def _host_extract_outlook(per_host: Optional[Dict[str, Dict[str, int]]], min_samples: int, latency_ref_ms: int) -> Tuple[float, float]:
+    """返回 (预测成功率, 归一化耗时)；取历史成功率最高的引擎，样本不足时用先验。"""
+    best: Optional[Tuple[float, float]] = None
+    for slot in (per_host or {}).values():
+        stats = summarize_engine_stats(slot)
+        if stats["attempts"] < min_samples:
+            continue
+        cost = min(1.0, stats["latency_ms_avg"] / float(latency_ref_ms)) if stats["latency_ms_avg"] else _UNKNOWN_HOST_COST
+        candidate = (float(stats["success_rate"]), cost)
+        if best is None or candidate[0] > best[0] or (candidate[0] == best[0] and candidate[1] < best[1]):
+            best = candidate
+    return best if best is not None else (_UNKNOWN_HOST_SUCCESS, _UNKNOWN_HOST_COST)
+
+
+def _rank_extract_targets(
+    keys: List[str],
+    evidence: Dict[str, Dict],
+    ranking: Dict[str, Any],
+    host_stats: Dict[str, Dict[str, Dict[str, int]]],
+) -> List[Tuple[str, float]]:
+    """按期望价值降序排列候选；同分保持到达顺序。"""
+    min_samples = max(1, int(ranking["min_samples"]))
+    latency_ref_ms = max(1, int(ranking["latency_ref_ms"]))
+    scored: List[Tuple[str, float]] = []
+    for key in keys:
+        item = evidence.get(key, {})
+        url = item.get("url", "")
+        host = _host(url)
+        authority = authority_score(url)
+        if _is_official_like(host):
+            authority = max(authority, 0.8)
+        success, cost = _host_extract_outlook(host_stats.get(host), min_samples, latency_ref_ms)
+        value = (
+            float(ranking["score_weight"]) * float(item.get("score") or 0.0)
+            + float(ranking["authority_weight"]) * authority
+            + float(ranking["success_weight"]) * success
+            - float(ranking["cost_weight"]) * cost
+        )
+        scored.append((key, round(value, 4)))
+    return sorted(scored, key=lambda pair: pair[1], reverse=True)
+
+
+def _cached_extract(store: ContentStore, url: str, max_age_seconds: int) -> Optional[Dict[str, Any]]:
+    # 内容缓存里已有未过期的完整正文：直接出摘要，不占用本轮抽取预算；过期或缺少 stored_at 的回退在线抽取。
+    try:
+        handle = content_handle(url)
+        meta = store.meta(handle) or {}
+        if max_age_seconds > 0 and time.time() - float(meta.get("stored_at") or 0) > max_age_seconds:
+            return None
+        text = store.get(handle, max_chars=4000)
+    except Exception:
+        return None
+    if not text:
+        return None
+    return {
+        "url": url,
+        "ok": True,
+        "engine": str(meta.get("engine") or ""),
+        "notes": ["content_cache_hit"],
+        "summary": summary_window(text, 320),
+        "content_handle": handle,
+    }
+
+
+def _run_round_extracts(
+    targets: List[Tuple[str, str]],
+    settings: Settings,
+    max_chars: int,
+    strategy: str,
+    concurrency: int,
+    timeout_seconds: float,
+) -> Tuple[Dict[str, Any], List[str]]:
+    """本轮提取并发执行；超过轮次截止时间仍未完成的 key 返回到 pending，不阻塞本轮收尾。"""
+    if not targets:
+        return {}, []
+    pool = ThreadPoolExecutor(max_workers=max(1, min(int(concurrency), len(targets))))
+    futures = {
+        key: pool.submit(
+            run_extract_pipeline,
+            url=url,
+            settings=settings,
+            max_chars=max_chars,
+            strategy=strategy,
+            include_markdown=False,
+        )
+        for key, url in targets
+    }
+    wait(list(futures.values()), timeout=timeout_seconds if timeout_seconds > 0 else None)
+    outputs: Dict[str, Any] = {}
+    pending: List[str] = []
+    for key, _ in targets:
+        future = futures[key]
+        if not future.done():
+            pending.append(key)
+            continue
+        try:
+            outputs[key] = future.result()
+        except Exception as exc:
+            outputs[key] = exc
+    # 超时的提取留在后台线程里自然结束，不等待；尚未开始的直接取消。
+    pool.shutdown(wait=False, cancel_futures=True)
+    return outputs, pending
+
+
 def _merge_result(existing: Dict, item: SearchResult, round_idx: int) -> Dict:
     if not existing:
         return {
@@ -71,7 +233,7 @@ def _merge_result(existing: Dict, item: SearchResult, round_idx: int) -> Dict:
     return existing
 
 
-def _build_followup_query(
+def _build_followup_queries(
     *,
     base_query: str,
     intent: str,
@@ -80,29 +242,24 @@ def _build_followup_query(
     has_recent: bool,
     has_arxiv: bool,
     asked: Set[str],
-) -> Optional[str]:
+    limit: int = 1,
+) -> List[str]:
+    """按缺口优先级返回所有未问过的 follow-up，最多 limit 条（同一轮并发检索）。"""
     intent_key = (intent or "").strip().lower()
     now_year = datetime.now().year
+    candidates: List[str] = []
     if total_results < 5:
-        candidate = "%s official docs tutorial examples" % base_query
-        if candidate not in asked:
-            return candidate
+        candidates.append("%s official docs tutorial examples" % base_query)
     if intent_key in {"status", "news"} and not has_recent:
-        candidate = "%s latest update %s changelog release notes" % (base_query, now_year)
-        if candidate not in asked:
-            return candidate
+        candidates.append("%s latest update %s changelog release notes" % (base_query, now_year))
     if any("paper" in token for token in base_query.lower().split()) and not has_arxiv:
-        candidate = "%s arxiv paper pdf" % base_query
-        if candidate not in asked:
-            return candidate
+        candidates.append("%s arxiv paper pdf" % base_query)
     if hosts and not any(_is_official_like(host) for host in hosts):
-        candidate = '%s site:github.com OR site:arxiv.org OR site:docs.*' % base_query
-        if candidate not in asked:
-            return candidate
-    return None
+        candidates.append('%s site:github.com OR site:arxiv.org OR site:docs.*' % base_query)
+    return [candidate for candidate in candidates if candidate not in asked][: max(1, int(limit))]
 
 
-def run_research_loop(
+def iter_research_events(
     *,
     query: str,
     settings: Settings,
@@ -116,8 +273,53 @@ def run_research_loop(
     extract_per_round: int = 2,
     extract_max_chars: int = 1600,
     extract_strategy: str = "auto",
-) -> Dict:
+    extract_concurrency: Optional[int] = None,
+    extract_round_timeout_seconds: Optional[float] = None,
+    pipeline_rounds: Optional[bool] = None,
+    followup_branches: Optional[int] = None,
+    session_id: Optional[str] = None,
+    deadline_ms: Optional[int] = None,
+) -> Iterator[Dict[str, Any]]:
+    """逐轮产出进度事件（search_done / extract_done / round_summary），最后一个事件为 result。"""
     started_at = time.perf_counter()
+    session_id = (session_id or "").strip()
+    if session_id and not is_valid_session_id(session_id):
+        raise ValueError("invalid research session_id: %r" % session_id)
+    research_policy = _research_policy(settings)
+    if extract_concurrency is None:
+        extract_concurrency = int(research_policy.get("extract_concurrency", _DEFAULT_EXTRACT_CONCURRENCY))
+    if extract_round_timeout_seconds is None:
+        extract_round_timeout_seconds = float(
+            research_policy.get("extract_round_timeout_seconds", _DEFAULT_EXTRACT_ROUND_TIMEOUT_SECONDS)
+        )
+    if pipeline_rounds is None:
+        pipeline_rounds = bool(research_policy.get("pipeline_rounds", True))
+    if followup_branches is None:
+        followup_branches = int(research_policy.get("followup_branches", _DEFAULT_FOLLOWUP_BRANCHES))
+    followup_branches = max(1, int(followup_branches))
+    if deadline_ms is None:
+        deadline_ms = int(research_policy.get("deadline_ms", 0) or 0)
+    deadline_ms = max(0, int(deadline_ms or 0))
+    deadline_at = started_at + deadline_ms / 1000.0 if deadline_ms else None
+    deadline_policy = dict(_DEFAULT_DEADLINE_POLICY)
+    deadline_policy.update(research_policy.get("deadline") or {})
+    search_share = min(0.9, max(0.1, float(deadline_policy["search_share"])))
+    min_round_ms = max(0, int(deadline_policy["min_round_ms"]))
+    extract_estimate_ms = max(1, int(deadline_policy["extract_estimate_ms"]))
+    reserve_ms = max(0, int(deadline_policy["reserve_ms"]))
+    stop_policy = dict(_DEFAULT_STOP_POLICY)
+    stop_policy.update(research_policy.get("stop") or {})
+    stop_enabled = bool(stop_policy["enabled"])
+    stop_min_new = max(0, int(stop_policy["min_new_results"]))
+    stop_min_score = float(stop_policy["min_score"])
+    stop_min_gain = float(stop_policy["min_mean_gain"])
+    stop_patience = max(1, int(stop_policy["patience"]))
+    extract_ranking = dict(_DEFAULT_EXTRACT_RANKING)
+    extract_ranking.update(research_policy.get("extract_ranking") or {})
+    content_store = ContentStore.for_workspace(getattr(settings, "mineru_workspace", None))
+    content_max_age_seconds = max(
+        0, int(research_policy.get("content_cache_max_age_seconds", _DEFAULT_CONTENT_CACHE_MAX_AGE_SECONDS))
+    )
     trace = DecisionTrace(policy_version="policy.research.v1")
     trace.add_event(
         stage="research.request",
@@ -129,6 +331,9 @@ def run_research_loop(
             "freshness": (freshness or "").strip().lower(),
             "max_rounds": str(max_rounds),
             "extract_per_round": str(extract_per_round),
+            "extract_concurrency": str(extract_concurrency),
+            "followup_branches": str(followup_branches),
+            "deadline_ms": str(deadline_ms),
             "model_profile": model_profile,
         },
     )
@@ -138,19 +343,93 @@ def run_research_loop(
     evidence: Dict[str, Dict] = {}
     extracts: Dict[str, Dict] = {}
     asked_queries: Set[str] = set()
-    current_query = (query or "").strip()
+    current_queries: List[str] = [(query or "").strip()]
     stop_reason = "max_rounds_reached"
 
-    for round_idx in range(1, max(1, int(max_rounds)) + 1):
-        asked_queries.add(current_query)
+    session_root = str(getattr(settings, "research_session_dir", "") or _DEFAULT_SESSION_DIR)
+    # 只有调用方给了 session_id 或策略打开 auto_session 时才落检查点，普通调用不碰磁盘。
+    checkpointing = bool(session_id) or bool(research_policy.get("auto_session", False))
+    resumed_rounds = 0
+    if checkpointing:
+        session_max_age_hours = float(research_policy.get("session_max_age_hours", _DEFAULT_SESSION_MAX_AGE_HOURS))
+        prune_research_sessions(session_root, session_max_age_hours * 3600.0)
+    if checkpointing and not session_id:
+        # auto_session：生成 id 并逐轮落检查点，调用方可从 round_summary 事件拿到 id 续跑。
+        session_id = new_session_id()
+    elif session_id:
+        state = load_research_session(session_root, session_id)
+        if state is not None and state.get("query") != query:
+            notes.append("research_session_query_mismatch:%s" % session_id)
+            state = None
+        if state is not None:
+            trace = restore_trace(state.get("trace"), trace.policy_version)
+            rounds = list(state.get("rounds") or [])
+            notes = list(state.get("notes") or [])
+            evidence = dict(state.get("evidence") or {})
+            extracts = dict(state.get("extracts") or {})
+            asked_queries = set(state.get("asked_queries") or [])
+            current_queries = list(state.get("next_queries") or [])
+            resumed_rounds = len(rounds)
+            if not current_queries:
+                stop_reason = str(state.get("stop_reason") or "no_more_gap")
+            notes.append("research_session_resumed:%s" % resumed_rounds)
+            trace.add_event(
+                stage="research.session",
+                decision="session_resumed",
+                reason="continue from last checkpoint",
+                metadata={"session_id": session_id, "completed_rounds": str(resumed_rounds)},
+            )
+
+    def checkpoint(next_queries: List[str], final_reason: str = "") -> None:
+        # 每轮结束落一次检查点；中断后用同一 session_id 从下一轮继续。
+        if not checkpointing:
+            return
+        error = save_research_session(
+            session_root,
+            session_id,
+            {
+                "query": query,
+                "rounds": rounds,
+                "notes": notes,
+                "evidence": evidence,
+                "extracts": extracts,
+                "asked_queries": sorted(asked_queries),
+                "next_queries": list(next_queries),
+                "stop_reason": final_reason,
+                "trace": trace.to_dict(),
+            },
+        )
+        if error:
+            notes.append("research_session_checkpoint_failed:%s" % error)
+
+    default_search_budget_ms = max(1000, int(getattr(settings, "search_timeout_seconds", 60) or 60) * 3000)
+
+    def remaining_ms() -> Optional[int]:
+        if deadline_at is None:
+            return None
+        return int((deadline_at - time.perf_counter()) * 1000)
+
+    def search_budget_ms() -> int:
+        # 有截止时间时，搜索只拿剩余时间的 search_share（不抽取时拿全部），其余留给抽取。
+        # 下限 1000ms，但不超过剩余时间，短截止时间下首轮搜索也能在期限内返回。
+        remaining = remaining_ms()
+        if remaining is None:
+            return default_search_budget_ms
+        share = search_share if extract_per_round > 0 else 1.0
+        floor_ms = min(1000, max(200, remaining - reserve_ms))
+        return max(floor_ms, min(default_search_budget_ms, int((remaining - reserve_ms) * share)))
+
+    def deadline_stop(round_idx: int, phase: str) -> None:
         trace.add_event(
-            stage="research.round",
-            decision="search_started",
-            reason="execute multi-source search",
-            metadata={"round": str(round_idx), "query": current_query},
+            stage="research.deadline",
+            decision="deadline_reached",
+            reason="global research deadline reached",
+            metadata={"round": str(round_idx), "phase": phase, "remaining_ms": str(remaining_ms())},
         )
-        out = run_multi_source_search(
-            query=current_query,
+
+    def run_search(search_query: str, budget_ms: int):
+        return run_multi_source_search(
+            query=search_query,
             settings=settings,
             mode=mode,
             limit=max(1, int(limit)),
@@ -160,104 +439,349 @@ def run_research_loop(
             model_profile=model_profile,
             budget_max_calls=6,
             budget_max_tokens=12000,
-            budget_max_latency_ms=max(1000, int(getattr(settings, "search_timeout_seconds", 60) or 60) * 3000),
+            budget_max_latency_ms=budget_ms,
         )
 
-        round_notes = list(out.notes or [])
-        notes.extend(round_notes)
-        before_count = len(evidence)
-        new_urls: List[str] = []
-        for row in out.results:
-            key = normalize_url(row.url or "")
-            if not key:
-                continue
-            prior = evidence.get(key, {})
-            evidence[key] = _merge_result(prior, row, round_idx)
-            if not prior:
-                new_urls.append(key)
-        added_count = len(evidence) - before_count
-
-        extract_results: List[Dict] = []
-        if extract_per_round > 0:
-            extract_targets = new_urls[: max(0, int(extract_per_round))]
-            if not extract_targets:
-                missing = [k for k in evidence.keys() if k not in extracts]
-                extract_targets = missing[: max(0, int(extract_per_round))]
-            for key in extract_targets:
-                url = evidence.get(key, {}).get("url", "")
-                if not url:
+    def run_search_batch(batch: List[str], budget_ms: int) -> List[Any]:
+        # 多个 follow-up 分支并发检索，结果按 query 顺序返回，保证合并顺序确定。
+        if len(batch) == 1:
+            return [run_search(batch[0], budget_ms)]
+        with ThreadPoolExecutor(max_workers=len(batch)) as branch_pool:
+            return list(branch_pool.map(lambda item: run_search(item, budget_ms), batch))
+
+    round_limit = max(1, int(max_rounds))
+    # 流水线：第 N 轮抽取期间预取第 N+1 轮搜索；事件仍由主线程按原顺序写入，输出与串行一致。
+    # 有截止时间时搜索也走后台线程，主线程按剩余时间等待，超时即放弃。
+    use_pool = (pipeline_rounds and round_limit > 1) or deadline_at is not None
+    search_pool = ThreadPoolExecutor(max_workers=1) if use_pool else None
+    prefetched: Optional[Future] = None
+    # 已恢复的会话若没有待检索的 follow-up，直接复用检查点结果。
+    start_round = resumed_rounds + 1 if current_queries else round_limit + 1
+    prev_score_mean = _top_score_mean(evidence, limit)
+    low_yield_rounds = 0
+    # 截止时间缩减或放弃了抽取时置位：即使循环最后因 max_rounds/no_more_gap 结束，也要报告结果被截断。
+    deadline_hit = False
+    try:
+        for round_idx in range(start_round, round_limit + 1):
+            remaining = remaining_ms()
+            # 本次调用的第一轮总是执行（搜索预算按剩余时间收缩），否则 deadline_ms < min_round_ms 时一轮都不跑。
+            first_round = round_idx == start_round
+            if remaining is not None and remaining < min_round_ms and not first_round:
+                stop_reason = "deadline"
+                deadline_stop(round_idx, "round_start")
+                break
+            asked_queries.update(current_queries)
+            search_meta = {"round": str(round_idx), "query": current_queries[0]}
+            if len(current_queries) > 1:
+                search_meta["branch_count"] = str(len(current_queries))
+                search_meta["queries"] = " || ".join(current_queries)
+            trace.add_event(
+                stage="research.round",
+                decision="search_started",
+                reason="execute multi-source search",
+                metadata=search_meta,
+            )
+            round_budget_ms = 0
+            if prefetched is None and deadline_at is not None and search_pool is not None:
+                round_budget_ms = search_budget_ms()
+                prefetched = search_pool.submit(run_search_batch, current_queries, round_budget_ms)
+            if prefetched is not None:
+                wait_seconds = None
+                if deadline_at is not None:
+                    wait_seconds = max(0.0, (remaining_ms() - reserve_ms) / 1000.0)
+                    if first_round:
+                        # 首轮至少等满搜索自身的预算，不因 reserve_ms 提前放弃唯一的一轮。
+                        wait_seconds = max(wait_seconds, round_budget_ms / 1000.0)
+                try:
+                    search_outputs = prefetched.result(timeout=wait_seconds)
+                except FutureTimeoutError:
+                    prefetched.cancel()
+                    stop_reason = "deadline"
+                    notes.append("research_deadline_search_abandoned:%s" % round_idx)
+                    deadline_stop(round_idx, "search")
+                    break
+                finally:
+                    prefetched = None
+            else:
+                search_outputs = run_search_batch(current_queries, search_budget_ms())
+
+            round_rows: List[SearchResult] = []
+            round_notes: List[str] = []
+            for out in search_outputs:
+                round_rows.extend(out.results)
+                round_notes.extend(out.notes or [])
+            notes.extend(round_notes)
+            before_count = len(evidence)
+            new_urls: List[str] = []
+            new_scores: List[Optional[float]] = []
+            for row in round_rows:
+                key = normalize_url(row.url or "")
+                if not key:
                     continue
-                ex = run_extract_pipeline(
-                    url=url,
+                prior = evidence.get(key, {})
+                evidence[key] = _merge_result(prior, row, round_idx)
+                if not prior:
+                    new_urls.append(key)
+                    new_scores.append(row.score)
+            added_count = len(evidence) - before_count
+            # 没有打分的结果（score=None）不做分数门槛，按有效新增计。
+            useful_new = sum(1 for score in new_scores if score is None or float(score) >= stop_min_score)
+            score_mean = _top_score_mean(evidence, limit)
+            score_gain = score_mean - prev_score_mean
+            prev_score_mean = score_mean
+
+            hosts = {_host(item.get("url", "")) for item in evidence.values()}
+            has_recent = any(bool(item.get("published_date")) for item in evidence.values())
+            has_arxiv = any("arxiv.org" in host for host in hosts if host)
+            followup_queries = _build_followup_queries(
+                base_query=query,
+                intent=(intent or ""),
+                total_results=len(evidence),
+                hosts={h for h in hosts if h},
+                has_recent=has_recent,
+                has_arxiv=has_arxiv,
+                asked=asked_queries,
+                limit=followup_branches,
+            )
+            gap_tags: List[str] = []
+            if len(evidence) < 5:
+                gap_tags.append("low_coverage")
+            if ((intent or "").strip().lower() in {"status", "news"}) and not has_recent:
+                gap_tags.append("missing_recency")
+            if not any(_is_official_like(host) for host in hosts if host):
+                gap_tags.append("missing_official")
+            if ("paper" in query.lower()) and not has_arxiv:
+                gap_tags.append("missing_paper")
+            if not gap_tags:
+                gap_tags.append("none")
+
+            diminishing = False
+            if stop_enabled and rounds and followup_queries and round_idx < round_limit:
+                scored = any(score is not None for score in new_scores)
+                gained = scored and score_gain >= stop_min_gain
+                low_yield_rounds = low_yield_rounds + 1 if (useful_new < stop_min_new and not gained) else 0
+                diminishing = low_yield_rounds >= stop_patience
+
+            # follow-up 只依赖 evidence（不依赖抽取结果），下一轮搜索可与本轮抽取并行。
+            remaining = remaining_ms()
+            has_next_round = bool(followup_queries) and round_idx < round_limit and not diminishing
+            if (
+                has_next_round
+                and search_pool is not None
+                and pipeline_rounds
+                and (remaining is None or remaining >= min_round_ms)
+            ):
+                prefetched = search_pool.submit(run_search_batch, followup_queries, search_budget_ms())
+
+            yield {
+                "event": "search_done",
+                "round": round_idx,
+                "elapsed_ms": int((time.perf_counter() - started_at) * 1000),
+                "queries": list(current_queries),
+                "result_count": len(round_rows),
+                "new_result_count": added_count,
+                "new_results": [
+                    {
+                        "title": evidence[key].get("title", ""),
+                        "url": evidence[key].get("url", ""),
+                        "snippet": evidence[key].get("snippet", ""),
+                        "score": evidence[key].get("score", 0.0),
+                    }
+                    for key in new_urls
+                ],
+                "gaps": list(gap_tags),
+                "followup_queries": list(followup_queries),
+            }
+
+            round_extract_limit = max(0, int(extract_per_round))
+            round_extract_timeout = float(extract_round_timeout_seconds or 0)
+            extract_timeout_from_deadline = False
+            if remaining is not None and round_extract_limit > 0:
+                # 给后续轮次的搜索留出 search_share，剩余时间按单次抽取预估耗时折算可抽取条数。
+                extract_budget_ms = remaining - reserve_ms
+                if has_next_round:
+                    extract_budget_ms = int(extract_budget_ms * (1 - search_share))
+                affordable = max(0, extract_budget_ms // extract_estimate_ms) * max(1, int(extract_concurrency))
+                if affordable < round_extract_limit:
+                    round_notes.append("extract_shrunk_deadline:%s/%s" % (affordable, round_extract_limit))
+                    round_extract_limit = affordable
+                    deadline_hit = True
+                if extract_budget_ms > 0:
+                    seconds = extract_budget_ms / 1000.0
+                    if round_extract_timeout <= 0 or seconds < round_extract_timeout:
+                        round_extract_timeout = seconds
+                        extract_timeout_from_deadline = True
+
+            extract_results: List[Dict] = []
+            cache_hits = 0
+            if int(extract_per_round) > 0:
+                candidates = [k for k in new_urls if k not in extracts and evidence.get(k, {}).get("url", "")]
+                if not candidates:
+                    candidates = [k for k in evidence.keys() if k not in extracts and evidence[k].get("url", "")]
+                if content_store is not None:
+                    uncached: List[str] = []
+                    for key in candidates:
+                        cached = _cached_extract(content_store, evidence[key]["url"], content_max_age_seconds)
+                        if cached is None:
+                            uncached.append(key)
+                            continue
+                        extracts[key] = cached
+                        extract_results.append(cached)
+                        cache_hits += 1
+                    candidates = uncached
+                if cache_hits:
+                    round_notes.append("extract_cache_hit:%s" % cache_hits)
+                ranked = [(key, 0.0) for key in candidates]
+                if bool(extract_ranking["enabled"]) and len(candidates) > 1:
+                    host_stats = load_extract_host_stats(str(getattr(settings, "decision_trace_jsonl_path", "") or ""))
+                    ranked = _rank_extract_targets(candidates, evidence, extract_ranking, host_stats)
+                extract_targets = [key for key, _ in ranked[:round_extract_limit]]
+                if extract_targets and len(candidates) > 1:
+                    trace.add_event(
+                        stage="research.round",
+                        decision="extract_targets_ranked",
+                        reason="rank extract candidates by expected value",
+                        metadata={
+                            "round": str(round_idx),
+                            "candidates": str(len(candidates)),
+                            "selected": " || ".join(
+                                "%s=%s" % (evidence[key]["url"], value) for key, value in ranked[:round_extract_limit]
+                            ),
+                            "cache_hits": str(cache_hits),
+                        },
+                    )
+                targets = [(key, evidence[key]["url"]) for key in extract_targets]
+                outputs, pending = _run_round_extracts(
+                    targets,
                     settings=settings,
                     max_chars=max(200, int(extract_max_chars)),
                     strategy=extract_strategy,
+                    concurrency=max(1, int(extract_concurrency)),
+                    timeout_seconds=round_extract_timeout,
                 )
-                extracts[key] = {
-                    "url": url,
-                    "ok": bool(ex.ok),
-                    "engine": ex.engine,
-                    "notes": list(ex.notes or []),
-                    "summary": _trim(ex.markdown or "", 320),
+                if pending:
+                    round_notes.append("extract_round_deadline:%s/%s" % (len(pending), len(targets)))
+                    if extract_timeout_from_deadline:
+                        deadline_hit = True
+                    trace.add_event(
+                        stage="research.round",
+                        decision="extract_deadline_hit",
+                        reason="round extraction deadline reached; pending extracts abandoned",
+                        metadata={
+                            "round": str(round_idx),
+                            "pending": str(len(pending)),
+                            "timeout_seconds": str(round_extract_timeout),
+                        },
+                    )
+                for key, url in targets:
+                    if key in pending:
+                        # 不写入 extracts，后续轮次还可以重新提取。
+                        extract_results.append(
+                            {"url": url, "ok": False, "engine": "", "notes": ["extract_deadline_exceeded"], "summary": ""}
+                        )
+                        continue
+                    ex = outputs[key]
+                    if isinstance(ex, Exception):
+                        extracts[key] = {
+                            "url": url,
+                            "ok": False,
+                            "engine": "",
+                            "notes": ["extract_failed:%s" % ex],
+                            "summary": "",
+                        }
+                        extract_results.append(extracts[key])
+                        round_notes.extend(extracts[key]["notes"])
+                        continue
+                    extracts[key] = {
+                        "url": url,
+                        "ok": bool(ex.ok),
+                        "engine": ex.engine,
+                        "notes": list(ex.notes or []),
+                        "summary": projection_summary(ex, 320),
+                    }
+                    handle = getattr(getattr(ex, "artifacts", None), "content_handle", None)
+                    if handle:
+                        extracts[key]["content_handle"] = handle
+                    extract_results.append(extracts[key])
+                    round_notes.extend(ex.notes or [])
+                if round_extract_limit > 0 or extract_results:
+                    yield {
+                        "event": "extract_done",
+                        "round": round_idx,
+                        "elapsed_ms": int((time.perf_counter() - started_at) * 1000),
+                        "extracts": list(extract_results),
+                    }
+
+            rounds.append(
+                {
+                    "round": round_idx,
+                    "query": current_queries[0],
+                    "queries": list(current_queries),
+                    "result_count": len(round_rows),
+                    "new_result_count": added_count,
+                    "useful_new_count": useful_new,
+                    "top_score_mean": round(score_mean, 4),
+                    "sources": sorted({(item.source or "").strip() for item in round_rows if (item.source or "").strip()}),
+                    "notes": round_notes,
+                    "gaps": gap_tags,
+                    "followup_query": followup_queries[0] if followup_queries else "",
+                    "followup_queries": list(followup_queries),
+                    "extracts": extract_results,
                 }
-                extract_results.append(extracts[key])
-                round_notes.extend(ex.notes or [])
-
-        hosts = {_host(item.get("url", "")) for item in evidence.values()}
-        has_recent = any(bool(item.get("published_date")) for item in evidence.values())
-        has_arxiv = any("arxiv.org" in host for host in hosts if host)
-        followup_query = _build_followup_query(
-            base_query=query,
-            intent=(intent or ""),
-            total_results=len(evidence),
-            hosts={h for h in hosts if h},
-            has_recent=has_recent,
-            has_arxiv=has_arxiv,
-            asked=asked_queries,
-        )
-        gap_tags: List[str] = []
-        if len(evidence) < 5:
-            gap_tags.append("low_coverage")
-        if ((intent or "").strip().lower() in {"status", "news"}) and not has_recent:
-            gap_tags.append("missing_recency")
-        if not any(_is_official_like(host) for host in hosts if host):
-            gap_tags.append("missing_official")
-        if ("paper" in query.lower()) and not has_arxiv:
-            gap_tags.append("missing_paper")
-        if not gap_tags:
-            gap_tags.append("none")
-
-        rounds.append(
-            {
+            )
+            trace.add_event(
+                stage="research.round",
+                decision="round_completed",
+                reason="search + extract + critique",
+                metadata={
+                    "round": str(round_idx),
+                    "new_results": str(added_count),
+                    "gaps": ",".join(gap_tags),
+                    "has_followup": str(bool(followup_queries)).lower(),
+                    "followup_count": str(len(followup_queries)),
+                },
+            )
+            if diminishing:
+                notes.append("research_diminishing_returns:%s" % round_idx)
+                trace.add_event(
+                    stage="research.round",
+                    decision="diminishing_returns",
+                    reason="round added too little new evidence; stop follow-up",
+                    metadata={
+                        "round": str(round_idx),
+                        "useful_new": str(useful_new),
+                        "score_gain": "%.4f" % score_gain,
+                        "low_yield_rounds": str(low_yield_rounds),
+                    },
+                )
+            if diminishing:
+                checkpoint([], "diminishing_returns")
+            else:
+                checkpoint(followup_queries)
+            summary_event = {
+                "event": "round_summary",
                 "round": round_idx,
-                "query": current_query,
-                "result_count": len(out.results),
-                "new_result_count": added_count,
-                "sources": sorted({(item.source or "").strip() for item in out.results if (item.source or "").strip()}),
-                "notes": round_notes,
-                "gaps": gap_tags,
-                "followup_query": followup_query or "",
-                "extracts": extract_results,
+                "elapsed_ms": int((time.perf_counter() - started_at) * 1000),
+                "summary": rounds[-1],
             }
-        )
-        trace.add_event(
-            stage="research.round",
-            decision="round_completed",
-            reason="search + extract + critique",
-            metadata={
-                "round": str(round_idx),
-                "new_results": str(added_count),
-                "gaps": ",".join(gap_tags),
-                "has_followup": str(bool(followup_query)).lower(),
-            },
-        )
+            if checkpointing:
+                summary_event["session_id"] = session_id
+            yield summary_event
+
+            if not followup_queries:
+                stop_reason = "no_more_gap"
+                break
+            if diminishing:
+                stop_reason = "diminishing_returns"
+                break
+            current_queries = followup_queries
+    finally:
+        if search_pool is not None:
+            search_pool.shutdown(wait=False, cancel_futures=True)
 
-        if not followup_query:
-            stop_reason = "no_more_gap"
-            break
-        current_query = followup_query
-    else:
-        stop_reason = "max_rounds_reached"
+    if deadline_hit and stop_reason != "deadline":
+        notes.append("research_deadline_truncated:%s" % stop_reason)
+        stop_reason = "deadline"
 
     ordered = sorted(
         evidence.values(),
@@ -313,6 +837,8 @@ def run_research_loop(
         )
         extract_hits: Dict[str, int] = {}
         for item in extracts.values():
+            if "content_cache_hit" in (item.get("notes") or []):
+                continue
             one = collect_extract_source_hits(item.get("engine", ""))
             for name, count in one.items():
                 extract_hits[name] = extract_hits.get(name, 0) + int(count)
@@ -345,7 +871,64 @@ def run_research_loop(
         "results": final_results,
         "notes": notes,
     }
+    if deadline_ms:
+        payload["deadline_ms"] = deadline_ms
+    if checkpointing:
+        payload["session_id"] = session_id
+        payload["resumed_rounds"] = resumed_rounds
     if getattr(settings, "decision_trace_enabled", True):
         payload["decision_trace"] = trace.to_dict()
+    if checkpointing:
+        # 跑完即删检查点，只有中断的会话留在磁盘上等待续跑（超期由 prune_research_sessions 清理）。
+        delete_research_session(session_root, session_id)
+    yield {"event": "result", "payload": payload}
+
+
+def run_research_loop(
+    *,
+    query: str,
+    settings: Settings,
+    mode: str = "deep",
+    intent: Optional[str] = None,
+    freshness: Optional[str] = None,
+    limit: int = 6,
+    domain_boost: Optional[List[str]] = None,
+    model_profile: str = "strong",
+    max_rounds: int = 3,
+    extract_per_round: int = 2,
+    extract_max_chars: int = 1600,
+    extract_strategy: str = "auto",
+    extract_concurrency: Optional[int] = None,
+    extract_round_timeout_seconds: Optional[float] = None,
+    pipeline_rounds: Optional[bool] = None,
+    followup_branches: Optional[int] = None,
+    session_id: Optional[str] = None,
+    deadline_ms: Optional[int] = None,
+) -> Dict:
+    """同步入口：消费 iter_research_events，只返回最终 payload。"""
+    payload: Dict = {}
+    events = iter_research_events(
+        query=query,
+        settings=settings,
+        mode=mode,
+        intent=intent,
+        freshness=freshness,
+        limit=limit,
+        domain_boost=domain_boost,
+        model_profile=model_profile,
+        max_rounds=max_rounds,
+        extract_per_round=extract_per_round,
+        extract_max_chars=extract_max_chars,
+        extract_strategy=extract_strategy,
+        extract_concurrency=extract_concurrency,
+        extract_round_timeout_seconds=extract_round_timeout_seconds,
+        pipeline_rounds=pipeline_rounds,
+        followup_branches=followup_branches,
+        session_id=session_id,
+        deadline_ms=deadline_ms,
+    )
+    for event in events:
+        if event.get("event") == "result":
+            payload = event["payload"]
     return payload
 
@@ -0,0 +1,101 @@
+import json
+import os
+import re
+import time
+import uuid
+from pathlib import Path
+from typing import Any, Dict, Optional
+
+from ..contracts import DecisionEvent, DecisionTrace
+
+_SESSION_ID_RE = re.compile(r"^[A-Za-z0-9][A-Za-z0-9_.-]{0,127}$")
+SESSION_VERSION = 1
+
+
+def is_valid_session_id(session_id: str) -> bool:
+    return bool(_SESSION_ID_RE.match(session_id or "")) and ".." not in session_id
+
+
+def new_session_id() -> str:
+    return "r-%s-%s" % (time.strftime("%Y%m%d%H%M%S"), uuid.uuid4().hex[:8])
+
+
+def session_path(root: str, session_id: str) -> Path:
+    if not is_valid_session_id(session_id):
+        raise ValueError("invalid research session_id: %r" % session_id)
+    return Path(root).expanduser() / ("%s.json" % session_id)
+
+
+def load_research_session(root: str, session_id: str) -> Optional[Dict[str, Any]]:
+    path = session_path(root, session_id)
+    try:
+        payload = json.loads(path.read_text(encoding="utf-8"))
+    except Exception:
+        return None
+    if not isinstance(payload, dict) or payload.get("version") != SESSION_VERSION:
+        return None
+    return payload
+
+
+def save_research_session(root: str, session_id: str, state: Dict[str, Any]) -> str:
+    """原子写入检查点（tmp + rename），返回错误信息，成功返回空串。"""
+    try:
+        path = session_path(root, session_id)
+        path.parent.mkdir(parents=True, exist_ok=True)
+        payload = dict(state)
+        payload["version"] = SESSION_VERSION
+        payload["session_id"] = session_id
+        payload["updated_at"] = int(time.time())
+        tmp = path.with_name("%s.%s.tmp" % (path.name, os.getpid()))
+        tmp.write_text(json.dumps(payload, ensure_ascii=False), encoding="utf-8")
+        os.replace(str(tmp), str(path))
+        return ""
+    except Exception as exc:
+        return str(exc)
+
+
+def delete_research_session(root: str, session_id: str) -> None:
+    try:
+        session_path(root, session_id).unlink()
+    except (OSError, ValueError):
+        pass
+
+
+def prune_research_sessions(root: str, max_age_seconds: float) -> int:
+    """删除超过 max_age_seconds 未更新的检查点（中断后没人续跑的会话），返回删除个数。"""
+    if max_age_seconds <= 0:
+        return 0
+    base = Path(root).expanduser()
+    if not base.is_dir():
+        return 0
+    cutoff = time.time() - max_age_seconds
+    removed = 0
+    for path in base.glob("*.json"):
+        try:
+            if path.stat().st_mtime < cutoff:
+                path.unlink()
+                removed += 1
+        except OSError:
+            continue
+    return removed
+
+
+def restore_trace(payload: Optional[Dict[str, Any]], policy_version: str) -> DecisionTrace:
+    if not isinstance(payload, dict):
+        return DecisionTrace(policy_version=policy_version)
+    events = []
+    for item in payload.get("events") or []:
+        if not isinstance(item, dict):
+            continue
+        events.append(
+            DecisionEvent(
+                stage=str(item.get("stage", "")),
+                decision=str(item.get("decision", "")),
+                reason=str(item.get("reason", "")),
+                metadata=dict(item.get("metadata") or {}),
+            )
+        )
+    trace = DecisionTrace(policy_version=str(payload.get("policy_version") or policy_version), events=events)
+    if payload.get("request_id"):
+        trace.request_id = str(payload["request_id"])
+    return trace
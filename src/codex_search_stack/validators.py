@@ -7,7 +7,7 @@ _TIME_SIGNAL_RE = re.compile(
     re.IGNORECASE,
 )
 _DOMAIN_RE = re.compile(r"^[a-zA-Z0-9.-]+\.[a-zA-Z]{2,}$")
-EXTRACT_STRATEGIES = {"auto", "tavily_first", "mineru_first", "tavily_only", "mineru_only"}
+EXTRACT_STRATEGIES = {"auto", "tavily_first", "mineru_first", "tavily_only", "mineru_only", "race"}
 DEFAULT_ANTI_BOT_DOMAINS = {
     "mp.weixin.qq.com",
     "zhuanlan.zhihu.com",
@@ -78,7 +78,7 @@ def validate_extract_protocol(*, url: str, max_chars: int, strategy: str) -> Tup
 
     normalized_strategy = (strategy or "auto").strip().lower()
     if normalized_strategy not in EXTRACT_STRATEGIES:
-        return "strategy must be one of auto/tavily_first/mineru_first/tavily_only/mineru_only", None
+        return "strategy must be one of auto/tavily_first/mineru_first/tavily_only/mineru_only/race", None
 
     return (
         None,
@@ -32,7 +32,8 @@ def _settings(trace_path: str) -> Settings:
         mineru_token_file=None,
         mineru_api_base="https://mineru.net",
         mineru_wrapper_path="skills/mineru-extract/scripts/mineru_parse_documents.py",
-        mineru_workspace="./.runtime/codex-workspace",
+        # 提取成功会把正文写进 <workspace>/content-cache，放到与轨迹同一个临时目录下。
+        mineru_workspace=str(Path(trace_path).parent / "codex-workspace"),
         search_timeout_seconds=10,
         extract_timeout_seconds=10,
         policy={},
@@ -0,0 +1,98 @@
+import json
+import tempfile
+import unittest
+from pathlib import Path
+import sys
+
+ROOT = Path(__file__).resolve().parents[1]
+SRC = ROOT / "src"
+if str(SRC) not in sys.path:
+    sys.path.insert(0, str(SRC))
+
+from codex_search_stack.contracts import DecisionTrace
+from codex_search_stack.observability import (
+    load_extract_host_stats,
+    persist_decision_trace_jsonl,
+    summarize_engine_stats,
+)
+
+
+def _persist_extract(path: str, host: str, outcomes) -> None:
+    trace = DecisionTrace()
+    trace.add_event("extract.policy", "extract_plan_selected", metadata={"host": host})
+    for engine, ok, latency, reason in outcomes:
+        trace.add_event(
+            "extract.execute",
+            "engine_finished",
+            metadata={"engine": engine, "ok": str(ok).lower(), "latency_ms": str(latency), "reason": reason},
+        )
+    persist_decision_trace_jsonl(
+        trace=trace,
+        trace_kind="extract",
+        ok=any(item[1] for item in outcomes),
+        latency_ms=sum(item[2] for item in outcomes),
+        source_hits={},
+        path=path,
+    )
+
+
+class ExtractHostStatsTests(unittest.TestCase):
+    def test_builds_per_host_engine_table(self) -> None:
+        with tempfile.TemporaryDirectory() as tmp:
+            path = str(Path(tmp) / "trace.jsonl")
+            _persist_extract(path, "blocked.example.com", [("tavily", False, 800, "tavily_content_not_usable"), ("mineru", True, 9000, "")])
+            _persist_extract(path, "blocked.example.com", [("tavily", False, 600, "tavily_content_not_usable"), ("mineru", True, 7000, "")])
+            _persist_extract(path, "ok.example.com", [("tavily", True, 500, "")])
+
+            stats = load_extract_host_stats(path)
+            tavily = summarize_engine_stats(stats["blocked.example.com"]["tavily"])
+            mineru = summarize_engine_stats(stats["blocked.example.com"]["mineru"])
+            self.assertEqual(tavily["attempts"], 2)
+            self.assertEqual(tavily["success_rate"], 0.0)
+            self.assertEqual(tavily["not_usable"], 2)
+            self.assertEqual(tavily["latency_ms_avg"], 700)
+            self.assertEqual(mineru["success_rate"], 1.0)
+            self.assertEqual(summarize_engine_stats(stats["ok.example.com"]["tavily"])["successes"], 1)
+
+    def test_refresh_is_incremental_and_survives_partial_lines(self) -> None:
+        with tempfile.TemporaryDirectory() as tmp:
+            path = str(Path(tmp) / "trace.jsonl")
+            _persist_extract(path, "a.example.com", [("tavily", True, 100, "")])
+            self.assertEqual(load_extract_host_stats(path)["a.example.com"]["tavily"]["attempts"], 1)
+
+            sidecar = Path(path + ".extract_host_stats.json")
+            self.assertTrue(sidecar.exists())
+            self.assertEqual(json.loads(sidecar.read_text(encoding="utf-8"))["offset"], Path(path).stat().st_size)
+
+            with open(path, "a", encoding="utf-8") as fp:
+                fp.write('{"kind": "extract", "trace"')
+            self.assertEqual(load_extract_host_stats(path)["a.example.com"]["tavily"]["attempts"], 1)
+
+    def test_returns_snapshot_not_shared_table(self) -> None:
+        with tempfile.TemporaryDirectory() as tmp:
+            path = str(Path(tmp) / "trace.jsonl")
+            _persist_extract(path, "a.example.com", [("tavily", True, 100, "")])
+            first = load_extract_host_stats(path)
+            first["a.example.com"]["tavily"]["attempts"] = 99
+            _persist_extract(path, "a.example.com", [("tavily", True, 100, "")])
+            second = load_extract_host_stats(path)
+        self.assertEqual(first["a.example.com"]["tavily"]["attempts"], 99)
+        self.assertEqual(second["a.example.com"]["tavily"]["attempts"], 2)
+
+    def test_legacy_records_infer_outcome_from_final_engine(self) -> None:
+        with tempfile.TemporaryDirectory() as tmp:
+            path = str(Path(tmp) / "trace.jsonl")
+            trace = DecisionTrace()
+            trace.add_event("extract.policy", "extract_plan_selected", metadata={"host": "legacy.example.com"})
+            trace.add_event("extract.execute", "try_tavily")
+            trace.add_event("extract.execute", "try_mineru")
+            trace.add_event("extract.response", "response_ready", metadata={"ok": "true", "engine": "mineru"})
+            persist_decision_trace_jsonl(trace=trace, trace_kind="extract", ok=True, latency_ms=1, source_hits={}, path=path)
+
+            stats = load_extract_host_stats(path)["legacy.example.com"]
+            self.assertEqual(stats["tavily"]["successes"], 0)
+            self.assertEqual(stats["mineru"]["successes"], 1)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -1,3 +1,5 @@
+import tempfile
+import threading
 import unittest
 from pathlib import Path
 import sys
@@ -10,6 +12,7 @@ if str(SRC) not in sys.path:
 
 from codex_search_stack.config import Settings
 from codex_search_stack.contracts import ExtractionResponse
+from codex_search_stack.extract.content_store import ContentStore
 from codex_search_stack.extract.pipeline import _is_content_usable, run_extract_pipeline
 from codex_search_stack.key_pool import KeyCandidate
 
@@ -35,6 +38,7 @@ def make_settings(**overrides) -> Settings:
         "extract_timeout_seconds": 5,
         "policy": {},
         "decision_trace_enabled": True,
+        "decision_trace_persist": False,
     }
     base.update(overrides)
     return Settings(**base)
@@ -106,6 +110,34 @@ class ExtractPipelineTests(unittest.TestCase):
         self.assertTrue(any(note.startswith("tavily_pool_rotated:") for note in out.notes))
         mineru.assert_not_called()
 
+    def test_long_tavily_markdown_is_projected_and_truncated(self) -> None:
+        url = "https://example.com/long"
+        body = "# Heading\n\n" + ("paragraph text " * 2000)
+
+        def success(**_kwargs) -> ExtractionResponse:
+            return ExtractionResponse(
+                ok=True,
+                source_url=url,
+                engine="tavily_extract",
+                markdown=body,
+                notes=["primary:tavily_extract"],
+                sources=[url],
+            )
+
+        with tempfile.TemporaryDirectory() as tmp:
+            settings = make_settings(mineru_workspace=tmp)
+            with patch("codex_search_stack.extract.pipeline._extract_via_tavily_once", side_effect=success):
+                out = run_extract_pipeline(url, settings=settings, max_chars=500)
+                lean = run_extract_pipeline(url, settings=settings, max_chars=500, include_markdown=False)
+            self.assertEqual(out.markdown, body[:500] + "\n\n[TRUNCATED]")
+            self.assertIn("markdown_truncated:%s" % len(body), out.notes)
+            self.assertEqual(out.projection.total_chars, len(body))
+            self.assertTrue(out.projection.summary.startswith("Heading paragraph text"))
+            store = ContentStore.for_workspace(tmp)
+            self.assertEqual(store.get(out.artifacts.content_handle), body)
+            self.assertIsNone(lean.markdown)
+            self.assertEqual(lean.artifacts.content_handle, out.artifacts.content_handle)
+
     def test_unusable_tavily_content_triggers_mineru(self) -> None:
         settings = make_settings()
         url = "https://example.com/article"
@@ -181,6 +213,63 @@ class ExtractPipelineTests(unittest.TestCase):
         self.assertIn("mineru_failed", out.notes)
         self.assertIsNotNone(out.decision_trace)
 
+    def test_race_returns_first_usable_engine_without_waiting(self) -> None:
+        settings = make_settings()
+        url = "https://example.com/race"
+        release = threading.Event()
+        candidates = [KeyCandidate("tavily", "https://api.tavily.com", "tvly-dev-555555555555", 100, "pool")]
+        tavily_success = ExtractionResponse(
+            ok=True,
+            source_url=url,
+            engine="tavily_extract",
+            markdown="x" * 1000,
+            notes=["primary:tavily_extract"],
+            sources=[url],
+        )
+
+        def slow_mineru(**kwargs):
+            release.wait(5)
+            return ExtractionResponse(ok=True, source_url=url, engine="mineru", markdown="late", sources=[url])
+
+        with patch("codex_search_stack.extract.pipeline.build_service_candidates", return_value=candidates), patch(
+            "codex_search_stack.extract.pipeline._extract_via_tavily_once",
+            return_value=tavily_success,
+        ), patch("codex_search_stack.extract.pipeline.run_mineru_wrapper", side_effect=slow_mineru):
+            out = run_extract_pipeline(url, settings=settings, strategy="race")
+            release.set()
+        self.assertTrue(out.ok)
+        self.assertEqual(out.engine, "tavily_extract")
+        self.assertIn("race_winner:tavily", out.notes)
+        self.assertIn("race_abandoned:mineru", out.notes)
+        decisions = [event.decision for event in out.decision_trace.events]
+        self.assertIn("race_started", decisions)
+        finished = [event.metadata.get("engine") for event in out.decision_trace.events if event.decision == "engine_finished"]
+        self.assertEqual(finished, ["tavily"])
+        self.assertIn("race_resolved", decisions)
+
+    def test_race_skips_unusable_tavily_and_waits_for_mineru(self) -> None:
+        settings = make_settings()
+        url = "https://example.com/race-mineru"
+        candidates = [KeyCandidate("tavily", "https://api.tavily.com", "tvly-dev-666666666666", 100, "pool")]
+        unusable = ExtractionResponse(
+            ok=False,
+            source_url=url,
+            engine="tavily_extract",
+            markdown="blocked",
+            notes=["tavily_content_not_usable"],
+            sources=[url],
+        )
+        mineru_ok = ExtractionResponse(ok=True, source_url=url, engine="mineru", markdown="ok", notes=["mineru_ok"], sources=[url])
+        with patch("codex_search_stack.extract.pipeline.build_service_candidates", return_value=candidates), patch(
+            "codex_search_stack.extract.pipeline._extract_via_tavily_once",
+            return_value=unusable,
+        ), patch("codex_search_stack.extract.pipeline.run_mineru_wrapper", return_value=mineru_ok):
+            out = run_extract_pipeline(url, settings=settings, strategy="race")
+        self.assertTrue(out.ok)
+        self.assertEqual(out.engine, "mineru")
+        self.assertIn("race_winner:mineru", out.notes)
+        self.assertIn("mineru_ok", out.notes)
+
 
 if __name__ == "__main__":
     unittest.main()
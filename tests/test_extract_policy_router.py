@@ -1,3 +1,4 @@
+import tempfile
 import unittest
 from pathlib import Path
 import sys
@@ -9,7 +10,8 @@ if str(SRC) not in sys.path:
 
 from codex_search_stack.config import Settings
 from codex_search_stack.contracts import DecisionTrace, ExtractRequest
-from codex_search_stack.policy.extract_router import build_extract_plan
+from codex_search_stack.observability import persist_decision_trace_jsonl
+from codex_search_stack.policy.extract_router import _explore_draw, build_extract_plan
 
 
 def _settings(**kwargs) -> Settings:
@@ -73,6 +75,96 @@ class ExtractPolicyRouterTests(unittest.TestCase):
         self.assertEqual(plan.first_engine, "mineru")
         self.assertIn("force_mineru:true", plan.notes)
 
+    def test_auto_race_domain_routes_to_race(self) -> None:
+        settings = _settings(policy={"extract": {"race_domains": ["slow.example.com"]}})
+        request = ExtractRequest(url="https://slow.example.com/a", strategy="auto")
+        trace = DecisionTrace()
+
+        plan = build_extract_plan(request, settings, trace)
+
+        self.assertEqual(plan.strategy, "race")
+        self.assertTrue(plan.is_race)
+        self.assertTrue(plan.try_tavily and plan.try_mineru)
+        self.assertIn("auto_strategy_race_domain:race", plan.notes)
+
+    def _failing_history(self, path: str) -> None:
+        for _ in range(5):
+            history = DecisionTrace()
+            history.add_event("extract.policy", "extract_plan_selected", metadata={"host": "flaky.example.com"})
+            history.add_event(
+                "extract.execute",
+                "engine_finished",
+                metadata={"engine": "tavily", "ok": "false", "latency_ms": "900", "reason": "tavily_content_not_usable"},
+            )
+            persist_decision_trace_jsonl(
+                trace=history, trace_kind="extract", ok=False, latency_ms=900, source_hits={}, path=path
+            )
+
+    def test_learned_mineru_host_is_occasionally_explored_with_race(self) -> None:
+        with tempfile.TemporaryDirectory() as tmp:
+            path = str(Path(tmp) / "trace.jsonl")
+            self._failing_history(path)
+            draw = _explore_draw("flaky.example.com", 5)
+            request = ExtractRequest(url="https://flaky.example.com/a", strategy="auto")
+
+            def _with_rate(rate: float) -> Settings:
+                return _settings(
+                    decision_trace_jsonl_path=path, policy={"extract": {"learned_routing": {"explore_rate": rate}}}
+                )
+
+            trace = DecisionTrace()
+            explored = build_extract_plan(request, _with_rate(min(1.0, draw + 1e-6)), trace)
+            again = build_extract_plan(request, _with_rate(min(1.0, draw + 1e-6)), DecisionTrace())
+            locked = build_extract_plan(request, _with_rate(max(0.0, draw - 1e-6)), DecisionTrace())
+            disabled = build_extract_plan(request, _with_rate(0), DecisionTrace())
+
+        self.assertEqual(explored.strategy, "race")
+        self.assertIn("auto_strategy_learned_explore:race", explored.notes)
+        evidence = [event for event in trace.events if event.decision == "learned_route_evidence"]
+        self.assertEqual(evidence[0].metadata["explored"], "true")
+        self.assertEqual(again.strategy, "race")
+        self.assertEqual(locked.strategy, "mineru_first")
+        self.assertEqual(disabled.strategy, "mineru_first")
+
+    def test_explore_draw_is_deterministic_and_moves_with_samples(self) -> None:
+        self.assertEqual(_explore_draw("flaky.example.com", 5), _explore_draw("flaky.example.com", 5))
+        self.assertNotEqual(_explore_draw("flaky.example.com", 5), _explore_draw("flaky.example.com", 6))
+        draws = [_explore_draw("flaky.example.com", n) for n in range(200)]
+        self.assertTrue(all(0.0 <= value < 1.0 for value in draws))
+        self.assertTrue(5 <= sum(1 for value in draws if value < 0.1) <= 40)
+
+    def test_auto_uses_learned_host_history(self) -> None:
+        with tempfile.TemporaryDirectory() as tmp:
+            path = str(Path(tmp) / "trace.jsonl")
+            for _ in range(5):
+                history = DecisionTrace()
+                history.add_event("extract.policy", "extract_plan_selected", metadata={"host": "flaky.example.com"})
+                history.add_event(
+                    "extract.execute",
+                    "engine_finished",
+                    metadata={"engine": "tavily", "ok": "false", "latency_ms": "900", "reason": "tavily_content_not_usable"},
+                )
+                persist_decision_trace_jsonl(
+                    trace=history, trace_kind="extract", ok=False, latency_ms=900, source_hits={}, path=path
+                )
+            settings = _settings(decision_trace_jsonl_path=path)
+            trace = DecisionTrace()
+            plan = build_extract_plan(ExtractRequest(url="https://flaky.example.com/a", strategy="auto"), settings, trace)
+            self.assertEqual(plan.strategy, "mineru_first")
+            self.assertIn("auto_strategy_learned:mineru_first", plan.notes)
+            evidence = [event for event in trace.events if event.decision == "learned_route_evidence"]
+            self.assertEqual(evidence[0].metadata["tavily_attempts"], "5")
+
+            unseen = build_extract_plan(ExtractRequest(url="https://fresh.example.com/a", strategy="auto"), settings, DecisionTrace())
+            self.assertEqual(unseen.strategy, "tavily_first")
+
+            disabled = _settings(
+                decision_trace_jsonl_path=path,
+                policy={"extract": {"learned_routing": {"enabled": False}}},
+            )
+            plan = build_extract_plan(ExtractRequest(url="https://flaky.example.com/a", strategy="auto"), disabled, DecisionTrace())
+            self.assertEqual(plan.strategy, "tavily_first")
+
 
 if __name__ == "__main__":
     unittest.main()
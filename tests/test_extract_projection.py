@@ -0,0 +1,159 @@
+import os
+import tempfile
+import threading
+import time
+import unittest
+from pathlib import Path
+import sys
+
+ROOT = Path(__file__).resolve().parents[1]
+SRC = ROOT / "src"
+if str(SRC) not in sys.path:
+    sys.path.insert(0, str(SRC))
+
+from codex_search_stack.extract.content_store import ContentStore, content_handle
+from codex_search_stack.extract.projection import (
+    approx_token_count,
+    build_projection,
+    iter_markdown_chunks,
+    projection_summary,
+    summary_window,
+)
+
+
+def _sample_markdown() -> str:
+    return (
+        "# Title\n\n"
+        "![logo](https://example.com/logo.png)\n"
+        "Intro with a [link](https://example.com/a) and **bold** text.\n\n"
+        + ("word " * 400)
+        + "\n\n## 第二节\n\n"
+        + ("中文内容" * 200)
+        + "\n"
+    )
+
+
+class ProjectionTests(unittest.TestCase):
+    def test_token_count_treats_cjk_chars_as_tokens(self) -> None:
+        self.assertEqual(approx_token_count("中文"), 2)
+        self.assertEqual(approx_token_count("word"), 1)
+        self.assertEqual(approx_token_count("extraction"), 3)
+        self.assertEqual(approx_token_count("a, b"), 3)
+
+    def test_summary_window_strips_markdown_noise(self) -> None:
+        summary = summary_window(_sample_markdown(), 60)
+        self.assertTrue(summary.startswith("Title Intro with a link and bold text."))
+        self.assertNotIn("logo.png", summary)
+        self.assertLessEqual(len(summary), 60)
+
+    def test_chunks_cover_text_within_token_budget(self) -> None:
+        text = _sample_markdown()
+        chunks = list(iter_markdown_chunks(text.splitlines(keepends=True), max_tokens=128))
+        self.assertGreater(len(chunks), 3)
+        self.assertEqual(chunks[0][0].start, 0)
+        self.assertEqual(chunks[-1][0].end, len(text))
+        for (chunk, chunk_text), (nxt, _) in zip(chunks, chunks[1:]):
+            self.assertEqual(chunk.end, nxt.start)
+            self.assertEqual(text[chunk.start : chunk.end], chunk_text)
+        self.assertTrue(all(chunk.tokens <= 128 for chunk, _ in chunks))
+        self.assertEqual(chunks[-1][0].heading, "第二节")
+
+    def test_build_projection_caps_chunk_list(self) -> None:
+        text = _sample_markdown()
+        projection = build_projection(text, head_chars=50, summary_chars=80, chunk_tokens=64, max_chunks=2)
+        self.assertEqual(projection.head, text[:50])
+        self.assertEqual(len(projection.chunks), 2)
+        self.assertTrue(projection.chunks_truncated)
+        self.assertEqual(projection.total_chars, len(text))
+        self.assertGreater(projection.total_tokens, 64 * 2)
+
+    def test_projection_summary_falls_back_to_markdown(self) -> None:
+        class Legacy:
+            markdown = "line one\nline two"
+
+        self.assertEqual(projection_summary(Legacy(), 320), "line one line two")
+
+
+class ContentStoreTests(unittest.TestCase):
+    def test_put_get_and_stream_chunks_by_handle(self) -> None:
+        with tempfile.TemporaryDirectory() as tmp:
+            store = ContentStore.for_workspace(tmp)
+            text = _sample_markdown()
+            handle = store.put("https://example.com/post/?utm_source=x", text, engine="tavily_extract")
+            self.assertEqual(handle, content_handle("https://example.com/post"))
+            self.assertTrue(store.has("https://example.com/post"))
+            self.assertEqual(store.get(handle), text)
+            self.assertEqual(store.get(handle, max_chars=7), "# Title")
+            self.assertEqual(store.meta(handle)["chars"], len(text))
+            streamed = "".join(chunk_text for _, chunk_text in store.iter_chunks(handle, max_tokens=128))
+            self.assertEqual(streamed, text)
+
+    def test_concurrent_puts_of_same_url_do_not_collide(self) -> None:
+        errors = []
+        with tempfile.TemporaryDirectory() as tmp:
+            store = ContentStore.for_workspace(tmp)
+            bodies = ["%s body" % name * 2000 for name in ("first", "second")]
+
+            def _writer(body):
+                try:
+                    for _ in range(20):
+                        store.put("https://example.com/same", body)
+                except Exception as exc:
+                    errors.append(exc)
+
+            threads = [threading.Thread(target=_writer, args=(body,)) for body in bodies]
+            for thread in threads:
+                thread.start()
+            for thread in threads:
+                thread.join()
+            stored = store.get(content_handle("https://example.com/same"))
+            leftovers = list(Path(tmp).rglob("*.tmp"))
+
+        self.assertEqual(errors, [])
+        self.assertIn(stored, bodies)
+        self.assertEqual(leftovers, [])
+
+    def test_prune_evicts_idle_then_least_recently_used(self) -> None:
+        with tempfile.TemporaryDirectory() as tmp:
+            store = ContentStore.for_workspace(tmp)
+            now = time.time()
+            handles = []
+            for idx, age_days in enumerate([40, 3, 2, 1]):
+                handle = store.put("https://example.com/%s" % idx, "x" * 1000, engine="tavily_extract")
+                text_path = Path(tmp) / "content-cache" / handle[:2] / ("%s.md" % handle)
+                os.utime(str(text_path), (now - age_days * 86400, now - age_days * 86400))
+                handles.append(handle)
+            # 读取刷新访问时间：最旧的 #1 被读过后不应再被 LRU 淘汰。
+            store.get(handles[1], max_chars=1)
+            before = store.stats()
+            dry = store.prune(max_bytes=2500, max_age_seconds=30 * 86400, dry_run=True)
+            self.assertEqual(store.stats()["entries"], 4)
+            result = store.prune(max_bytes=2500, max_age_seconds=30 * 86400)
+            remaining = [handle for handle in handles if store.get(handle) is not None]
+
+        self.assertEqual(before["entries"], 4)
+        self.assertEqual(dry["evicted"], 2)
+        self.assertEqual(result["evicted"], 2)
+        self.assertLessEqual(result["total_bytes"], 2500)
+        self.assertEqual(remaining, [handles[1], handles[3]])
+
+    def test_enforce_is_throttled_per_root(self) -> None:
+        with tempfile.TemporaryDirectory() as tmp:
+            store = ContentStore.for_workspace(tmp)
+            store.put("https://example.com/a", "x" * 100)
+            self.assertIsNone(store.enforce(max_bytes=0, max_age_seconds=0))
+            first = store.enforce(max_bytes=10, max_age_seconds=0)
+            store.put("https://example.com/b", "x" * 100)
+            second = store.enforce(max_bytes=10, max_age_seconds=0)
+        self.assertEqual(first["evicted"], 1)
+        self.assertIsNone(second)
+
+    def test_rejects_malformed_handles(self) -> None:
+        with tempfile.TemporaryDirectory() as tmp:
+            store = ContentStore.for_workspace(tmp)
+            with self.assertRaises(ValueError):
+                store.get("../../etc/passwd")
+
+
+if __name__ == "__main__":
+    unittest.main()
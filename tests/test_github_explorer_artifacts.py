@@ -0,0 +1,281 @@
+import json
+import os
+import sys
+import tempfile
+import threading
+import unittest
+from pathlib import Path
+from unittest.mock import patch
+
+ROOT = Path(__file__).resolve().parents[1]
+SRC = ROOT / "src"
+if str(SRC) not in sys.path:
+    sys.path.insert(0, str(SRC))
+
+from codex_search_stack.github_explorer.artifacts import _PdfStore, find_latest_report, persist_explore_artifacts
+
+
+class _FakePdfResponse:
+    def __init__(self, body, status_code=200, headers=None):
+        self.body = body
+        self.status_code = status_code
+        self.headers = headers or {}
+
+    def iter_content(self, chunk_size=None):
+        for start in range(0, len(self.body), 4):
+            yield self.body[start : start + 4]
+
+    def raise_for_status(self):
+        if self.status_code >= 400:
+            raise RuntimeError("http %s" % self.status_code)
+
+
+def _result(*papers):
+    return {
+        "ok": True,
+        "repo": {"full_name": "example-org/example-repo"},
+        "book": {"papers": [{"title": title, "url": url, "pdf_url": url} for title, url in papers]},
+    }
+
+
+class BookDownloadTests(unittest.TestCase):
+    def _persist(self, root, result, out_name="out", **kwargs):
+        return persist_explore_artifacts(
+            result=result,
+            markdown_text="# report",
+            project_root=Path(root),
+            out_dir=str(Path(root) / out_name),
+            download_book=True,
+            timeout=10,
+            **kwargs
+        )
+
+    def test_downloads_run_concurrently_and_dedup_by_content(self) -> None:
+        barrier = threading.Barrier(3, timeout=2)
+        bodies = {
+            "https://arxiv.org/pdf/1.pdf": b"%PDF-one",
+            "https://arxiv.org/pdf/2.pdf": b"%PDF-two",
+            "https://arxiv.org/pdf/mirror.pdf": b"%PDF-one",
+        }
+
+        def _fake_get(url, **kwargs):
+            barrier.wait()
+            return _FakePdfResponse(bodies[url])
+
+        with tempfile.TemporaryDirectory() as tmp:
+            result = _result(
+                ("One", "https://arxiv.org/pdf/1.pdf"),
+                ("Two", "https://arxiv.org/pdf/2.pdf"),
+                ("Mirror", "https://arxiv.org/pdf/mirror.pdf"),
+            )
+            with patch("codex_search_stack.github_explorer.artifacts.requests.get", side_effect=_fake_get):
+                stats = self._persist(tmp, result, download_concurrency=3)
+            papers = Path(tmp) / "out" / "book" / "papers"
+            self.assertEqual((papers / "One.pdf").read_bytes(), b"%PDF-one")
+            self.assertEqual((papers / "Mirror.pdf").read_bytes(), b"%PDF-one")
+            self.assertEqual(len(list((Path(tmp) / ".runtime" / "book-cache" / "blobs").iterdir())), 2)
+            readme = Path(stats["book_readme"]).read_text(encoding="utf-8")
+
+        self.assertEqual((stats["book_downloaded"], stats["book_download_reused"], stats["book_download_failed"]), (2, 1, 0))
+        self.assertLess(readme.index("papers/One.pdf"), readme.index("papers/Two.pdf"))
+        # One 与 Mirror 内容相同，先完成的那个入库，另一个命中去重。
+        self.assertEqual(readme.count("download: ok (deduped) -> papers/"), 1)
+        self.assertNotIn("(deduped) -> papers/Two.pdf", readme)
+
+    def test_partial_download_resumes_with_range_and_later_runs_reuse_store(self) -> None:
+        url = "https://arxiv.org/pdf/1.pdf"
+        body = b"%PDF-complete-body"
+        seen_ranges = []
+
+        def _flaky_get(url, headers=None, **kwargs):
+            seen_ranges.append((headers or {}).get("Range"))
+            if len(seen_ranges) == 1:
+                response = _FakePdfResponse(body)
+                chunks = list(response.iter_content())
+
+                def _broken(chunk_size=None):
+                    yield chunks[0]
+                    yield chunks[1]
+                    raise ConnectionError("reset")
+
+                response.iter_content = _broken
+                return response
+            offset = int(headers["Range"].split("=")[1].rstrip("-"))
+            return _FakePdfResponse(body[offset:], status_code=206)
+
+        with tempfile.TemporaryDirectory() as tmp:
+            with patch("codex_search_stack.github_explorer.artifacts.requests.get", side_effect=_flaky_get):
+                first = self._persist(tmp, _result(("One", url)))
+                self.assertEqual(first["book_download_failed"], 1)
+                self.assertFalse((Path(tmp) / "out" / "book" / "papers" / "One.pdf").exists())
+                second = self._persist(tmp, _result(("One", url)))
+            self.assertEqual(seen_ranges, [None, "bytes=8-"])
+            self.assertEqual(second["book_downloaded"], 1)
+            self.assertEqual((Path(tmp) / "out" / "book" / "papers" / "One.pdf").read_bytes(), body)
+
+            with patch("codex_search_stack.github_explorer.artifacts.requests.get") as get:
+                third = self._persist(tmp, _result(("One", url)), out_name="other")
+            get.assert_not_called()
+            self.assertEqual(third["book_download_reused"], 1)
+            self.assertEqual((Path(tmp) / "other" / "book" / "papers" / "One.pdf").read_bytes(), body)
+
+    def test_range_not_satisfiable_restarts_unless_part_matches_server_size(self) -> None:
+        url = "https://arxiv.org/pdf/1.pdf"
+        body = b"%PDF-complete-body"
+        for content_range, expected_ranges in (
+            ("bytes */%s" % len(body), ["bytes=%s-" % len(body)]),
+            ("bytes */999", ["bytes=%s-" % len(body), None]),
+            ("", ["bytes=%s-" % len(body), None]),
+        ):
+            seen_ranges = []
+
+            def _fake_get(url, headers=None, **kwargs):
+                seen_ranges.append((headers or {}).get("Range"))
+                if headers:
+                    return _FakePdfResponse(b"", status_code=416, headers={"Content-Range": content_range})
+                return _FakePdfResponse(body)
+
+            with tempfile.TemporaryDirectory() as tmp:
+                store = _PdfStore(Path(tmp) / ".runtime" / "book-cache")
+                store.part_path(url).write_bytes(b"%PDF-stale-garbage"[: len(body)])
+                with patch("codex_search_stack.github_explorer.artifacts.requests.get", side_effect=_fake_get):
+                    stats = self._persist(tmp, _result(("One", url)))
+                self.assertEqual(stats["book_downloaded"], 1)
+                self.assertEqual(seen_ranges, expected_ranges)
+                if expected_ranges[-1] is None:
+                    self.assertEqual((Path(tmp) / "out" / "book" / "papers" / "One.pdf").read_bytes(), body)
+
+    def test_concurrent_stores_merge_index_and_share_downloads(self) -> None:
+        started = threading.Event()
+        calls = []
+
+        def _slow_get(url, **kwargs):
+            calls.append(url)
+            started.set()
+            threading.Event().wait(0.2)
+            return _FakePdfResponse(b"%PDF-" + url.encode("utf-8"))
+
+        with tempfile.TemporaryDirectory() as tmp:
+            root = Path(tmp) / ".runtime" / "book-cache"
+            # 三个实例都在任何提交前创建，相当于各自持有旧索引的多个 explore 进程。
+            stores = [_PdfStore(root) for _ in range(3)]
+            with patch("codex_search_stack.github_explorer.artifacts._PdfStore", side_effect=stores), patch(
+                "codex_search_stack.github_explorer.artifacts.requests.get", side_effect=_slow_get
+            ):
+                shared = _result(("One", "https://arxiv.org/pdf/1.pdf"))
+                worker = threading.Thread(target=self._persist, args=(tmp, shared, "a"))
+                worker.start()
+                started.wait(2)
+                stats = self._persist(tmp, shared, "b")
+                worker.join(2)
+                self._persist(tmp, _result(("Two", "https://arxiv.org/pdf/2.pdf")), "c")
+
+            index = json.loads((root / "index.json").read_text(encoding="utf-8"))
+            self.assertEqual(calls, ["https://arxiv.org/pdf/1.pdf", "https://arxiv.org/pdf/2.pdf"])
+            self.assertEqual(stats["book_download_reused"], 1)
+            self.assertEqual(sorted(index), ["https://arxiv.org/pdf/1.pdf", "https://arxiv.org/pdf/2.pdf"])
+
+    def test_oversized_pdf_is_rejected_without_leaving_files(self) -> None:
+        url = "https://arxiv.org/pdf/big.pdf"
+        responses = [
+            _FakePdfResponse(b"x" * 64, headers={"Content-Length": "64"}),
+            _FakePdfResponse(b"x" * 64),
+        ]
+        with tempfile.TemporaryDirectory() as tmp:
+            with patch("codex_search_stack.github_explorer.artifacts.requests.get", side_effect=responses):
+                declared = self._persist(tmp, _result(("Big", url)), max_pdf_bytes=16)
+                streamed = self._persist(tmp, _result(("Big", url)), max_pdf_bytes=16)
+            self.assertEqual(list((Path(tmp) / "out" / "book" / "papers").iterdir()), [])
+            self.assertEqual(list((Path(tmp) / ".runtime" / "book-cache" / "parts").iterdir()), [])
+            readme = Path(streamed["book_readme"]).read_text(encoding="utf-8")
+        self.assertEqual(declared["book_download_failed"], 1)
+        self.assertIn("download: failed (too_large:>16)", readme)
+
+    def test_truncated_existing_file_is_replaced_instead_of_reported_as_exists(self) -> None:
+        url = "https://arxiv.org/pdf/1.pdf"
+        body = b"%PDF-1.7 complete body %%EOF"
+        with tempfile.TemporaryDirectory() as tmp:
+            papers = Path(tmp) / "out" / "book" / "papers"
+            papers.mkdir(parents=True)
+            # 未入库时：上次中断留下的半个文件（无 %%EOF）不能算 exists，要重新下载。
+            (papers / "One.pdf").write_bytes(body[:12])
+            with patch(
+                "codex_search_stack.github_explorer.artifacts.requests.get", return_value=_FakePdfResponse(body)
+            ) as get:
+                first = self._persist(tmp, _result(("One", url)))
+            get.assert_called_once()
+            self.assertEqual(first["book_downloaded"], 1)
+            self.assertEqual((papers / "One.pdf").read_bytes(), body)
+
+            # 已入库时：大小与 blob 不符就从存储放回，不发请求（先 unlink，别写穿硬链接到 blob）。
+            (papers / "One.pdf").unlink()
+            (papers / "One.pdf").write_bytes(body[:-3])
+            with patch("codex_search_stack.github_explorer.artifacts.requests.get") as get:
+                repaired = Path(self._persist(tmp, _result(("One", url)))["book_readme"]).read_text(encoding="utf-8")
+                intact = self._persist(tmp, _result(("One", url)))
+            get.assert_not_called()
+            self.assertEqual((papers / "One.pdf").read_bytes(), body)
+            self.assertIn("download: ok (cached) -> papers/One.pdf", repaired)
+            self.assertIn("download: ok (exists) -> papers/One.pdf", Path(intact["book_readme"]).read_text(encoding="utf-8"))
+
+    def test_store_prune_evicts_least_recently_used_blobs(self) -> None:
+        bodies = {"https://arxiv.org/pdf/%s.pdf" % idx: (b"%%PDF-%s" % str(idx).encode()) * 10 for idx in range(3)}
+        with tempfile.TemporaryDirectory() as tmp:
+            store = _PdfStore(Path(tmp) / ".runtime" / "book-cache")
+            for offset, (url, body) in enumerate(bodies.items()):
+                part = store.part_path(url)
+                part.write_bytes(body)
+                blob, _ = store.commit(url, part)
+                os.utime(str(blob), (1000 + offset, 1000 + offset))
+            # 最早入库的 0 刚被命中，淘汰应落在 1 上。
+            self.assertIsNotNone(store.lookup("https://arxiv.org/pdf/0.pdf"))
+            size = len(bodies["https://arxiv.org/pdf/0.pdf"])
+            self.assertEqual(store.prune(max_bytes=size * 2), 1)
+            self.assertEqual(store.prune(max_bytes=0), 0)
+            reopened = _PdfStore(store.root)
+            index = json.loads(store.index_path.read_text(encoding="utf-8"))
+
+        self.assertIsNotNone(reopened._index.get("https://arxiv.org/pdf/0.pdf"))
+        self.assertNotIn("https://arxiv.org/pdf/1.pdf", index)
+        self.assertEqual(sorted(index), ["https://arxiv.org/pdf/0.pdf", "https://arxiv.org/pdf/2.pdf"])
+
+    def test_persist_enforces_book_cache_limit_once_per_interval(self) -> None:
+        url = "https://arxiv.org/pdf/1.pdf"
+        with tempfile.TemporaryDirectory() as tmp:
+            with patch(
+                "codex_search_stack.github_explorer.artifacts.requests.get",
+                return_value=_FakePdfResponse(b"%PDF-body %%EOF"),
+            ), patch.object(_PdfStore, "prune", return_value=0) as prune:
+                self._persist(tmp, _result(("One", url)), cache_max_bytes=1024)
+                self._persist(tmp, _result(("One", url)), out_name="again", cache_max_bytes=1024)
+        prune.assert_called_once_with(1024)
+
+
+class LatestReportTests(unittest.TestCase):
+    def _write(self, root, name, report):
+        report_dir = Path(root) / ".runtime" / "github-explorer" / name
+        report_dir.mkdir(parents=True)
+        (report_dir / "report.json").write_text(json.dumps(report), encoding="utf-8")
+
+    def test_picks_newest_ok_report_for_the_repo(self) -> None:
+        repo = {"full_name": "Example-Org/example-repo"}
+        with tempfile.TemporaryDirectory() as tmp:
+            # 旧报告没有 generated_at，从目录时间戳推断。
+            self._write(tmp, "Example-Org_example-repo_20260101_000000Z", {"ok": True, "repo": repo})
+            self._write(
+                tmp,
+                "Example-Org_example-repo_20260105_000000Z",
+                {"ok": True, "repo": repo, "generated_at": "2026-01-04T23:59:00Z"},
+            )
+            self._write(tmp, "Example-Org_example-repo_20260109_000000Z", {"ok": False, "repo": repo})
+            self._write(tmp, "Example-Org_example-repo-two_20260110_000000Z", {"ok": True, "repo": {"full_name": "x/y"}})
+            report, path = find_latest_report("example-org/example-repo", project_root=Path(tmp))
+            missing = find_latest_report("other/repo", project_root=Path(tmp))
+
+        self.assertEqual(report["generated_at"], "2026-01-04T23:59:00Z")
+        self.assertIn("20260105_000000Z", path)
+        self.assertEqual(missing, (None, ""))
+
+
+if __name__ == "__main__":
+    unittest.main()
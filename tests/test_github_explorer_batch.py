@@ -0,0 +1,148 @@
+import json
+import sys
+import tempfile
+import threading
+import types
+import unittest
+from pathlib import Path
+from unittest.mock import patch
+
+ROOT = Path(__file__).resolve().parents[1]
+SRC = ROOT / "src"
+if str(SRC) not in sys.path:
+    sys.path.insert(0, str(SRC))
+
+from codex_search_stack.github_explorer.batch import normalize_targets, report_slug, run_github_explorer_batch
+
+
+def _report(target, ok=True):
+    if not ok:
+        return {"ok": False, "target": target, "error": "无法解析 GitHub 仓库", "notes": []}
+    return {
+        "ok": True,
+        "repo": {"full_name": target, "url": "https://github.com/%s" % target},
+        "issues": [],
+        "commits": [],
+        "external": [],
+        "comparisons": [],
+        "index_coverage": {},
+        "confidence": {"score": 70, "level": "medium"},
+        "notes": [],
+    }
+
+
+class GithubExplorerBatchTests(unittest.TestCase):
+    def test_normalize_targets_skips_comments_and_duplicates(self) -> None:
+        self.assertEqual(
+            normalize_targets(["a/b", "", "# note", "A/B", "https://github.com/c/d/", "c/d"]),
+            ["a/b", "https://github.com/c/d/", "c/d"],
+        )
+        self.assertNotEqual(report_slug("a/b"), report_slug("a_b"))
+
+    def test_batch_runs_concurrently_and_writes_each_report(self) -> None:
+        barrier = threading.Barrier(3, timeout=2)
+        sessions = set()
+
+        def _fake_explore(target, settings, session=None, **kwargs):
+            sessions.add(id(session))
+            barrier.wait()
+            return _report(target, ok=(target != "bad/repo"))
+
+        progress = []
+        with tempfile.TemporaryDirectory() as tmp, patch(
+            "codex_search_stack.github_explorer.batch.run_github_explorer", side_effect=_fake_explore
+        ):
+            summary = run_github_explorer_batch(
+                ["org/one", "org/two", "bad/repo"],
+                settings=types.SimpleNamespace(),
+                concurrency=3,
+                out_dir=tmp,
+                on_result=progress.append,
+            )
+            written = json.loads((Path(tmp) / ("%s.json" % report_slug("org/one"))).read_text(encoding="utf-8"))
+            markdown = (Path(tmp) / ("%s.md" % report_slug("org/one"))).read_text(encoding="utf-8")
+            on_disk = json.loads((Path(tmp) / "summary.json").read_text(encoding="utf-8"))
+
+        self.assertEqual(len(sessions), 1)
+        self.assertEqual(written["repo"]["full_name"], "org/one")
+        self.assertIn("org/one", markdown)
+        self.assertEqual([row["target"] for row in summary["results"]], ["org/one", "org/two", "bad/repo"])
+        self.assertEqual([row["status"] for row in summary["results"]], ["ok", "ok", "failed"])
+        self.assertEqual((summary["completed"], summary["failed"]), (2, 1))
+        self.assertFalse(summary["ok"])
+        self.assertEqual(len(progress), 3)
+        self.assertEqual(on_disk["total"], 3)
+
+    def test_resume_skips_finished_reports_and_retries_failures(self) -> None:
+        calls = []
+
+        def _fake_explore(target, settings, session=None, **kwargs):
+            calls.append(target)
+            return _report(target, ok=(target != "bad/repo" or len(calls) > 2))
+
+        with tempfile.TemporaryDirectory() as tmp, patch(
+            "codex_search_stack.github_explorer.batch.run_github_explorer", side_effect=_fake_explore
+        ):
+            run_github_explorer_batch(["org/one", "bad/repo"], settings=types.SimpleNamespace(), concurrency=1, out_dir=tmp)
+            summary = run_github_explorer_batch(
+                ["org/one", "bad/repo"], settings=types.SimpleNamespace(), concurrency=1, out_dir=tmp
+            )
+            self.assertEqual(calls, ["org/one", "bad/repo", "bad/repo"])
+            self.assertEqual([row["status"] for row in summary["results"]], ["skipped", "ok"])
+            self.assertTrue(summary["ok"])
+
+            run_github_explorer_batch(
+                ["org/one"], settings=types.SimpleNamespace(), concurrency=1, out_dir=tmp, resume=False
+            )
+        self.assertEqual(calls[-1], "org/one")
+
+    def test_incremental_refreshes_finished_reports_from_previous(self) -> None:
+        previous = []
+
+        def _fake_explore(target, settings, session=None, previous_report=None, **kwargs):
+            previous.append(previous_report)
+            return _report(target)
+
+        with tempfile.TemporaryDirectory() as tmp, patch(
+            "codex_search_stack.github_explorer.batch.run_github_explorer", side_effect=_fake_explore
+        ):
+            run_github_explorer_batch(["org/one"], settings=types.SimpleNamespace(), concurrency=1, out_dir=tmp)
+            summary = run_github_explorer_batch(
+                ["org/one"], settings=types.SimpleNamespace(), concurrency=1, out_dir=tmp, incremental=True
+            )
+        self.assertIsNone(previous[0])
+        self.assertEqual(previous[1]["repo"]["full_name"], "org/one")
+        self.assertEqual(summary["results"][0]["status"], "ok")
+
+    def test_exception_is_recorded_as_failed_report(self) -> None:
+        with tempfile.TemporaryDirectory() as tmp, patch(
+            "codex_search_stack.github_explorer.batch.run_github_explorer", side_effect=RuntimeError("boom")
+        ):
+            summary = run_github_explorer_batch(["org/one"], settings=types.SimpleNamespace(), out_dir=tmp)
+        self.assertEqual(summary["results"][0]["status"], "failed")
+        self.assertEqual(summary["results"][0]["error"], "boom")
+
+    def test_write_failure_marks_only_that_target_failed(self) -> None:
+        def _fake_render(report):
+            if report["repo"]["full_name"] == "org/two":
+                raise OSError("disk full")
+            return "# ok"
+
+        with tempfile.TemporaryDirectory() as tmp, patch(
+            "codex_search_stack.github_explorer.batch.run_github_explorer",
+            side_effect=lambda target, settings, session=None, **kwargs: _report(target),
+        ), patch("codex_search_stack.github_explorer.batch.render_markdown", side_effect=_fake_render):
+            summary = run_github_explorer_batch(
+                ["org/one", "org/two"], settings=types.SimpleNamespace(), concurrency=2, out_dir=tmp
+            )
+            written = sorted(path.name for path in Path(tmp).glob("*.json"))
+
+        rows = {row["target"]: row for row in summary["results"]}
+        self.assertEqual((rows["org/one"]["status"], rows["org/two"]["status"]), ("ok", "failed"))
+        self.assertEqual(rows["org/two"]["error"], "write_failed:disk full")
+        self.assertEqual(summary["failed"], 1)
+        self.assertEqual(written, ["%s.json" % report_slug("org/one"), "summary.json"])
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -1,4 +1,9 @@
+import json
+import os
 import sys
+import tempfile
+import threading
+import time
 import types
 import unittest
 from pathlib import Path
@@ -10,11 +15,20 @@ if str(SRC) not in sys.path:
     sys.path.insert(0, str(SRC))
 
 from codex_search_stack.contracts import SearchResult
+from codex_search_stack.github_explorer import github_client
+from codex_search_stack.github_explorer.explore_cache import ExploreCache
+from codex_search_stack.github_explorer.github_client import GitHubClient
+from codex_search_stack.github_explorer.report import render_markdown
 from codex_search_stack.github_explorer.orchestrator import (
     _collect_deepwiki,
     _collect_external,
+    _collect_repo_data,
+    _collect_repo_data_incremental,
     _collect_zread,
     _external_relevance_score,
+    _extract_external_items,
+    _run_external_query,
+    run_github_explorer,
 )
 
 
@@ -81,6 +95,39 @@ class GithubExplorerExternalTests(unittest.TestCase):
         self.assertIsInstance(competitors, list)
         self.assertIn("arxiv", coverage)
 
+    def test_index_phase_cache_keeps_hits_and_reprobes_not_indexed(self) -> None:
+        deepwiki = {"title": "DeepWiki", "url": "https://deepwiki.com/example-org/example-repo", "snippet": "", "source": "deepwiki", "published_date": ""}
+
+        def _fake_search(**kwargs):
+            return types.SimpleNamespace(results=[], notes=[])
+
+        with tempfile.TemporaryDirectory() as tmp:
+            cache = ExploreCache(Path(tmp))
+            with patch("codex_search_stack.github_explorer.orchestrator.run_multi_source_search", side_effect=_fake_search), patch(
+                "codex_search_stack.github_explorer.orchestrator._collect_deepwiki", return_value=(deepwiki, [])
+            ) as deepwiki_probe, patch(
+                "codex_search_stack.github_explorer.orchestrator._collect_zread",
+                return_value=(None, ["zread_unavailable:not_indexed"]),
+            ) as zread_probe:
+                for _ in range(2):
+                    _, notes, _, coverage = _collect_external(
+                        owner="example-org",
+                        repo="example-repo",
+                        settings=types.SimpleNamespace(),
+                        external_limit=2,
+                        extract_top=0,
+                        with_extract=False,
+                        cache=cache,
+                    )
+            cached = cache.get("index", "example-org", "example-repo")
+
+        # 未收录不进 7 天的 index 缓存，由探测自己的负缓存（negative_ttl_seconds）决定何时重探。
+        self.assertEqual((deepwiki_probe.call_count, zread_probe.call_count), (1, 2))
+        self.assertEqual(sorted(cached), ["deepwiki"])
+        self.assertIn("explore_cache_hit:index", notes)
+        self.assertIn("zread_unavailable:not_indexed", notes)
+        self.assertEqual(coverage["deepwiki"]["status"], "found")
+
     def test_collect_external_prioritizes_deepwiki_when_available(self) -> None:
         mock_rows = [
             SearchResult(
@@ -199,6 +246,78 @@ class GithubExplorerExternalTests(unittest.TestCase):
         self.assertIsNone(item)
         self.assertIn("zread_unavailable:not_indexed", notes)
 
+    def test_probe_index_page_stops_streaming_once_title_and_anchor_found(self) -> None:
+        consumed = []
+
+        class _StreamingResponse:
+            status_code = 200
+            url = "https://deepwiki.com/example-org/example-repo"
+            closed = False
+
+            def iter_content(self, chunk_size=None):
+                chunks = [b"<html><head><title>Example", b" DeepWiki</title></head>", b"<body>" + b"x" * 8192, b"tail"]
+                for chunk in chunks:
+                    consumed.append(chunk)
+                    yield chunk
+
+            def close(self):
+                self.closed = True
+
+        response = _StreamingResponse()
+        with patch("codex_search_stack.github_explorer.orchestrator.requests.get", return_value=response) as get:
+            item, notes = _collect_deepwiki("example-org", "example-repo", settings=types.SimpleNamespace(search_timeout_seconds=10))
+        self.assertTrue(get.call_args.kwargs["stream"])
+        self.assertEqual(item["title"], "Example DeepWiki")
+        self.assertEqual(notes, [])
+        self.assertEqual(len(consumed), 2)
+        self.assertTrue(response.closed)
+
+    def test_collect_zread_returns_first_hit_without_waiting_for_slow_candidates(self) -> None:
+        release = threading.Event()
+
+        def _fake_probe(name, url, **kwargs):
+            if "zread.cc" in url:
+                return {"title": "zread", "url": url, "snippet": "", "source": "zread", "published_date": ""}, ""
+            release.wait(5)
+            return None, "zread_unavailable:timeout"
+
+        started = time.monotonic()
+        try:
+            with patch("codex_search_stack.github_explorer.orchestrator._probe_index_page", side_effect=_fake_probe):
+                item, notes = _collect_zread("example-org", "example-repo", settings=types.SimpleNamespace(search_timeout_seconds=10))
+        finally:
+            release.set()
+        self.assertLess(time.monotonic() - started, 2)
+        self.assertEqual(item["url"], "https://zread.cc/example-org/example-repo")
+        self.assertEqual(notes, [])
+
+    def test_collect_zread_probes_candidates_concurrently_and_caches_negative(self) -> None:
+        # 4 个候选都在飞时 barrier 才放行；串行实现会超时。
+        barrier = threading.Barrier(4, timeout=2)
+
+        def _fake_get(url, **kwargs):
+            barrier.wait()
+            return types.SimpleNamespace(status_code=404, text="", url=url)
+
+        with tempfile.TemporaryDirectory() as tmp:
+            settings = types.SimpleNamespace(search_timeout_seconds=10, github_cache_dir=tmp)
+            with patch("codex_search_stack.github_explorer.orchestrator.requests.get", side_effect=_fake_get) as get:
+                item, notes = _collect_zread("example-org", "example-repo", settings=settings)
+                self.assertIsNone(item)
+                self.assertEqual(notes, ["zread_unavailable:not_indexed"])
+                self.assertEqual(get.call_count, 4)
+
+                _, notes = _collect_zread("example-org", "example-repo", settings=settings)
+                self.assertEqual(get.call_count, 4)
+                self.assertEqual(notes, ["zread_unavailable:not_indexed", "zread_negative_cache_hit"])
+
+                # TTL 过期后重新探测。
+                settings.policy = {"explore": {"index_probe": {"negative_ttl_seconds": 1}}}
+                with patch("codex_search_stack.github_explorer.orchestrator.time.time", return_value=time.time() + 5):
+                    barrier.reset()
+                    _collect_zread("example-org", "example-repo", settings=settings)
+                self.assertEqual(get.call_count, 8)
+
     def test_collect_external_runs_followup_for_missing_index_and_paper(self) -> None:
         calls = []
 
@@ -357,6 +476,903 @@ class GithubExplorerExternalTests(unittest.TestCase):
         self.assertTrue(any("external_followup_round:1:queries:1" == note for note in notes))
         self.assertTrue(any("external_followup_round:2:queries:1" == note for note in notes))
 
+    def test_collect_external_runs_query_wave_concurrently_in_stable_order(self) -> None:
+        # 3 个查询都在飞时 barrier 才放行；串行实现会超时。后提交的先返回，合并顺序仍按提交顺序。
+        wave = threading.Barrier(3, timeout=2)
+        delays = {"q-a": 0.05, "q-b": 0.02, "q-c": 0.0}
+
+        def _fake_search(**kwargs):
+            query = kwargs.get("query", "")
+            wave.wait()
+            time.sleep(delays[query])
+            return types.SimpleNamespace(
+                results=[
+                    SearchResult(
+                        title="example-org/example-repo %s" % query,
+                        url="https://example.com/%s" % query,
+                        snippet="example-org/example-repo",
+                        source="grok",
+                    )
+                ],
+                notes=["note:%s" % query],
+            )
+
+        queries = [{"query": name, "intent": "resource", "tag": "repo", "boost_domains": []} for name in delays]
+        policy = {"explore": {"external": {"followup_rounds": 0, "primary_sources": ["grok"], "concurrency": 3}}}
+        with patch("codex_search_stack.github_explorer.orchestrator.run_multi_source_search", side_effect=_fake_search), patch(
+            "codex_search_stack.github_explorer.orchestrator._collect_deepwiki", return_value=(None, [])
+        ), patch("codex_search_stack.github_explorer.orchestrator._collect_zread", return_value=(None, [])), patch(
+            "codex_search_stack.github_explorer.orchestrator._build_external_queries", return_value=queries
+        ):
+            external, notes, _, _ = _collect_external(
+                owner="example-org",
+                repo="example-repo",
+                settings=types.SimpleNamespace(search_timeout_seconds=30, policy=policy),
+                external_limit=3,
+                extract_top=0,
+                with_extract=False,
+            )
+
+        self.assertEqual([item["url"] for item in external], ["https://example.com/%s" % name for name in delays])
+        self.assertEqual([note for note in notes if note.startswith("note:")], ["note:q-a", "note:q-b", "note:q-c"])
+
+
+class ExternalQueryHedgeTests(unittest.TestCase):
+    def _settings(self, **hedge):
+        policy = {"explore": {"external": {"hedge": dict({"enabled": True, "after_fraction": 0.0}, **hedge)}}}
+        return types.SimpleNamespace(search_timeout_seconds=30, policy=policy)
+
+    def _run(self, settings, fake_search):
+        with patch("codex_search_stack.github_explorer.orchestrator.run_multi_source_search", side_effect=fake_search):
+            return _run_external_query(
+                query="example query",
+                query_intent="resource",
+                query_tag="repo",
+                boost_domains=[],
+                fetch_limit=8,
+                settings=settings,
+                primary_sources=["grok", "exa"],
+                model_profile="strong",
+                timeout_seconds=10,
+                fallback_source="tavily",
+            )
+
+    def _result(self, source):
+        return types.SimpleNamespace(
+            results=[SearchResult(title=source, url="https://example.com/%s" % source, snippet="", source=source)],
+            notes=["searched:%s" % source],
+        )
+
+    def test_slow_primary_loses_to_hedged_fallback(self) -> None:
+        release = threading.Event()
+
+        def _fake_search(**kwargs):
+            if kwargs["sources"] == ["tavily"]:
+                return self._result("tavily")
+            release.wait(2)
+            return self._result("grok")
+
+        rows, notes, failed = self._run(self._settings(), _fake_search)
+        release.set()
+        self.assertEqual([row.source for row in rows], ["tavily"])
+        self.assertEqual(failed, 0)
+        self.assertEqual(
+            notes,
+            [
+                "external_query_hedged:tavily:repo",
+                "searched:tavily",
+                "external_query_hedge_winner:tavily:repo",
+                "external_query_fallback_tavily:repo",
+            ],
+        )
+
+    def test_primary_empty_before_hedge_point_falls_back_serially(self) -> None:
+        calls = []
+
+        def _fake_search(**kwargs):
+            calls.append(kwargs["sources"])
+            if kwargs["sources"] == ["tavily"]:
+                return types.SimpleNamespace(results=[], notes=["tavily_empty"])
+            return types.SimpleNamespace(results=[], notes=["grok_search_failed:timeout"])
+
+        rows, notes, failed = self._run(self._settings(after_fraction=1.0), _fake_search)
+        self.assertEqual(rows, [])
+        self.assertEqual(calls, [["grok", "exa"], ["tavily"]])
+        self.assertEqual(notes, ["grok_search_failed:timeout", "tavily_empty"])
+        self.assertEqual(failed, 1)
+
+    def test_hedge_disabled_keeps_serial_order(self) -> None:
+        calls = []
+
+        def _fake_search(**kwargs):
+            calls.append(kwargs["sources"])
+            return self._result(kwargs["sources"][0])
+
+        settings = types.SimpleNamespace(search_timeout_seconds=30, policy={})
+        rows, notes, _ = self._run(settings, _fake_search)
+        self.assertEqual(calls, [["grok", "exa"]])
+        self.assertEqual([row.source for row in rows], ["grok"])
+        self.assertEqual(notes, ["searched:grok"])
+
+
+class ExternalExtractTests(unittest.TestCase):
+    def _settings(self, **extract):
+        return types.SimpleNamespace(policy={"explore": {"extract": extract}})
+
+    def _out(self, url):
+        return types.SimpleNamespace(ok=True, engine="tavily", notes=[], markdown="body of %s" % url, artifacts=None)
+
+    def test_slow_extract_does_not_block_fast_ones(self) -> None:
+        release = threading.Event()
+        barrier = threading.Barrier(2, timeout=2)
+        items = [
+            {"url": "https://mp.weixin.qq.com/s/slow"},
+            {"url": "https://example.com/a"},
+            {"url": "https://example.com/b"},
+        ]
+
+        def _fake_extract(url, **kwargs):
+            if "weixin" in url:
+                release.wait(5)
+                return self._out(url)
+            # 两个快的必须同时在跑，证明它们没有排在慢的后面串行等待。
+            barrier.wait()
+            return self._out(url)
+
+        settings = self._settings(concurrency=3, deadline_seconds=0.5)
+        with patch("codex_search_stack.github_explorer.orchestrator.run_extract_pipeline", side_effect=_fake_extract):
+            started = time.monotonic()
+            notes = _extract_external_items(items, settings)
+            elapsed = time.monotonic() - started
+        release.set()
+
+        self.assertLess(elapsed, 2)
+        self.assertEqual(notes, ["external_extract_timeout:1/3"])
+        self.assertEqual(items[0]["extract"]["notes"], ["extract_deadline_exceeded"])
+        self.assertFalse(items[0]["extract"]["ok"])
+        self.assertTrue(items[1]["extract"]["ok"])
+        self.assertTrue(items[2]["extract"]["ok"])
+
+    def test_exception_is_recorded_on_the_item(self) -> None:
+        items = [{"url": "https://example.com/a"}, {"url": "https://example.com/b"}]
+
+        def _fake_extract(url, **kwargs):
+            if url.endswith("/a"):
+                raise RuntimeError("boom")
+            return self._out(url)
+
+        with patch("codex_search_stack.github_explorer.orchestrator.run_extract_pipeline", side_effect=_fake_extract):
+            notes = _extract_external_items(items, self._settings())
+        self.assertEqual(notes, [])
+        self.assertEqual(items[0]["extract"]["notes"], ["extract_exception:boom"])
+        self.assertTrue(items[1]["extract"]["ok"])
+
+
+class _FakeGithubResponse:
+    def __init__(self, payload, status_code=200, headers=None):
+        self._payload = payload
+        self.status_code = status_code
+        self.headers = headers or {}
+        self.text = json.dumps(payload)
+
+    def json(self):
+        return self._payload
+
+    def raise_for_status(self):
+        if self.status_code >= 400:
+            raise RuntimeError("http %s" % self.status_code)
+
+
+class GithubExplorerRepoDataTests(unittest.TestCase):
+    base = "https://api.github.com/repos/example-org/example-repo"
+
+    def setUp(self) -> None:
+        github_client._RATE_STATE.clear()
+        github_client._LAST_REQUEST_AT.clear()
+
+    def _settings(self, token="", **explore_github):
+        return types.SimpleNamespace(
+            github_token=token,
+            search_timeout_seconds=5,
+            policy={"explore": {"github": explore_github}} if explore_github else {},
+        )
+
+    def _issue(self, number, comments):
+        return {
+            "number": number,
+            "title": "issue %s" % number,
+            "html_url": "https://github.com/example-org/example-repo/issues/%s" % number,
+            "comments": comments,
+            "comments_url": "%s/issues/%s/comments" % (self.base, number),
+            "author_association": "NONE",
+            "updated_at": "2026-01-0%sT00:00:00Z" % number,
+        }
+
+    def test_repo_data_calls_fan_out_concurrently(self) -> None:
+        # 4 个第一跳请求都到达后才放行，2 个评论请求也必须同时在飞；串行实现会在 barrier 上超时。
+        first_hop = threading.Barrier(4, timeout=2)
+        comments_hop = threading.Barrier(2, timeout=2)
+
+        def _fake_get(url, headers=None, params=None, timeout=None):
+            if url == self.base:
+                first_hop.wait()
+                return _FakeGithubResponse({"full_name": "example-org/example-repo"})
+            if url == self.base + "/readme":
+                first_hop.wait()
+                return _FakeGithubResponse({}, status_code=404)
+            if url == self.base + "/issues":
+                first_hop.wait()
+                return _FakeGithubResponse([self._issue(1, 2), {"number": 9, "pull_request": {}}, self._issue(2, 3)])
+            if url == self.base + "/commits":
+                first_hop.wait()
+                return _FakeGithubResponse([{"sha": "abcdef123", "commit": {"message": "fix"}, "html_url": "u"}])
+            comments_hop.wait()
+            if url.endswith("/issues/2/comments"):
+                return _FakeGithubResponse([{"author_association": "MEMBER", "user": {"login": "maint"}}])
+            return _FakeGithubResponse([], status_code=502)
+
+        with patch("codex_search_stack.github_explorer.github_client.requests.get", side_effect=_fake_get):
+            repo_info, issues, commits, notes = _collect_repo_data(
+                "example-org", "example-repo", self._settings(), issues_limit=5, commits_limit=5
+            )
+
+        self.assertEqual(repo_info["full_name"], "example-org/example-repo")
+        self.assertEqual([item["number"] for item in issues], [2, 1])
+        self.assertEqual(issues[0]["maintainer_logins"], ["maint"])
+        self.assertEqual(commits[0]["sha"], "abcdef1")
+        self.assertEqual(
+            notes,
+            [
+                "readme_api_skipped:http_404",
+                "issue_comments_skipped:#1:http_502",
+                "github_cache:hits=0,misses=6,stored=0",
+                "github_quota:unknown,rate_limited=0,paced=0",
+            ],
+        )
+
+    def test_repo_failure_short_circuits(self) -> None:
+        def _fake_get(url, headers=None, params=None, timeout=None):
+            if url == self.base:
+                return _FakeGithubResponse({}, status_code=404)
+            return _FakeGithubResponse([])
+
+        with patch("codex_search_stack.github_explorer.github_client.requests.get", side_effect=_fake_get):
+            repo_info, issues, commits, notes = _collect_repo_data(
+                "example-org", "example-repo", self._settings(concurrency=1), issues_limit=5, commits_limit=5
+            )
+        self.assertEqual((repo_info, issues, commits), ({}, [], []))
+        self.assertEqual(notes[0], "repo_api_failed:http 404")
+
+    def _graphql_payload(self):
+        return {
+            "data": {
+                "repository": {
+                    "nameWithOwner": "example-org/example-repo",
+                    "url": "https://github.com/example-org/example-repo",
+                    "description": "demo",
+                    "primaryLanguage": {"name": "Python"},
+                    "repositoryTopics": {"nodes": [{"topic": {"name": "search"}}]},
+                    "licenseInfo": {"spdxId": "MIT"},
+                    "stargazerCount": 10,
+                    "forkCount": 2,
+                    "updatedAt": "2026-01-02T00:00:00Z",
+                    "pushedAt": "2026-01-02T00:00:00Z",
+                    "openIssueCount": {"totalCount": 3},
+                    "openPullRequestCount": {"totalCount": 1},
+                    "readmeMd": None,
+                    "readmeRst": {"text": "Example README"},
+                    "topIssues": {
+                        "nodes": [
+                            {
+                                "number": 1,
+                                "title": "quiet issue",
+                                "url": "https://github.com/example-org/example-repo/issues/1",
+                                "body": "",
+                                "state": "OPEN",
+                                "updatedAt": "2026-01-01T00:00:00Z",
+                                "authorAssociation": "NONE",
+                                "author": {"login": "user"},
+                                "comments": {"totalCount": 0, "nodes": []},
+                            },
+                            {
+                                "number": 2,
+                                "title": "memory leak",
+                                "url": "https://github.com/example-org/example-repo/issues/2",
+                                "body": "",
+                                "state": "OPEN",
+                                "updatedAt": "2026-01-02T00:00:00Z",
+                                "authorAssociation": "NONE",
+                                "author": {"login": "user"},
+                                "comments": {
+                                    "totalCount": 4,
+                                    "nodes": [{"authorAssociation": "OWNER", "author": {"login": "maint"}}],
+                                },
+                            },
+                        ]
+                    },
+                    "defaultBranchRef": {
+                        "target": {
+                            "history": {
+                                "nodes": [
+                                    {"oid": "abcdef123", "message": "fix", "committedDate": "2026-01-02T00:00:00Z", "url": "u"}
+                                ]
+                            }
+                        }
+                    },
+                }
+            }
+        }
+
+    def test_graphql_backend_fetches_repo_data_in_one_request(self) -> None:
+        with patch(
+            "codex_search_stack.github_explorer.github_client.requests.post",
+            return_value=_FakeGithubResponse(self._graphql_payload()),
+        ) as post, patch("codex_search_stack.github_explorer.github_client.requests.get") as get:
+            repo_info, issues, commits, notes = _collect_repo_data(
+                "example-org", "example-repo", self._settings(token="t"), issues_limit=5, commits_limit=5
+            )
+        post.assert_called_once()
+        get.assert_not_called()
+        self.assertEqual(post.call_args.kwargs["json"]["variables"]["issues"], 5)
+        self.assertEqual(repo_info["full_name"], "example-org/example-repo")
+        self.assertEqual(repo_info["license"]["spdx_id"], "MIT")
+        self.assertEqual(repo_info["open_issues_count"], 4)
+        self.assertEqual(repo_info["readme_excerpt"], "Example README")
+        self.assertEqual([item["number"] for item in issues], [2, 1])
+        self.assertEqual(issues[0]["maintainer_logins"], ["maint"])
+        self.assertEqual(issues[0]["state"], "open")
+        self.assertEqual(commits[0]["sha"], "abcdef1")
+        self.assertEqual(
+            notes,
+            [
+                "github_backend:graphql",
+                "github_cache:hits=0,misses=0,stored=0",
+                "github_quota:unknown,rate_limited=0,paced=0",
+            ],
+        )
+
+    def test_graphql_request_goes_through_client_rate_limiting(self) -> None:
+        reset = int(time.time()) + 3600
+        limited = _FakeGithubResponse({}, status_code=403, headers={"Retry-After": "0"})
+        ok = _FakeGithubResponse(
+            self._graphql_payload(),
+            headers={
+                "X-RateLimit-Limit": "5000",
+                "X-RateLimit-Remaining": "4321",
+                "X-RateLimit-Reset": str(reset),
+                "X-RateLimit-Resource": "graphql",
+            },
+        )
+        with patch(
+            "codex_search_stack.github_explorer.github_client.requests.post", side_effect=[limited, ok]
+        ) as post, patch("codex_search_stack.github_explorer.github_client.time.sleep"):
+            _, _, _, notes = _collect_repo_data(
+                "example-org", "example-repo", self._settings(token="t"), issues_limit=5, commits_limit=5
+            )
+        self.assertEqual(post.call_count, 2)
+        self.assertEqual(post.call_args.kwargs["headers"]["Authorization"], "Bearer t")
+        self.assertEqual(notes[-1], "github_quota:remaining=4321/5000,reset=%s,rate_limited=1,paced=0" % reset)
+        self.assertEqual(github_client.rate_limit_snapshot("t")["graphql"]["remaining"], 4321)
+
+    def test_graphql_failure_and_missing_token_fall_back_to_rest(self) -> None:
+        def _fake_get(url, headers=None, params=None, timeout=None):
+            if url == self.base:
+                return _FakeGithubResponse({"full_name": "example-org/example-repo"})
+            return _FakeGithubResponse([], status_code=200 if not url.endswith("/readme") else 404)
+
+        failing = _FakeGithubResponse({"errors": [{"message": "Could not resolve to a Repository"}], "data": {"repository": None}})
+        with patch("codex_search_stack.github_explorer.github_client.requests.post", return_value=failing), patch(
+            "codex_search_stack.github_explorer.github_client.requests.get", side_effect=_fake_get
+        ):
+            repo_info, _, _, notes = _collect_repo_data(
+                "example-org", "example-repo", self._settings(token="t"), issues_limit=5, commits_limit=5
+            )
+        self.assertEqual(repo_info["full_name"], "example-org/example-repo")
+        self.assertEqual(notes[0], "github_graphql_fallback:Could not resolve to a Repository")
+
+        with patch("codex_search_stack.github_explorer.github_client.requests.post") as post, patch(
+            "codex_search_stack.github_explorer.github_client.requests.get", side_effect=_fake_get
+        ):
+            _, _, _, notes = _collect_repo_data(
+                "example-org", "example-repo", self._settings(backend="graphql"), issues_limit=5, commits_limit=5
+            )
+        post.assert_not_called()
+        self.assertEqual(notes[0], "github_graphql_requires_token")
+
+    def test_etag_cache_replays_304_from_disk(self) -> None:
+        seen_headers = []
+
+        def _fake_get(url, headers=None, params=None, timeout=None):
+            seen_headers.append(dict(headers or {}))
+            if "If-None-Match" in (headers or {}):
+                return _FakeGithubResponse(None, status_code=304)
+            return _FakeGithubResponse({"full_name": "example-org/example-repo"}, headers={"ETag": 'W/"abc"'})
+
+        with tempfile.TemporaryDirectory() as tmp:
+            with patch("codex_search_stack.github_explorer.github_client.requests.get", side_effect=_fake_get):
+                first = GitHubClient("t", timeout=5, cache_dir=tmp)
+                self.assertEqual(first.get(self.base).json()["full_name"], "example-org/example-repo")
+                second = GitHubClient("t", timeout=5, cache_dir=tmp)
+                cached = second.get(self.base)
+                other_identity = GitHubClient("other", timeout=5, cache_dir=tmp)
+                other_identity.get(self.base)
+
+        self.assertNotIn("If-None-Match", seen_headers[0])
+        self.assertEqual(seen_headers[1]["If-None-Match"], 'W/"abc"')
+        self.assertNotIn("If-None-Match", seen_headers[2])
+        self.assertEqual(cached.status_code, 200)
+        self.assertEqual(cached.json()["full_name"], "example-org/example-repo")
+        self.assertEqual(first.stats_note(), "github_cache:hits=0,misses=1,stored=1")
+        self.assertEqual(second.stats_note(), "github_cache:hits=1,misses=0,stored=0")
+
+    def test_etag_cache_evicts_least_recently_used_entries(self) -> None:
+        def _fake_get(url, headers=None, params=None, timeout=None):
+            if "If-None-Match" in (headers or {}):
+                return _FakeGithubResponse(None, status_code=304)
+            return _FakeGithubResponse({"url": url}, headers={"ETag": '"%s"' % url})
+
+        urls = [self.base + "/a", self.base + "/b", self.base + "/c"]
+        with tempfile.TemporaryDirectory() as tmp:
+            probe = Path(tmp) / "index-probe" / "keep.json"
+            probe.parent.mkdir()
+            probe.write_text("{}", encoding="utf-8")
+            with patch("codex_search_stack.github_explorer.github_client.requests.get", side_effect=_fake_get), patch(
+                "codex_search_stack.github_explorer.github_client._ENFORCE_INTERVAL_SECONDS", 0.0
+            ):
+                client = GitHubClient("t", timeout=5, cache_dir=tmp, cache_max_entries=2)
+                client.get(urls[0])
+                client.get(urls[1])
+                # 让 a、b 看起来是很久以前写入的，再命中 a：b 成为最久未用的条目。
+                for url in urls[:2]:
+                    os.utime(str(client._cache_path(url, None)), (1, 1))
+                client.get(urls[0])
+                client.get(urls[2])
+                kept = [url for url in urls if client._cache_path(url, None).exists()]
+            self.assertTrue(probe.exists())
+
+        self.assertEqual(kept, [urls[0], urls[2]])
+
+    def test_low_quota_skips_optional_calls_and_reports_state(self) -> None:
+        reset = int(time.time()) + 3600
+        quota_headers = {"X-RateLimit-Limit": "5000", "X-RateLimit-Remaining": "100", "X-RateLimit-Reset": str(reset)}
+        requested = []
+
+        def _fake_get(url, headers=None, params=None, timeout=None):
+            requested.append(url)
+            if url == self.base:
+                return _FakeGithubResponse({"full_name": "example-org/example-repo"}, headers=quota_headers)
+            if url == self.base + "/issues":
+                return _FakeGithubResponse([self._issue(1, 2), self._issue(2, 3)], headers=quota_headers)
+            if url == self.base + "/readme":
+                return _FakeGithubResponse({}, status_code=404, headers=quota_headers)
+            return _FakeGithubResponse([], headers=quota_headers)
+
+        settings = self._settings(token="quota-token", concurrency=1)
+        with patch("codex_search_stack.github_explorer.github_client.requests.get", side_effect=_fake_get):
+            _, issues, _, notes = _collect_repo_data("example-org", "example-repo", settings, issues_limit=5, commits_limit=5)
+            self.assertFalse(any("/comments" in url for url in requested))
+            self.assertIn("github_quota_skip:comments:2", notes)
+            self.assertIn("github_quota:remaining=100/5000,reset=%s,rate_limited=0,paced=0" % reset, notes)
+            self.assertEqual(len(issues), 2)
+            # 同一 token 的下一次 explore 在第一跳之前就知道配额见底，README 直接跳过。
+            requested.clear()
+            _, _, _, notes = _collect_repo_data("example-org", "example-repo", settings, issues_limit=5, commits_limit=5)
+        self.assertNotIn(self.base + "/readme", requested)
+        self.assertIn("github_quota_skip:readme", notes)
+        self.assertEqual(github_client.rate_limit_snapshot("quota-token")["core"]["remaining"], 100)
+
+    def test_secondary_rate_limit_is_retried_after_wait(self) -> None:
+        responses = [
+            _FakeGithubResponse({"message": "secondary rate limit"}, status_code=403, headers={"Retry-After": "0"}),
+            _FakeGithubResponse({"full_name": "example-org/example-repo"}),
+        ]
+        with patch("codex_search_stack.github_explorer.github_client.requests.get", side_effect=responses) as get:
+            client = GitHubClient("t", timeout=5)
+            response = client.get(self.base)
+        self.assertEqual(get.call_count, 2)
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(client.stats["rate_limited"], 1)
+
+        too_long = _FakeGithubResponse({}, status_code=429, headers={"Retry-After": "600"})
+        with patch("codex_search_stack.github_explorer.github_client.requests.get", return_value=too_long) as get:
+            response = GitHubClient("t", timeout=5).get(self.base)
+        self.assertEqual(get.call_count, 1)
+        self.assertEqual(response.status_code, 429)
+
+    def test_token_pool_spreads_by_quota_and_fails_over(self) -> None:
+        reset = str(int(time.time()) + 3600)
+        remaining = {"primary": 40, "pool-a": 3000}
+        used = []
+
+        def _fake_get(url, headers=None, params=None, timeout=None):
+            token = headers["Authorization"].split(" ", 1)[1]
+            used.append(token)
+            if token == "primary" and remaining["primary"] == 0:
+                quota = {"X-RateLimit-Limit": "5000", "X-RateLimit-Remaining": "0", "X-RateLimit-Reset": reset}
+                return _FakeGithubResponse({"message": "API rate limit exceeded"}, status_code=403, headers=quota)
+            remaining[token] -= 1
+            quota = {"X-RateLimit-Limit": "5000", "X-RateLimit-Remaining": str(remaining[token]), "X-RateLimit-Reset": reset}
+            return _FakeGithubResponse({"full_name": "example-org/example-repo"}, headers=quota)
+
+        with patch("codex_search_stack.github_explorer.github_client.requests.get", side_effect=_fake_get):
+            client = GitHubClient("primary", timeout=5, pool_tokens=["pool-a", "primary"])
+            self.assertEqual(client.tokens, ["primary", "pool-a"])
+            # 两个 token 都未知时主 token 优先；之后按已知余量选 pool-a。
+            client.get(self.base)
+            client.get(self.base)
+            self.assertEqual(used, ["primary", "pool-a"])
+            self.assertEqual(client.optional_budget(), 39 + 2999 - 100)
+
+            # pool-a 余量变少后回到主 token；主 token 耗尽时立即切换，不等待 reset。
+            github_client.record_rate_limit(
+                "pool-a", {"X-RateLimit-Limit": "5000", "X-RateLimit-Remaining": "1", "X-RateLimit-Reset": reset}
+            )
+            remaining["pool-a"] = 1
+            remaining["primary"] = 0
+            used.clear()
+            response = client.get(self.base)
+        self.assertEqual(used, ["primary", "pool-a"])
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(client.stats["failover"], 1)
+        self.assertEqual(
+            client.quota_note(),
+            "github_quota:remaining=0/10000,reset=%s,rate_limited=1,paced=0,tokens=2,failover=1" % reset,
+        )
+        snapshot = github_client.rate_limit_snapshot(client.tokens)
+        self.assertEqual(snapshot["core"]["tokens"], 2)
+        self.assertEqual(snapshot["core"]["remaining"], 0)
+
+    def test_collect_repo_data_reads_github_rows_from_key_pool(self) -> None:
+        with tempfile.TemporaryDirectory() as tmp:
+            pool_file = Path(tmp) / "pool.csv"
+            pool_file.write_text("github,,pool-token,10\n", encoding="utf-8")
+            settings = self._settings(backend="rest", concurrency=1)
+            settings.key_pool_file = str(pool_file)
+            settings.key_pool_enabled = True
+            seen = []
+
+            def _fake_get(url, headers=None, params=None, timeout=None):
+                seen.append(headers.get("Authorization"))
+                if url == self.base:
+                    return _FakeGithubResponse({"full_name": "example-org/example-repo"})
+                return _FakeGithubResponse([], status_code=200 if not url.endswith("/readme") else 404)
+
+            with patch("codex_search_stack.github_explorer.github_client.requests.get", side_effect=_fake_get):
+                repo_info, _, _, notes = _collect_repo_data(
+                    "example-org", "example-repo", settings, issues_limit=5, commits_limit=5
+                )
+        self.assertEqual(repo_info["full_name"], "example-org/example-repo")
+        self.assertTrue(seen and all(value == "Bearer pool-token" for value in seen))
+        self.assertNotIn("github_token_pool:1", notes)
+
+
+
+class ExploreCacheTests(unittest.TestCase):
+    base = "https://api.github.com/repos/example-org/example-repo"
+
+    def setUp(self) -> None:
+        github_client._RATE_STATE.clear()
+        github_client._LAST_REQUEST_AT.clear()
+
+    def _run(self, settings, pushed_at, requested, searches):
+        def _fake_get(url, headers=None, params=None, timeout=None):
+            requested.append(url)
+            if url == self.base:
+                return _FakeGithubResponse(
+                    {"full_name": "example-org/example-repo", "pushed_at": pushed_at, "updated_at": pushed_at, "stargazers_count": len(requested)}
+                )
+            if url == self.base + "/readme":
+                return _FakeGithubResponse({}, status_code=404)
+            if url == self.base + "/commits":
+                return _FakeGithubResponse([{"sha": "abcdef123", "commit": {"message": "fix"}, "html_url": "u"}])
+            return _FakeGithubResponse([])
+
+        def _fake_search(**kwargs):
+            searches.append(kwargs.get("query", ""))
+            return types.SimpleNamespace(
+                results=[
+                    SearchResult(
+                        title="example-org/example-repo guide",
+                        url="https://example.com/%s" % len(searches),
+                        snippet="example-org/example-repo",
+                        source="grok",
+                    )
+                ],
+                notes=[],
+            )
+
+        deepwiki = {"title": "DeepWiki", "url": "https://deepwiki.com/example-org/example-repo", "snippet": "", "source": "deepwiki", "published_date": ""}
+        with patch("codex_search_stack.github_explorer.github_client.requests.get", side_effect=_fake_get), patch(
+            "codex_search_stack.github_explorer.orchestrator.run_multi_source_search", side_effect=_fake_search
+        ), patch(
+            "codex_search_stack.github_explorer.orchestrator._collect_deepwiki", return_value=(deepwiki, [])
+        ) as probe, patch(
+            "codex_search_stack.github_explorer.orchestrator._collect_zread",
+            return_value=(None, ["zread_unavailable:not_indexed"]),
+        ):
+            report = run_github_explorer(
+                "example-org/example-repo", settings, external_limit=3, extract_top=0, with_extract=False
+            )
+        return report, probe.call_count
+
+    def test_unchanged_repo_is_served_from_phase_cache_with_one_api_call(self) -> None:
+        with tempfile.TemporaryDirectory() as tmp:
+            settings = types.SimpleNamespace(
+                github_token="",
+                search_timeout_seconds=5,
+                policy={"explore": {"external": {"followup_rounds": 0}}},
+                explore_cache_dir=tmp,
+            )
+            requested, searches = [], []
+            first, probes = self._run(settings, "2026-01-02T00:00:00Z", requested, searches)
+            self.assertEqual(probes, 1)
+            self.assertGreater(len(searches), 0)
+
+            requested.clear()
+            searches.clear()
+            second, probes = self._run(settings, "2026-01-02T00:00:00Z", requested, searches)
+            self.assertEqual(requested, [self.base])
+            self.assertEqual((searches, probes), ([], 0))
+            self.assertEqual(second["external"], first["external"])
+            self.assertEqual(second["commits"], first["commits"])
+            self.assertEqual(second["repo"]["stars"], 1)
+            self.assertIn("explore_cache_hit:repo_data", second["notes"])
+            self.assertIn("explore_cache_hit:external", second["notes"])
+
+            # 新的 push 让 repo 数据失效，外部信号仍在自身 TTL 内复用。
+            requested.clear()
+            third, _ = self._run(settings, "2026-02-01T00:00:00Z", requested, searches)
+            self.assertIn(self.base + "/commits", requested)
+            self.assertIn("explore_cache_stale:repo_data", third["notes"])
+            self.assertIn("explore_cache_hit:external", third["notes"])
+            self.assertEqual(searches, [])
+
+
+class IncrementalExploreTests(unittest.TestCase):
+    base = "https://api.github.com/repos/example-org/example-repo"
+
+    def setUp(self) -> None:
+        github_client._RATE_STATE.clear()
+        github_client._LAST_REQUEST_AT.clear()
+
+    def _settings(self):
+        return types.SimpleNamespace(
+            github_token="",
+            search_timeout_seconds=5,
+            policy={"explore": {"external": {"followup_rounds": 0}}},
+        )
+
+    def _previous(self):
+        return {
+            "ok": True,
+            "generated_at": "2026-01-10T00:00:00Z",
+            "repo": {
+                "full_name": "example-org/example-repo",
+                "stars": 10,
+                "pushed_at": "2026-01-09T00:00:00Z",
+                "readme_excerpt": "cached readme",
+            },
+            "issues": [
+                {"number": 1, "title": "kept", "comments": 8, "updated_at": "2026-01-01T00:00:00Z", "change": "new"},
+                {"number": 2, "title": "busy", "comments": 5, "updated_at": "2026-01-02T00:00:00Z"},
+                {"number": 3, "title": "fixed", "comments": 4, "updated_at": "2026-01-03T00:00:00Z"},
+            ],
+            "commits": [{"sha": "aaaaaaa", "message": "old", "date": "2026-01-08T00:00:00Z", "url": "u1"}],
+            "external": [
+                {
+                    "title": "example-org/example-repo guide",
+                    "url": "https://example.com/known",
+                    "extract": {"ok": True, "engine": "tavily", "notes": [], "summary": "cached summary"},
+                }
+            ],
+        }
+
+    def _issue(self, number, comments, state="open"):
+        return {
+            "number": number,
+            "title": "issue %s" % number,
+            "html_url": "https://github.com/example-org/example-repo/issues/%s" % number,
+            "comments": comments,
+            "state": state,
+            "author_association": "NONE",
+            "updated_at": "2026-01-11T00:00:0%sZ" % number,
+        }
+
+    def test_incremental_run_fetches_since_and_marks_changes(self) -> None:
+        requested = []
+
+        def _fake_get(url, headers=None, params=None, timeout=None):
+            requested.append((url, dict(params or {})))
+            if url == self.base:
+                return _FakeGithubResponse(
+                    {"full_name": "example-org/example-repo", "pushed_at": "2026-01-09T00:00:00Z", "stargazers_count": 12}
+                )
+            if url == self.base + "/issues" and (params or {}).get("state") == "open":
+                kept = dict(self._issue(1, 8), updated_at="2026-01-01T00:00:00Z")
+                return _FakeGithubResponse([kept, self._issue(2, 6), self._issue(4, 1)])
+            if url == self.base + "/issues":
+                return _FakeGithubResponse(
+                    [self._issue(2, 6), self._issue(3, 4, state="closed"), self._issue(4, 1), {"number": 9, "pull_request": {}}]
+                )
+            if url == self.base + "/commits":
+                return _FakeGithubResponse([{"sha": "bbbbbbb123", "commit": {"message": "new"}, "html_url": "u2"}])
+            return _FakeGithubResponse([], status_code=404)
+
+        def _fake_search(**kwargs):
+            return types.SimpleNamespace(
+                results=[
+                    SearchResult(
+                        title="example-org/example-repo guide",
+                        url="https://example.com/known",
+                        snippet="example-org/example-repo",
+                        source="grok",
+                    ),
+                    SearchResult(
+                        title="example-org/example-repo review",
+                        url="https://example.com/fresh",
+                        snippet="example-org/example-repo",
+                        source="grok",
+                    ),
+                ],
+                notes=[],
+            )
+
+        extracted = []
+
+        def _fake_extract(url, **kwargs):
+            extracted.append(url)
+            return types.SimpleNamespace(ok=True, engine="tavily", notes=[], markdown="fresh body", artifacts=None)
+
+        with patch("codex_search_stack.github_explorer.github_client.requests.get", side_effect=_fake_get), patch(
+            "codex_search_stack.github_explorer.orchestrator.run_multi_source_search", side_effect=_fake_search
+        ), patch(
+            "codex_search_stack.github_explorer.orchestrator.run_extract_pipeline", side_effect=_fake_extract
+        ), patch(
+            "codex_search_stack.github_explorer.orchestrator._collect_deepwiki", return_value=(None, [])
+        ), patch(
+            "codex_search_stack.github_explorer.orchestrator._collect_zread", return_value=(None, [])
+        ):
+            report = run_github_explorer(
+                "example-org/example-repo",
+                self._settings(),
+                issues_limit=3,
+                commits_limit=3,
+                external_limit=2,
+                extract_top=2,
+                previous_report=self._previous(),
+            )
+
+        urls = [url for url, _ in requested]
+        self.assertNotIn(self.base + "/readme", urls)
+        issue_params = [params for url, params in requested if url == self.base + "/issues"]
+        self.assertEqual(issue_params[0]["since"], "2026-01-10T00:00:00Z")
+        self.assertEqual(dict(requested)[self.base + "/commits"]["since"], "2026-01-10T00:00:00Z")
+        self.assertEqual(extracted, ["https://example.com/fresh"])
+
+        self.assertEqual(report["repo"]["readme_excerpt"], "cached readme")
+        self.assertEqual(sorted(issue["number"] for issue in report["issues"]), [1, 2, 4])
+        self.assertEqual([commit["sha"] for commit in report["commits"]], ["bbbbbbb", "aaaaaaa"])
+        changes = report["incremental"]["changes"]
+        self.assertEqual(changes["repo"]["stars"], {"before": 10, "after": 12})
+        self.assertEqual(changes["new_commits"], ["bbbbbbb"])
+        self.assertEqual((changes["new_issues"], changes["updated_issues"], changes["closed_issues"]), ([4], [2], [3]))
+        self.assertEqual(changes["new_external"], ["https://example.com/fresh"])
+        issues = {issue["number"]: issue for issue in report["issues"]}
+        self.assertNotIn("change", issues[1])
+        self.assertEqual(issues[2]["change"], "updated")
+        known = [item for item in report["external"] if item["url"] == "https://example.com/known"][0]
+        self.assertEqual(known["extract"]["summary"], "cached summary")
+        self.assertIn("explore_incremental:since=2026-01-10T00:00:00Z", report["notes"])
+        self.assertIn("external_extract_reused:1", report["notes"])
+        markdown = render_markdown(report)
+        self.assertIn("**🔄 增量变化**", markdown)
+        self.assertIn("关闭 Issue: #3", markdown)
+
+    def test_incremental_refills_top_issues_when_a_selected_issue_closes(self) -> None:
+        def _fake_get(url, headers=None, params=None, timeout=None):
+            if url == self.base:
+                return _FakeGithubResponse({"full_name": "example-org/example-repo", "pushed_at": "2026-01-09T00:00:00Z"})
+            if url == self.base + "/issues" and (params or {}).get("state") == "open":
+                # #7 一直没更新、上次排在前 N 之外，#3 关闭后应当补位。
+                quiet = dict(self._issue(7, 3), updated_at="2025-12-01T00:00:00Z")
+                return _FakeGithubResponse([self._issue(1, 8), self._issue(2, 5), quiet])
+            if url == self.base + "/issues":
+                return _FakeGithubResponse([self._issue(3, 4, state="closed")])
+            return _FakeGithubResponse([], status_code=404)
+
+        previous = self._previous()
+        previous["issues"][1]["quality_score"] = 99
+        with patch("codex_search_stack.github_explorer.github_client.requests.get", side_effect=_fake_get):
+            repo_info, issues, commits, notes, closed = _collect_repo_data_incremental(
+                "example-org", "example-repo", self._settings(), previous, "2026-01-10T00:00:00Z", 3, 3
+            )
+
+        self.assertEqual(closed, [3])
+        self.assertEqual(sorted(issue["number"] for issue in issues), [1, 2, 7])
+        self.assertIn("explore_incremental_rerank:closed=1", notes)
+        busy = [issue for issue in issues if issue["number"] == 2][0]
+        self.assertLess(busy["quality_score"], 99)
+
+    def test_incremental_comment_fetches_respect_optional_budget(self) -> None:
+        reset = str(int(time.time()) + 3600)
+        quota_headers = {"X-RateLimit-Limit": "5000", "X-RateLimit-Remaining": "100", "X-RateLimit-Reset": reset}
+        requested = []
+
+        def _with_comments(item):
+            return dict(item, comments_url="%s/issues/%s/comments" % (self.base, item["number"]))
+
+        def _fake_get(url, headers=None, params=None, timeout=None):
+            requested.append(url)
+            if url == self.base:
+                return _FakeGithubResponse(
+                    {"full_name": "example-org/example-repo", "pushed_at": "2026-01-09T00:00:00Z"}, headers=quota_headers
+                )
+            if url == self.base + "/issues":
+                return _FakeGithubResponse(
+                    [_with_comments(self._issue(2, 6)), _with_comments(self._issue(4, 1))], headers=quota_headers
+                )
+            return _FakeGithubResponse([], headers=quota_headers)
+
+        previous = self._previous()
+        previous["issues"][1].update(maintainer_comment_count=2, maintainer_logins=["owner"])
+        settings = self._settings()
+        settings.github_token = "incremental-quota-token"
+        with patch("codex_search_stack.github_explorer.github_client.requests.get", side_effect=_fake_get):
+            _, issues, _, notes, _ = _collect_repo_data_incremental(
+                "example-org", "example-repo", settings, previous, "2026-01-10T00:00:00Z", 4, 3
+            )
+
+        self.assertFalse(any("/comments" in url for url in requested))
+        self.assertIn("github_quota_skip:comments:2", notes)
+        issues = {issue["number"]: issue for issue in issues}
+        # 已知 issue 沿用上次的维护者统计，新 issue 只按作者身份计。
+        self.assertEqual(issues[2]["comments"], 6)
+        self.assertEqual((issues[2]["maintainer_comment_count"], issues[2]["maintainer_logins"]), (2, ["owner"]))
+        self.assertEqual(issues[4]["maintainer_comment_count"], 0)
+
+    def test_incremental_run_reuses_fresh_external_phase_cache(self) -> None:
+        with tempfile.TemporaryDirectory() as tmp:
+            settings = self._settings()
+            settings.explore_cache_dir = tmp
+            cached = {
+                "external": [{"title": "cached", "url": "https://example.com/cached"}],
+                "notes": ["external_search_profile:cached"],
+                "competitors": [],
+                "index_coverage": {},
+            }
+            options = {"external_limit": 2, "extract_top": 2, "with_extract": True}
+            ExploreCache(Path(tmp)).put("external", "example-org", "example-repo", options, cached)
+            with patch(
+                "codex_search_stack.github_explorer.orchestrator._collect_repo_data_incremental",
+                return_value=({"full_name": "example-org/example-repo"}, [], [], [], []),
+            ), patch("codex_search_stack.github_explorer.orchestrator._collect_external") as collect:
+                report = run_github_explorer(
+                    "example-org/example-repo",
+                    settings,
+                    external_limit=2,
+                    extract_top=2,
+                    previous_report=self._previous(),
+                )
+
+        collect.assert_not_called()
+        self.assertIn("explore_cache_hit:external", report["notes"])
+        self.assertEqual([item["url"] for item in report["external"]], ["https://example.com/cached"])
+        self.assertEqual(report["incremental"]["changes"]["new_external"], ["https://example.com/cached"])
+
+    def test_missing_previous_report_falls_back_to_full_run(self) -> None:
+        with patch(
+            "codex_search_stack.github_explorer.orchestrator.find_latest_report", return_value=(None, "")
+        ), patch(
+            "codex_search_stack.github_explorer.orchestrator._collect_repo_data_cached", return_value=({}, [], [], [])
+        ) as full, patch(
+            "codex_search_stack.github_explorer.orchestrator._collect_external", return_value=([], [], [], {})
+        ):
+            report = run_github_explorer("example-org/example-repo", self._settings(), incremental=True)
+        self.assertEqual(full.call_count, 1)
+        self.assertNotIn("incremental", report)
+        self.assertIn("explore_incremental_skipped:no_previous_report", report["notes"])
+        self.assertTrue(report["generated_at"].endswith("Z"))
+
 
 if __name__ == "__main__":
     unittest.main()
@@ -68,6 +68,26 @@ class KeyPoolTests(unittest.TestCase):
         self.assertEqual(rows[0].source, "primary")
         self.assertEqual(rows[1].key, "sk-other")
 
+    def test_github_rows_default_to_api_url(self) -> None:
+        with tempfile.TemporaryDirectory() as tmp:
+            pool_file = Path(tmp) / "pool.csv"
+            pool_file.write_text(
+                "grok,https://grok.example,sk-grok,10\n"
+                "github,,ghp-low,5\n"
+                "github,https://api.github.com,ghp-high,50\n",
+                encoding="utf-8",
+            )
+            rows = build_service_candidates(
+                service="github",
+                primary_url="https://api.github.com",
+                primary_key="ghp-primary",
+                pool_file=str(pool_file),
+                pool_enabled=True,
+            )
+
+        self.assertEqual([row.key for row in rows], ["ghp-primary", "ghp-high", "ghp-low"])
+        self.assertTrue(all(row.url == "https://api.github.com" for row in rows))
+
 
 if __name__ == "__main__":
     unittest.main()
@@ -1,6 +1,9 @@
+import asyncio
 import importlib
 import json
 import sys
+import threading
+import time
 import types
 import unittest
 from pathlib import Path
@@ -31,6 +34,18 @@ class _FakeFastMCP:
         self.ran = True
 
 
+class _FakeContext:
+    def __init__(self) -> None:
+        self.progress = []
+        self.messages = []
+
+    async def report_progress(self, progress, total=None) -> None:
+        self.progress.append((progress, total))
+
+    async def info(self, message: str) -> None:
+        self.messages.append(message)
+
+
 class _DummyResult:
     def __init__(self, payload):
         self._payload = payload
@@ -55,6 +70,7 @@ class MCPServerTests(unittest.TestCase):
         server_module = types.ModuleType("mcp.server")
         fastmcp_module = types.ModuleType("mcp.server.fastmcp")
         fastmcp_module.FastMCP = _FakeFastMCP
+        fastmcp_module.Context = _FakeContext
         server_module.fastmcp = fastmcp_module
         mcp_module.server = server_module
         sys.modules["mcp"] = mcp_module
@@ -73,7 +89,10 @@ class MCPServerTests(unittest.TestCase):
 
     def test_tools_registered(self) -> None:
         self.assertEqual(self.mcp.name, "codex-search")
-        self.assertEqual(set(self.mcp.tools.keys()), {"search", "extract", "explore", "research", "get_config_info"})
+        self.assertEqual(
+            set(self.mcp.tools.keys()),
+            {"search", "extract", "explore", "research", "research_stream", "get_config_info"},
+        )
 
     def test_search_tool_success(self) -> None:
         payload = {"mode": "deep", "query": "q", "count": 1, "results": [{"title": "x", "url": "https://a"}]}
@@ -183,6 +202,54 @@ class MCPServerTests(unittest.TestCase):
         self.assertEqual(data["error"]["code"], "invalid_arguments")
         self.assertIn("requires freshness", data["error"]["message"])
 
+    def test_research_stream_tool_reports_progress(self) -> None:
+        events = [
+            {"event": "search_done", "round": 1, "new_result_count": 2},
+            {"event": "round_summary", "round": 1, "summary": {"round": 1}},
+            {"event": "result", "payload": {"ok": True, "round_count": 1}},
+        ]
+        ctx = _FakeContext()
+        with patch.object(self.mod, "load_settings", return_value=object()), patch.object(
+            self.mod, "iter_research_events", return_value=iter(events)
+        ):
+            raw = asyncio.run(self.mcp.tools["research_stream"](query="q", ctx=ctx, max_rounds=2))
+        data = json.loads(raw)
+        self.assertEqual(data["round_count"], 1)
+        self.assertEqual(ctx.progress, [(1, 2)])
+        self.assertEqual([json.loads(item)["event"] for item in ctx.messages], ["search_done", "round_summary"])
+
+    def test_research_stream_closes_generator_when_cancelled(self) -> None:
+        closed = threading.Event()
+        started = threading.Event()
+
+        def _events(**kwargs):
+            try:
+                yield {"event": "search_done", "round": 1}
+                started.set()
+                time.sleep(0.2)
+                yield {"event": "round_summary", "round": 1, "summary": {}}
+            finally:
+                closed.set()
+
+        async def _cancel_midway():
+            task = asyncio.ensure_future(self.mcp.tools["research_stream"](query="q", ctx=_FakeContext(), max_rounds=2))
+            while not started.is_set():
+                await asyncio.sleep(0.01)
+            task.cancel()
+            with self.assertRaises(asyncio.CancelledError):
+                await task
+
+        with patch.object(self.mod, "load_settings", return_value=object()), patch.object(
+            self.mod, "iter_research_events", side_effect=_events
+        ):
+            asyncio.run(_cancel_midway())
+        self.assertTrue(closed.wait(2))
+
+    def test_research_stream_tool_validation_error(self) -> None:
+        raw = asyncio.run(self.mcp.tools["research_stream"](query="q", ctx=_FakeContext(), session_id="../x"))
+        data = json.loads(raw)
+        self.assertEqual(data["error"]["code"], "invalid_arguments")
+
 
 if __name__ == "__main__":
     unittest.main()
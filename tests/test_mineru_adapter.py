@@ -75,6 +75,55 @@ class MineruAdapterTests(unittest.TestCase):
         self.assertEqual(captured["env"]["CODEX_WORKSPACE"], "/tmp/codex-workspace")
         self.assertEqual(captured["env"]["MINERU_WORKSPACE"], "/tmp/codex-workspace")
 
+    def test_cache_index_hit_skips_subprocess(self) -> None:
+        with tempfile.TemporaryDirectory() as tmp:
+            wrapper = Path(tmp) / "mineru_parse_documents.py"
+            wrapper.write_text("#!/usr/bin/env python3\n", encoding="utf-8")
+            workspace = Path(tmp) / "workspace"
+            out_dir = workspace / "mineru-cache" / "cache-2"
+            out_dir.mkdir(parents=True)
+            markdown_path = out_dir / "full.md"
+            markdown_path.write_text("y" * 50, encoding="utf-8")
+
+            def fake_run(cmd, capture_output, text, env):
+                payload = {
+                    "items": [
+                        {
+                            "markdown": "y" * 50,
+                            "markdown_path": str(markdown_path),
+                            "out_dir": str(out_dir),
+                            "task_id": "task-2",
+                            "cache_key": "cache-2",
+                        }
+                    ]
+                }
+                return SimpleNamespace(returncode=0, stdout=json.dumps(payload))
+
+            with patch("codex_search_stack.extract.mineru_adapter.subprocess.run", side_effect=fake_run) as mocked:
+                first = run_mineru_wrapper(
+                    url="https://example.com/b",
+                    wrapper_path=str(wrapper),
+                    token="token-1",
+                    api_base=None,
+                    workspace=str(workspace),
+                )
+                second = run_mineru_wrapper(
+                    url="https://example.com/b/",
+                    wrapper_path=str(wrapper),
+                    token="token-1",
+                    api_base=None,
+                    workspace=str(workspace),
+                    max_chars=10,
+                )
+
+        self.assertTrue(first.ok)
+        self.assertTrue(second.ok)
+        self.assertEqual(mocked.call_count, 1)
+        self.assertEqual(second.artifacts.cache_key, "cache-2")
+        self.assertTrue(second.markdown.startswith("y" * 10))
+        self.assertIn("[TRUNCATED]", second.markdown)
+        self.assertTrue(any(note.startswith("mineru_cache_index_hit:") for note in second.notes))
+
 
 if __name__ == "__main__":
     unittest.main()
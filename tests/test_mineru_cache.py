@@ -0,0 +1,107 @@
+import json
+import os
+import tempfile
+import time
+import unittest
+from pathlib import Path
+import sys
+
+ROOT = Path(__file__).resolve().parents[1]
+SRC = ROOT / "src"
+if str(SRC) not in sys.path:
+    sys.path.insert(0, str(SRC))
+
+from codex_search_stack.extract.mineru_cache import MineruCacheIndex, cache_options
+
+
+def _make_entry(root: Path, key: str, size: int) -> Path:
+    out_dir = root / key
+    out_dir.mkdir(parents=True, exist_ok=True)
+    (out_dir / "full.md").write_text("x" * size, encoding="utf-8")
+    return out_dir
+
+
+class MineruCacheIndexTests(unittest.TestCase):
+    def test_record_and_lookup_by_canonical_url(self) -> None:
+        with tempfile.TemporaryDirectory() as tmp:
+            index = MineruCacheIndex(Path(tmp) / "mineru-cache")
+            out_dir = _make_entry(index.root, "key-a", 100)
+            options = cache_options("MinerU-HTML", "ch")
+            self.assertTrue(
+                index.record(
+                    url="https://example.com/post/?utm_source=x",
+                    options=options,
+                    cache_key="key-a",
+                    out_dir=str(out_dir),
+                    markdown_path=str(out_dir / "full.md"),
+                )
+            )
+            hit = index.lookup("https://example.com/post", options)
+            self.assertIsNotNone(hit)
+            self.assertEqual(hit["cache_key"], "key-a")
+            self.assertIsNone(index.lookup("https://example.com/post", cache_options("vlm", "ch")))
+            self.assertEqual(index.stats()["total_bytes"], 100)
+
+    def test_record_ignores_dirs_outside_cache_root(self) -> None:
+        with tempfile.TemporaryDirectory() as tmp:
+            index = MineruCacheIndex(Path(tmp) / "mineru-cache")
+            foreign = Path(tmp) / "elsewhere"
+            foreign.mkdir()
+            ok = index.record(
+                url="https://example.com/a",
+                options=cache_options("MinerU-HTML", "ch"),
+                cache_key="key-x",
+                out_dir=str(foreign),
+            )
+            self.assertFalse(ok)
+            self.assertFalse(index.exists())
+
+    def test_prune_evicts_lru_until_under_cap(self) -> None:
+        with tempfile.TemporaryDirectory() as tmp:
+            index = MineruCacheIndex(Path(tmp) / "mineru-cache")
+            options = cache_options("MinerU-HTML", "ch")
+            for idx, key in enumerate(["old", "mid", "new"]):
+                out_dir = _make_entry(index.root, key, 100)
+                index.record(
+                    url="https://example.com/%s" % key,
+                    options=options,
+                    cache_key=key,
+                    out_dir=str(out_dir),
+                    markdown_path=str(out_dir / "full.md"),
+                )
+                time.sleep(0.01 if idx < 2 else 0)
+            index.lookup("https://example.com/old", options)
+
+            preview = index.prune(max_bytes=150, dry_run=True)
+            self.assertEqual(preview["evicted_keys"], ["mid", "new"])
+            self.assertTrue((index.root / "mid").exists())
+
+            out = index.prune(max_bytes=150)
+            self.assertEqual(out["evicted"], 2)
+            self.assertEqual(out["entries"], 1)
+            self.assertTrue((index.root / "old").exists())
+            self.assertFalse((index.root / "mid").exists())
+
+    def test_prune_syncs_legacy_meta_and_expires_by_age(self) -> None:
+        with tempfile.TemporaryDirectory() as tmp:
+            index = MineruCacheIndex(Path(tmp) / "mineru-cache")
+            out_dir = _make_entry(index.root, "legacy", 50)
+            meta = {
+                "source": "https://example.com/legacy",
+                "model_version": "MinerU-HTML",
+                "language": "ch",
+                "enable_ocr": False,
+                "markdown_path": str(out_dir / "full.md"),
+                "fetched_at": int(time.time()) - 40 * 86400,
+            }
+            (out_dir / "meta.json").write_text(json.dumps(meta), encoding="utf-8")
+            os.utime(out_dir / "meta.json", None)
+
+            out = index.prune(max_age_seconds=30 * 86400)
+            self.assertEqual(out["synced"], 1)
+            self.assertEqual(out["evicted_keys"], ["legacy"])
+            self.assertFalse(out_dir.exists())
+
+
+if __name__ == "__main__":
+    unittest.main()
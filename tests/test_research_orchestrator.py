@@ -1,4 +1,8 @@
+import os
 import sys
+import tempfile
+import threading
+import time
 import types
 import unittest
 from pathlib import Path
@@ -10,13 +14,20 @@ if str(SRC) not in sys.path:
     sys.path.insert(0, str(SRC))
 
 from codex_search_stack.contracts import SearchResult
-from codex_search_stack.research import run_research_loop
+from codex_search_stack.extract.content_store import ContentStore
+from codex_search_stack.research import iter_research_events, run_research_loop
 
 
 class ResearchOrchestratorTests(unittest.TestCase):
+    def setUp(self) -> None:
+        sessions = tempfile.TemporaryDirectory()
+        self.addCleanup(sessions.cleanup)
+        self.session_dir = sessions.name
+
     def _settings(self):
         return types.SimpleNamespace(
             search_timeout_seconds=30,
+            research_session_dir=self.session_dir,
             decision_trace_enabled=True,
             decision_trace_persist=False,
             decision_trace_jsonl_path="./.runtime/decision-trace/decision_trace.jsonl",
@@ -142,6 +153,548 @@ class ResearchOrchestratorTests(unittest.TestCase):
         self.assertTrue(payload["results"][0]["extract"].get("ok"))
         self.assertEqual(payload["results"][0]["extract"].get("engine"), "mineru")
 
+    def _two_rows(self):
+        return [
+            SearchResult(title="a", url="https://a.example.com/1", snippet="a", source="tavily", score=0.6),
+            SearchResult(title="b", url="https://b.example.com/2", snippet="b", source="exa", score=0.5),
+        ]
+
+    def test_round_extractions_run_concurrently(self) -> None:
+        barrier = threading.Barrier(2, timeout=2)
+
+        def _fake_extract(**kwargs):
+            # 两个提取都进入后才放行：串行执行会在 barrier 上超时。
+            barrier.wait()
+            return types.SimpleNamespace(ok=True, engine="tavily_extract", notes=[], markdown=kwargs["url"])
+
+        with patch(
+            "codex_search_stack.research.orchestrator.run_multi_source_search",
+            return_value=types.SimpleNamespace(results=self._two_rows(), notes=[]),
+        ), patch("codex_search_stack.research.orchestrator.run_extract_pipeline", side_effect=_fake_extract):
+            payload = run_research_loop(
+                query="parallel",
+                settings=self._settings(),
+                max_rounds=1,
+                extract_per_round=2,
+                extract_concurrency=2,
+            )
+        extracts = payload["rounds"][0]["extracts"]
+        self.assertEqual([item["url"] for item in extracts], ["https://a.example.com/1", "https://b.example.com/2"])
+        self.assertTrue(all(item["ok"] for item in extracts))
+
+    def test_round_extract_deadline_returns_partial_results(self) -> None:
+        release = threading.Event()
+
+        def _fake_extract(**kwargs):
+            if "b.example.com" in kwargs["url"]:
+                release.wait(2)
+            return types.SimpleNamespace(ok=True, engine="tavily_extract", notes=[], markdown="done")
+
+        try:
+            with patch(
+                "codex_search_stack.research.orchestrator.run_multi_source_search",
+                return_value=types.SimpleNamespace(results=self._two_rows(), notes=[]),
+            ), patch("codex_search_stack.research.orchestrator.run_extract_pipeline", side_effect=_fake_extract):
+                payload = run_research_loop(
+                    query="deadline",
+                    settings=self._settings(),
+                    max_rounds=1,
+                    extract_per_round=2,
+                    extract_concurrency=2,
+                    extract_round_timeout_seconds=0.2,
+                )
+        finally:
+            release.set()
+        round_info = payload["rounds"][0]
+        self.assertTrue(round_info["extracts"][0]["ok"])
+        self.assertEqual(round_info["extracts"][1]["notes"], ["extract_deadline_exceeded"])
+        self.assertIn("extract_round_deadline:1/2", round_info["notes"])
+        decisions = [event["decision"] for event in payload["decision_trace"]["events"]]
+        self.assertIn("extract_deadline_hit", decisions)
+        by_url = {item["url"]: item["extract"] for item in payload["results"]}
+        self.assertEqual(by_url["https://b.example.com/2"], {})
+        # 单轮抽取超时来自 extract_round_timeout_seconds 而不是全局截止时间，不算 deadline 截断。
+        self.assertNotEqual(payload["stop_reason"], "deadline")
+
+    def _run_three_rounds(self, pipeline_rounds: bool, extract_hook=None):
+        calls = []
+
+        def _fake_search(**kwargs):
+            calls.append(kwargs["query"])
+            idx = len(calls)
+            return types.SimpleNamespace(
+                results=[
+                    SearchResult(
+                        title="r%s" % idx,
+                        url="https://r%s.example.com/post" % idx,
+                        snippet="s",
+                        source="exa",
+                        score=0.1 * idx,
+                    )
+                ],
+                notes=["search_%s" % idx],
+            )
+
+        def _fake_extract(**kwargs):
+            if extract_hook is not None:
+                extract_hook(kwargs["url"], calls)
+            return types.SimpleNamespace(ok=True, engine="tavily_extract", notes=["ex"], markdown=kwargs["url"])
+
+        with patch("codex_search_stack.research.orchestrator.run_multi_source_search", side_effect=_fake_search), patch(
+            "codex_search_stack.research.orchestrator.run_extract_pipeline", side_effect=_fake_extract
+        ):
+            payload = run_research_loop(
+                query="pipeline demo",
+                settings=self._settings(),
+                intent="exploratory",
+                max_rounds=3,
+                extract_per_round=1,
+                pipeline_rounds=pipeline_rounds,
+                followup_branches=1,
+            )
+        return payload, calls
+
+    def test_pipelined_rounds_prefetch_next_search_during_extract(self) -> None:
+        overlapped = []
+
+        def _hook(url, calls):
+            if "r1.example.com" in url:
+                # 第 2 轮搜索应在第 1 轮抽取期间被预取。
+                deadline = time.time() + 2
+                while len(calls) < 2 and time.time() < deadline:
+                    time.sleep(0.01)
+                overlapped.append(len(calls) >= 2)
+
+        payload, calls = self._run_three_rounds(True, _hook)
+        self.assertEqual(overlapped, [True])
+        self.assertEqual(len(calls), 3)
+        self.assertEqual(payload["round_count"], 3)
+
+    def test_pipelined_rounds_output_matches_serial(self) -> None:
+        serial, serial_calls = self._run_three_rounds(False)
+        pipelined, pipelined_calls = self._run_three_rounds(True)
+        self.assertEqual(serial_calls, pipelined_calls)
+        for key in ("rounds", "results", "notes", "stop_reason", "round_count"):
+            self.assertEqual(serial[key], pipelined[key])
+        self.assertEqual(serial["decision_trace"]["events"], pipelined["decision_trace"]["events"])
+
+    def test_event_stream_reports_each_round_before_result(self) -> None:
+        def _fake_search(**kwargs):
+            return types.SimpleNamespace(
+                results=[SearchResult(title="t", url="https://%s.example.com/p" % len(kwargs["query"]), snippet="s", source="exa", score=0.3)],
+                notes=[],
+            )
+
+        fake_extract = types.SimpleNamespace(ok=True, engine="tavily_extract", notes=[], markdown="body")
+        with patch("codex_search_stack.research.orchestrator.run_multi_source_search", side_effect=_fake_search), patch(
+            "codex_search_stack.research.orchestrator.run_extract_pipeline", return_value=fake_extract
+        ):
+            events = list(
+                iter_research_events(
+                    query="stream demo",
+                    settings=self._settings(),
+                    intent="exploratory",
+                    max_rounds=2,
+                    extract_per_round=1,
+                    followup_branches=1,
+                )
+            )
+        kinds = [(event["event"], event.get("round")) for event in events]
+        self.assertEqual(
+            kinds,
+            [
+                ("search_done", 1),
+                ("extract_done", 1),
+                ("round_summary", 1),
+                ("search_done", 2),
+                ("extract_done", 2),
+                ("round_summary", 2),
+                ("result", None),
+            ],
+        )
+        self.assertEqual(events[0]["new_result_count"], 1)
+        self.assertEqual(events[1]["extracts"][0]["engine"], "tavily_extract")
+        payload = events[-1]["payload"]
+        self.assertEqual(payload["round_count"], 2)
+        self.assertEqual(events[5]["summary"], payload["rounds"][-1])
+
+    def test_followup_branches_run_as_one_concurrent_round(self) -> None:
+        barrier = threading.Barrier(2, timeout=2)
+        calls = []
+        lock = threading.Lock()
+
+        def _fake_search(**kwargs):
+            query = kwargs["query"]
+            with lock:
+                calls.append(query)
+            if query == "demo paper":
+                return types.SimpleNamespace(
+                    results=[SearchResult(title="blog", url="https://blog.example.com/a", snippet="s", source="exa", score=0.3)],
+                    notes=["root"],
+                )
+            # 两个分支同时在途才放行，串行执行会在 barrier 上超时。
+            barrier.wait()
+            host = "arxiv.org" if "arxiv" in query else "docs.example.org"
+            return types.SimpleNamespace(
+                results=[SearchResult(title=query, url="https://%s/x" % host, snippet="s", source="tavily", score=0.5)],
+                notes=["branch:%s" % host],
+            )
+
+        with patch("codex_search_stack.research.orchestrator.run_multi_source_search", side_effect=_fake_search):
+            payload = run_research_loop(
+                query="demo paper",
+                settings=self._settings(),
+                intent="exploratory",
+                max_rounds=2,
+                extract_per_round=0,
+                followup_branches=2,
+            )
+
+        first, second = payload["rounds"]
+        self.assertEqual(
+            first["followup_queries"],
+            ["demo paper official docs tutorial examples", "demo paper arxiv paper pdf"],
+        )
+        self.assertEqual(second["queries"], first["followup_queries"])
+        self.assertEqual(second["result_count"], 2)
+        self.assertEqual(second["notes"], ["branch:docs.example.org", "branch:arxiv.org"])
+        urls = [item["url"] for item in payload["results"]]
+        self.assertIn("https://arxiv.org/x", urls)
+        self.assertIn("https://docs.example.org/x", urls)
+        started = [e for e in payload["decision_trace"]["events"] if e["decision"] == "search_started"]
+        self.assertEqual(started[1]["metadata"]["branch_count"], "2")
+
+    def test_session_checkpoint_resumes_after_interruption(self) -> None:
+        calls = []
+        served = []
+        extracted = []
+        fail_on = {"call": 2}
+
+        def _fake_search(**kwargs):
+            calls.append(kwargs["query"])
+            if len(calls) == fail_on["call"]:
+                raise RuntimeError("client disconnected")
+            served.append(kwargs["query"])
+            idx = len(served)
+            return types.SimpleNamespace(
+                results=[SearchResult(title="r%s" % idx, url="https://r%s.example.com/p" % idx, snippet="s", source="exa", score=0.2)],
+                notes=[],
+            )
+
+        def _fake_extract(**kwargs):
+            extracted.append(kwargs["url"])
+            return types.SimpleNamespace(ok=True, engine="tavily_extract", notes=[], markdown="body")
+
+        with tempfile.TemporaryDirectory() as tmp:
+            settings = self._settings()
+            settings.research_session_dir = tmp
+            kwargs = dict(
+                query="resume demo",
+                settings=settings,
+                intent="exploratory",
+                max_rounds=3,
+                extract_per_round=1,
+                followup_branches=1,
+                session_id="sess-1",
+            )
+            with patch("codex_search_stack.research.orchestrator.run_multi_source_search", side_effect=_fake_search), patch(
+                "codex_search_stack.research.orchestrator.run_extract_pipeline", side_effect=_fake_extract
+            ):
+                with self.assertRaises(RuntimeError):
+                    run_research_loop(**kwargs)
+                self.assertTrue((Path(tmp) / "sess-1.json").exists())
+                fail_on["call"] = -1
+                calls.clear()
+                payload = run_research_loop(**kwargs)
+
+            self.assertFalse((Path(tmp) / "sess-1.json").exists())
+            self.assertEqual(payload["resumed_rounds"], 1)
+            self.assertEqual(payload["round_count"], 3)
+            self.assertEqual(len(calls), 2)
+            self.assertEqual(extracted.count("https://r1.example.com/p"), 1)
+            self.assertIn("research_session_resumed:1", payload["notes"])
+            decisions = [event["decision"] for event in payload["decision_trace"]["events"]]
+            self.assertEqual(decisions.count("request_received"), 1)
+            self.assertIn("session_resumed", decisions)
+
+    def test_no_session_id_skips_checkpoints(self) -> None:
+        rows = [SearchResult(title="r", url="https://r.example.com/p", snippet="s", source="exa", score=0.2)]
+        with patch(
+            "codex_search_stack.research.orchestrator.run_multi_source_search",
+            return_value=types.SimpleNamespace(results=rows, notes=[]),
+        ), patch("codex_search_stack.research.orchestrator.save_research_session") as save, patch(
+            "codex_search_stack.research.orchestrator.prune_research_sessions"
+        ) as prune:
+            payload = run_research_loop(query="plain", settings=self._settings(), max_rounds=2, extract_per_round=0)
+        save.assert_not_called()
+        prune.assert_not_called()
+        self.assertNotIn("session_id", payload)
+
+    def test_auto_session_generates_and_checkpoints_an_id(self) -> None:
+        rows = [SearchResult(title="r", url="https://r.example.com/p", snippet="s", source="exa", score=0.2)]
+        with tempfile.TemporaryDirectory() as tmp:
+            settings = self._settings()
+            settings.research_session_dir = tmp
+            settings.policy = {"research": {"auto_session": True}}
+            checkpointed = []
+            with patch(
+                "codex_search_stack.research.orchestrator.run_multi_source_search",
+                return_value=types.SimpleNamespace(results=rows, notes=[]),
+            ):
+                for event in iter_research_events(
+                    query="auto session", settings=settings, intent="exploratory", max_rounds=2, extract_per_round=0
+                ):
+                    if event["event"] == "round_summary":
+                        checkpointed.append((Path(tmp) / ("%s.json" % event["session_id"])).exists())
+                    if event["event"] == "result":
+                        payload = event["payload"]
+
+            self.assertTrue(checkpointed)
+            self.assertTrue(all(checkpointed))
+            self.assertTrue(payload["session_id"].startswith("r-"))
+            self.assertEqual(payload["resumed_rounds"], 0)
+            self.assertEqual(list(Path(tmp).iterdir()), [])
+
+    def test_stale_session_checkpoints_are_pruned(self) -> None:
+        with tempfile.TemporaryDirectory() as tmp:
+            settings = self._settings()
+            settings.research_session_dir = tmp
+            settings.policy = {"research": {"session_max_age_hours": 1}}
+            stale = Path(tmp) / "old.json"
+            fresh = Path(tmp) / "recent.json"
+            stale.write_text("{}", encoding="utf-8")
+            fresh.write_text("{}", encoding="utf-8")
+            old = time.time() - 7200
+            os.utime(str(stale), (old, old))
+            with patch(
+                "codex_search_stack.research.orchestrator.run_multi_source_search",
+                return_value=types.SimpleNamespace(results=[], notes=[]),
+            ):
+                run_research_loop(query="prune", settings=settings, max_rounds=1, extract_per_round=0, session_id="s-1")
+
+            self.assertFalse(stale.exists())
+            self.assertTrue(fresh.exists())
+
+    def test_run_research_loop_rejects_unknown_arguments(self) -> None:
+        with self.assertRaises(TypeError):
+            run_research_loop(query="x", settings=self._settings(), max_round=2)
+
+    def test_invalid_session_id_is_rejected(self) -> None:
+        with self.assertRaises(ValueError):
+            run_research_loop(query="x", settings=self._settings(), session_id="../etc")
+
+    def _deadline_settings(self, **deadline):
+        settings = self._settings()
+        policy = {"min_round_ms": 100, "reserve_ms": 0}
+        policy.update(deadline)
+        settings.policy = {"research": {"deadline": policy}}
+        return settings
+
+    def test_deadline_abandons_slow_search_and_stops(self) -> None:
+        calls = []
+
+        def _slow_search(**kwargs):
+            calls.append(kwargs["budget_max_latency_ms"])
+            time.sleep(0.25)
+            idx = len(calls)
+            return types.SimpleNamespace(
+                results=[SearchResult(title="r", url="https://r%s.example.com/p" % idx, snippet="s", source="exa", score=0.2)],
+                notes=[],
+            )
+
+        started = time.perf_counter()
+        with patch("codex_search_stack.research.orchestrator.run_multi_source_search", side_effect=_slow_search):
+            payload = run_research_loop(
+                query="deadline demo",
+                settings=self._deadline_settings(),
+                intent="exploratory",
+                max_rounds=3,
+                extract_per_round=0,
+                followup_branches=1,
+                pipeline_rounds=False,
+                deadline_ms=400,
+            )
+        elapsed = time.perf_counter() - started
+        self.assertLess(elapsed, 0.8)
+        self.assertEqual(payload["stop_reason"], "deadline")
+        self.assertEqual(payload["round_count"], 1)
+        self.assertEqual(payload["deadline_ms"], 400)
+        self.assertIn("research_deadline_search_abandoned:2", payload["notes"])
+        self.assertLessEqual(calls[0], 400)
+        decisions = [event["decision"] for event in payload["decision_trace"]["events"]]
+        self.assertIn("deadline_reached", decisions)
+
+    def test_deadline_below_min_round_still_runs_first_round(self) -> None:
+        calls = []
+
+        def _fake_search(**kwargs):
+            calls.append(kwargs["budget_max_latency_ms"])
+            return types.SimpleNamespace(
+                results=[SearchResult(title="r", url="https://r%s.example.com/p" % len(calls), snippet="s", source="exa", score=0.2)],
+                notes=[],
+            )
+
+        settings = self._settings()
+        settings.policy = {}
+        with patch("codex_search_stack.research.orchestrator.run_multi_source_search", side_effect=_fake_search):
+            payload = run_research_loop(
+                query="short deadline",
+                settings=settings,
+                max_rounds=3,
+                extract_per_round=0,
+                deadline_ms=1000,
+            )
+        # 默认 min_round_ms=3000：首轮照跑且搜索预算不超过截止时间，之后的轮次因余量不足停止。
+        self.assertEqual(payload["round_count"], 1)
+        self.assertEqual(payload["stop_reason"], "deadline")
+        self.assertEqual(len(payload["results"]), 1)
+        self.assertLessEqual(calls[0], 1000)
+
+    def _run_ranked_extract(self, rows, settings=None, host_stats=None, extract_per_round=1):
+        extracted = []
+
+        def _fake_extract(**kwargs):
+            extracted.append(kwargs["url"])
+            return types.SimpleNamespace(ok=True, engine="tavily_extract", notes=[], markdown="body")
+
+        with patch(
+            "codex_search_stack.research.orchestrator.run_multi_source_search",
+            return_value=types.SimpleNamespace(results=rows, notes=[]),
+        ), patch("codex_search_stack.research.orchestrator.run_extract_pipeline", side_effect=_fake_extract), patch(
+            "codex_search_stack.research.orchestrator.load_extract_host_stats", return_value=host_stats or {}
+        ):
+            payload = run_research_loop(
+                query="ranking demo",
+                settings=settings or self._settings(),
+                max_rounds=1,
+                extract_per_round=extract_per_round,
+            )
+        return payload, extracted
+
+    def test_extract_targets_prefer_official_over_earlier_forum_page(self) -> None:
+        rows = [
+            SearchResult(title="forum", url="https://forum.example.com/t/1", snippet="s", source="exa", score=0.5),
+            SearchResult(title="docs", url="https://docs.example.org/guide", snippet="s", source="exa", score=0.45),
+        ]
+        payload, extracted = self._run_ranked_extract(rows)
+        self.assertEqual(extracted, ["https://docs.example.org/guide"])
+        decisions = [event["decision"] for event in payload["decision_trace"]["events"]]
+        self.assertIn("extract_targets_ranked", decisions)
+
+    def test_extract_targets_avoid_hosts_that_fail_to_extract(self) -> None:
+        rows = [
+            SearchResult(title="a", url="https://flaky.example.com/p", snippet="s", source="exa", score=0.5),
+            SearchResult(title="b", url="https://steady.example.com/p", snippet="s", source="exa", score=0.5),
+        ]
+        slot = {"attempts": 6, "successes": 0, "not_usable": 6, "latency_samples": 6, "latency_ms_total": 120000}
+        _, extracted = self._run_ranked_extract(rows, host_stats={"flaky.example.com": {"tavily": slot, "mineru": slot}})
+        self.assertEqual(extracted, ["https://steady.example.com/p"])
+
+    def test_cached_content_skips_extract_budget(self) -> None:
+        rows = self._two_rows()
+        with tempfile.TemporaryDirectory() as tmp:
+            settings = self._settings()
+            settings.mineru_workspace = tmp
+            ContentStore.for_workspace(tmp).put("https://a.example.com/1", "# Cached\n\ncached body text", engine="mineru")
+            payload, extracted = self._run_ranked_extract(rows, settings=settings)
+        self.assertEqual(extracted, ["https://b.example.com/2"])
+        extracts = payload["rounds"][0]["extracts"]
+        self.assertEqual(extracts[0]["notes"], ["content_cache_hit"])
+        self.assertEqual(extracts[0]["engine"], "mineru")
+        self.assertIn("cached body text", extracts[0]["summary"])
+        self.assertIn("extract_cache_hit:1", payload["rounds"][0]["notes"])
+
+    def test_stale_cached_content_is_extracted_again(self) -> None:
+        rows = self._two_rows()
+        with tempfile.TemporaryDirectory() as tmp:
+            settings = self._settings()
+            settings.mineru_workspace = tmp
+            settings.policy = {"research": {"content_cache_max_age_seconds": 3600}}
+            store = ContentStore.for_workspace(tmp)
+            with patch("codex_search_stack.extract.content_store.time.time", return_value=time.time() - 7200):
+                store.put("https://a.example.com/1", "# Cached\n\nold body", engine="mineru")
+            payload, extracted = self._run_ranked_extract(rows, settings=settings, extract_per_round=2)
+        self.assertEqual(sorted(extracted), ["https://a.example.com/1", "https://b.example.com/2"])
+        self.assertNotIn("extract_cache_hit:1", payload["rounds"][0]["notes"])
+
+    def _run_low_yield(self, score, policy=None, url_per_call=False):
+        calls = []
+
+        def _fake_search(**kwargs):
+            calls.append(kwargs["query"])
+            url = "https://r%s.example.com/p" % len(calls) if url_per_call else "https://same.example.com/p"
+            return types.SimpleNamespace(
+                results=[SearchResult(title="t", url=url, snippet="s", source="exa", score=score)],
+                notes=[],
+            )
+
+        settings = self._settings()
+        if policy is not None:
+            settings.policy = {"research": {"stop": policy}}
+        with patch("codex_search_stack.research.orchestrator.run_multi_source_search", side_effect=_fake_search):
+            payload = run_research_loop(
+                query="yield paper demo",
+                settings=settings,
+                intent="exploratory",
+                max_rounds=4,
+                extract_per_round=0,
+                followup_branches=1,
+            )
+        return payload, calls
+
+    def test_stops_when_round_adds_nothing_new(self) -> None:
+        payload, calls = self._run_low_yield(0.6)
+        self.assertEqual(payload["stop_reason"], "diminishing_returns")
+        self.assertEqual(payload["round_count"], 2)
+        self.assertEqual(len(calls), 2)
+        self.assertEqual(payload["rounds"][1]["useful_new_count"], 0)
+        self.assertIn("research_diminishing_returns:2", payload["notes"])
+        decisions = [event["decision"] for event in payload["decision_trace"]["events"]]
+        self.assertIn("diminishing_returns", decisions)
+
+    def test_low_score_rounds_stop_but_unscored_rows_do_not(self) -> None:
+        # 每轮都有新 URL，但分数低于门槛且均值不再上升（patience=2 时第 3 轮停止）。
+        low, _ = self._run_low_yield(0.05, policy={"min_score": 0.3, "min_mean_gain": 0.05, "patience": 2}, url_per_call=True)
+        self.assertEqual(low["stop_reason"], "diminishing_returns")
+        self.assertEqual(low["round_count"], 3)
+        unscored, calls = self._run_low_yield(None, policy={"min_score": 0.3}, url_per_call=True)
+        self.assertEqual(unscored["stop_reason"], "no_more_gap")
+        self.assertEqual(len(calls), 4)
+
+    def test_diminishing_returns_can_be_disabled(self) -> None:
+        payload, calls = self._run_low_yield(0.6, policy={"enabled": False})
+        self.assertEqual(payload["stop_reason"], "no_more_gap")
+        self.assertEqual(len(calls), 4)
+
+    def test_deadline_shrinks_round_extracts(self) -> None:
+        rows = [
+            SearchResult(title=str(i), url="https://e%s.example.com/p" % i, snippet="s", source="exa", score=0.5)
+            for i in range(3)
+        ]
+        extracted = []
+
+        def _fake_extract(**kwargs):
+            extracted.append(kwargs["url"])
+            return types.SimpleNamespace(ok=True, engine="tavily_extract", notes=[], markdown="body")
+
+        with patch(
+            "codex_search_stack.research.orchestrator.run_multi_source_search",
+            return_value=types.SimpleNamespace(results=rows, notes=[]),
+        ), patch("codex_search_stack.research.orchestrator.run_extract_pipeline", side_effect=_fake_extract):
+            payload = run_research_loop(
+                query="shrink demo",
+                settings=self._deadline_settings(extract_estimate_ms=1500),
+                max_rounds=1,
+                extract_per_round=3,
+                extract_concurrency=1,
+                deadline_ms=2000,
+            )
+        self.assertEqual(extracted, ["https://e0.example.com/p"])
+        self.assertIn("extract_shrunk_deadline:1/3", payload["rounds"][0]["notes"])
+        # 轮数用完才结束，但抽取被截止时间砍掉了：调用方要能看出结果是被截断的。
+        self.assertEqual(payload["stop_reason"], "deadline")
+        self.assertIn("research_deadline_truncated:max_rounds_reached", payload["notes"])
+
 
 if __name__ == "__main__":
     unittest.main()
@@ -72,7 +72,7 @@ class ValidatorTests(unittest.TestCase):
         self.assertEqual(err, "max_chars must be between 500 and 200000")
 
         err, _ = validate_extract_protocol(url="https://example.com", max_chars=3000, strategy="unknown")
-        self.assertEqual(err, "strategy must be one of auto/tavily_first/mineru_first/tavily_only/mineru_only")
+        self.assertEqual(err, "strategy must be one of auto/tavily_first/mineru_first/tavily_only/mineru_only/race")
 
     def test_validate_extract_protocol_valid_and_normalized(self) -> None:
         err, detail = validate_extract_protocol(